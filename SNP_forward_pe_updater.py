@@ -1,16 +1,25 @@
 import requests
-from bs4 import BeautifulSoup
 import pandas as pd
 from datetime import datetime
 import os
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.chrome.service import Service
-from webdriver_manager.chrome import ChromeDriverManager
-from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support import expected_conditions as EC
-from bs4 import BeautifulSoup
+
+from page_fetcher import get_page_fetcher
+
+def parse_macromicro_last_value(soup):
+    '''
+    macromicro 시리즈 페이지 사이드바의 최신값 → {'date': ..., 'forward_pe': float}
+    '''
+    latest_val = soup.select_one("div.sidebar-sec.chart-stat-lastrows span.val")
+    date = soup.select_one("div.sidebar-sec.chart-stat-lastrows .date-label")
+
+    if latest_val and date:
+        return {
+            "date": date.text.strip(),
+            "forward_pe": float(latest_val.text.strip())
+        }
+    raise ValueError("📛 Forward PE 값을 찾을 수 없습니다.")
+
 
 class forwardpe_updater:
 
@@ -30,45 +39,17 @@ class forwardpe_updater:
     def get_forward_pe(self):
             url = 'https://en.macromicro.me/series/20052/sp500-forward-pe-ratio'
 
-            options = Options()
-            # GitHub Actions 환경에서는 headless 모드를 반드시 활성화해야 합니다.
-            options.add_argument("--headless")
-            options.add_argument("--no-sandbox")
-            options.add_argument("--disable-gpu")
- 
-
-            # 수정: webdriver-manager를 사용해 자동으로 드라이버 관리
-            service = Service(ChromeDriverManager().install())
-            driver = webdriver.Chrome(service=service, options=options)
-            driver.get(url)
-
-
             try:
-                # ✅ 해당 요소가 로드될 때까지 대기 (최대 10초)
-                WebDriverWait(driver, 30).until(
-                    EC.presence_of_element_located((By.CSS_SELECTOR, "div.sidebar-sec.chart-stat-lastrows span.val"))
+                # ✅ HTTP 우선 → 실패 시 브라우저 풀에서 해당 요소가 로드될 때까지 대기
+                return get_page_fetcher().fetch(
+                    url,
+                    parse_macromicro_last_value,
+                    wait_for=(By.CSS_SELECTOR, "div.sidebar-sec.chart-stat-lastrows span.val"),
+                    name="sp500_forward_pe",
                 )
             except Exception as e:
-                driver.quit()
                 raise RuntimeError(f"📛 페이지 로딩 중 Forward PE 데이터를 찾지 못했습니다. 에러: {e}")
 
-            soup = BeautifulSoup(driver.page_source, 'html.parser')
-            driver.quit()
-
-            latest_val = soup.select_one("div.sidebar-sec.chart-stat-lastrows span.val")
-            date = soup.select_one("div.sidebar-sec.chart-stat-lastrows .date-label")
-
-            if latest_val and date:
-                date_text = date.text.strip()
-                pe_val = float(latest_val.text.strip())
-                df = pd.DataFrame([{"date": date_text, "forward_pe": pe_val}])
-                return {
-                    "date": date_text,
-                    "forward_pe": pe_val
-                }
-            else:
-                raise ValueError("📛 Forward PE 값을 찾을 수 없습니다.")
-
     def update_forward_pe_csv(self):
 
         try:
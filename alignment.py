@@ -0,0 +1,117 @@
+'''
+일별 시계열 → 월/주/분기 정렬 공용 모듈
+- 라벨은 항상 구간 시작일 (월: 1일, 주: 월요일, 분기: 분기 첫날)
+- 집계: first (구간 첫 관측값, 예: 월초 첫 거래일 종가) / last / mean
+- 같은 시리즈·같은 버전(내용 해시)이면 프로세스 안에서 한 번만 계산
+'''
+import threading
+from collections import OrderedDict
+
+import pandas as pd
+
+
+ALIGN_FREQS = ("M", "W", "Q")
+ALIGN_AGGREGATIONS = ("first", "last", "mean")
+
+
+def period_start(dates, freq="M"):
+    '''
+    날짜 → 해당 구간 시작일 (예: 2025-07-17 → 2025-07-01)
+    '''
+    return pd.to_datetime(pd.Series(dates)).dt.to_period(freq).dt.to_timestamp()
+
+
+def series_version(df, columns):
+    '''
+    시리즈 버전 = (행 수, 내용 해시) - 값이 하나라도 바뀌면 달라짐
+    '''
+    hashed = pd.util.hash_pandas_object(df[columns], index=False)
+    return len(df), int(hashed.sum())
+
+
+def align(df, freq="M", how="first", value_cols=None, date_col="date"):
+    '''
+    일별 DataFrame → 구간별 대표값 (캐시 없음)
+
+    Parameters:
+        df (DataFrame): date_col + 값 컬럼
+        freq (str): 'M' (월) / 'W' (주) / 'Q' (분기)
+        how (str): 'first' / 'last' / 'mean' (결측은 건너뛰고 집계)
+        value_cols (list): 집계할 컬럼 (없으면 date_col 제외 전체)
+
+    Returns:
+        DataFrame: date_col(구간 시작일) + value_cols, 날짜 오름차순
+    '''
+    if freq not in ALIGN_FREQS:
+        raise ValueError(f"지원하지 않는 정렬 주기입니다: {freq}")
+    if how not in ALIGN_AGGREGATIONS:
+        raise ValueError(f"지원하지 않는 집계 방식입니다: {how}")
+
+    value_cols = list(value_cols or [c for c in df.columns if c != date_col])
+    src = df[[date_col] + value_cols].copy()
+    src[date_col] = pd.to_datetime(src[date_col])
+    src["_period"] = period_start(src[date_col], freq).to_numpy()
+
+    grouped = src.sort_values(date_col).groupby("_period")[value_cols]
+    out = getattr(grouped, how)()
+    return out.rename_axis(date_col).reset_index()
+
+
+class AlignmentCache:
+    '''
+    (시리즈 이름, 주기, 집계, 컬럼, 버전) → 정렬 결과 보관
+    - 원본이 갱신되면 버전이 바뀌어 자동으로 다시 계산
+    - 오래된 항목부터 max_entries 개를 넘으면 삭제
+    '''
+
+    def __init__(self, max_entries=128):
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._values = OrderedDict()
+
+    def get(self, name, df, freq="M", how="first", value_cols=None, date_col="date"):
+        value_cols = list(value_cols or [c for c in df.columns if c != date_col])
+        key = (name, freq, how, tuple(value_cols), series_version(df, [date_col] + value_cols))
+
+        with self._lock:
+            if key in self._values:
+                self._values.move_to_end(key)
+                return self._values[key].copy()
+
+        out = align(df, freq=freq, how=how, value_cols=value_cols, date_col=date_col)
+
+        with self._lock:
+            self._values[key] = out
+            while len(self._values) > self.max_entries:
+                self._values.popitem(last=False)
+        return out.copy()
+
+    def views(self, name, df, how="first", value_cols=None, date_col="date"):
+        '''
+        월/주/분기 정렬 결과를 한 번에 → {'M': df, 'W': df, 'Q': df}
+        '''
+        return {
+            freq: self.get(name, df, freq=freq, how=how, value_cols=value_cols, date_col=date_col)
+            for freq in ALIGN_FREQS
+        }
+
+    def clear(self):
+        with self._lock:
+            self._values.clear()
+
+
+_cache = AlignmentCache()
+
+
+def get_alignment_cache():
+    '''
+    프로세스 공용 AlignmentCache
+    '''
+    return _cache
+
+
+def aligned(name, df, freq="M", how="first", value_cols=None, date_col="date"):
+    '''
+    공용 캐시를 거친 align (MacroCrawler 에서 사용)
+    '''
+    return _cache.get(name, df, freq=freq, how=how, value_cols=value_cols, date_col=date_col)
@@ -0,0 +1,194 @@
+'''
+신호 이벤트 백테스트 (벡터화)
+- 입력: 이벤트 테이블 (date, signal='BUY'/'SELL'[, strategy]) + S&P500 일별 종가
+- 진입: 이벤트 날짜 이후(당일 포함) 첫 거래일 종가
+- 보유기간(HORIZONS, 거래일 수)별 수익률 / 적중률 / MAE / 보유 중 최대 낙폭을 한 번에 계산
+  (이벤트 × 최대 보유기간 가격 경로 행렬 하나에서 누적 최소/최대로 전부 산출)
+- SELL 은 숏 기준: 하락이 적중, 상승이 불리한 방향
+
+SIGNAL_EVENTS : 전략 이름 → MacroCrawler 로 이벤트 테이블을 만드는 함수
+'''
+import numpy as np
+import pandas as pd
+from numpy.lib.stride_tricks import sliding_window_view
+
+from signal_ops import CONDITION_OPS
+
+
+# 보유기간 → 거래일 수
+HORIZONS = {'1W': 5, '1M': 21, '3M': 63, '6M': 126, '12M': 252}
+
+EVENT_COLUMNS = ['date', 'signal', 'strategy']
+
+
+def to_events(df, date_col='date', signal_col='signal'):
+    '''
+    신호 테이블 → 이벤트 테이블 (date, signal 대문자 BUY/SELL)
+    '''
+    events = pd.DataFrame({
+        'date': pd.to_datetime(df[date_col]).to_numpy(),
+        'signal': df[signal_col].astype(str).str.upper().to_numpy(),
+    })
+    return events[events['signal'].isin(['BUY', 'SELL'])].reset_index(drop=True)
+
+
+def flag_events(df, date_col='date', buy=None, sell=None):
+    '''
+    불리언 컬럼(매수/매도 여부) → 이벤트 테이블
+    '''
+    frames = []
+    for col, signal in ((buy, 'BUY'), (sell, 'SELL')):
+        if col is not None:
+            hit = df[col].fillna(False).astype(bool)
+            frames.append(pd.DataFrame({'date': pd.to_datetime(df.loc[hit, date_col]).to_numpy(), 'signal': signal}))
+    if not frames:
+        return pd.DataFrame(columns=['date', 'signal'])
+    return pd.concat(frames, ignore_index=True).sort_values('date', kind='stable').reset_index(drop=True)
+
+
+def threshold_events(df, value_col, buy=None, sell=None, date_col='date', entries_only=True):
+    '''
+    값 임계치 규칙 → 이벤트 테이블
+
+    Parameters:
+        buy, sell (tuple): (연산자, 임계값) 예) ('>=', 30)
+        entries_only (bool): True 면 구간에 처음 들어간 날만 (연속된 날은 한 번)
+    '''
+    df = df[[date_col, value_col]].dropna().sort_values(date_col)
+    values = pd.to_numeric(df[value_col], errors='coerce').to_numpy(dtype=float)
+
+    flags = pd.DataFrame({date_col: pd.to_datetime(df[date_col]).to_numpy()})
+    for name, rule in (('buy', buy), ('sell', sell)):
+        if rule is None:
+            continue
+        op, threshold = rule
+        if op not in CONDITION_OPS:
+            raise ValueError(f"지원하지 않는 조건 연산자입니다: {op}")
+        mask = CONDITION_OPS[op](values, threshold)
+        if entries_only:
+            mask = mask & ~np.concatenate([[False], mask[:-1]])
+        flags[name] = mask
+
+    return flag_events(flags, date_col, buy='buy' if buy else None, sell='sell' if sell else None)
+
+
+def _horizon_map(horizons):
+    if horizons is None:
+        return dict(HORIZONS)
+    if isinstance(horizons, dict):
+        return dict(horizons)
+    unknown = [h for h in horizons if h not in HORIZONS]
+    if unknown:
+        raise ValueError(f"지원하지 않는 보유기간입니다: {unknown} (가능: {list(HORIZONS)})")
+    return {h: HORIZONS[h] for h in horizons}
+
+
+def forward_returns(events, prices, horizons=None, date_col='date', price_col='sp500_close'):
+    '''
+    이벤트별 보유기간 성과 (%)
+
+    Returns:
+        DataFrame: 이벤트 컬럼 + entry_date, entry_price,
+                   ret_<h>  : 보유기간 S&P500 수익률 (방향 무관)
+                   pnl_<h>  : 신호 방향 기준 수익률 (SELL 은 부호 반대)
+                   mae_<h>  : 보유 중 가장 불리했던 시점의 손익 (≤ 0)
+                   mdd_<h>  : 보유 중 최대 낙폭 (고점 대비, ≤ 0)
+                   (데이터가 보유기간만큼 없으면 NaN)
+    '''
+    horizons = _horizon_map(horizons)
+    px = prices[[date_col, price_col]].dropna().drop_duplicates(date_col).sort_values(date_col)
+    calendar = pd.to_datetime(px[date_col]).to_numpy()
+    close = px[price_col].to_numpy(dtype=float)
+
+    events = events.copy()
+    events['date'] = pd.to_datetime(events['date'])
+    entry = np.searchsorted(calendar, events['date'].to_numpy(dtype=calendar.dtype), side='left')
+    inside = entry < len(calendar)
+    events, entry = events[inside].reset_index(drop=True), entry[inside]
+
+    out = events.copy()
+    out['entry_date'] = calendar[entry]
+    out['entry_price'] = close[entry]
+
+    # 가격 경로 (이벤트 × 0..최대 보유기간, 진입가 = 1)
+    max_h = max(horizons.values())
+    padded = np.concatenate([close, np.full(max_h, np.nan)])
+    paths = sliding_window_view(padded, max_h + 1)[entry] / close[entry, None]
+
+    is_long = (events['signal'].to_numpy() != 'SELL')[:, None]
+    running_max = np.fmax.accumulate(paths, axis=1)
+    running_min = np.fmin.accumulate(paths, axis=1)
+    adverse = np.fmin.accumulate(np.where(is_long, paths - 1, 1 - paths), axis=1)
+    drawdown = np.fmin.accumulate(np.where(is_long, paths / running_max - 1, running_min / paths - 1), axis=1)
+
+    direction = np.where(is_long[:, 0], 1.0, -1.0)
+    for label, h in horizons.items():
+        valid = entry + h < len(close)
+        ret = np.where(valid, paths[:, h] - 1, np.nan) * 100
+        out[f'ret_{label}'] = ret
+        out[f'pnl_{label}'] = ret * direction
+        out[f'mae_{label}'] = np.where(valid, adverse[:, h], np.nan) * 100
+        out[f'mdd_{label}'] = np.where(valid, drawdown[:, h], np.nan) * 100
+    return out
+
+
+def summarize(trades, horizons=None):
+    '''
+    전략 × 신호 × 보유기간 요약 (건수, 평균/중앙 손익, 적중률, 평균/최악 MAE, 평균/최악 낙폭)
+    '''
+    horizons = _horizon_map(horizons)
+    keys = [c for c in ('strategy', 'signal') if c in trades.columns]
+
+    frames = []
+    for label in horizons:
+        part = trades[keys + [f'pnl_{label}', f'mae_{label}', f'mdd_{label}']].rename(
+            columns={f'pnl_{label}': 'pnl', f'mae_{label}': 'mae', f'mdd_{label}': 'mdd'}
+        ).dropna(subset=['pnl'])
+        part['horizon'] = label
+        frames.append(part)
+    long = pd.concat(frames, ignore_index=True)
+    long['hit'] = long['pnl'] > 0
+
+    summary = long.groupby(keys + ['horizon'], sort=False).agg(
+        count=('pnl', 'size'),
+        mean_pnl=('pnl', 'mean'),
+        median_pnl=('pnl', 'median'),
+        hit_rate=('hit', 'mean'),
+        mean_mae=('mae', 'mean'),
+        worst_mae=('mae', 'min'),
+        mean_mdd=('mdd', 'mean'),
+        worst_mdd=('mdd', 'min'),
+    ).reset_index()
+    summary['hit_rate'] = summary['hit_rate'] * 100
+    return summary.sort_values(keys, kind='stable').reset_index(drop=True)   # 보유기간 순서 유지
+
+
+def run_backtest(events, prices, horizons=None, date_col='date', price_col='sp500_close'):
+    '''
+    이벤트 테이블 백테스트 → {'trades': 이벤트별 성과, 'summary': 요약}
+    '''
+    trades = forward_returns(events, prices, horizons=horizons, date_col=date_col, price_col=price_col)
+    return {'trades': trades, 'summary': summarize(trades, horizons)}
+
+
+# ── 전략별 이벤트 테이블 ──────────────────────────────────────────────────────
+def _ecri_events(crawler):
+    signals = crawler.find_signals_from_erci_indicators()
+    return to_events(signals.rename_axis('date').reset_index())
+
+
+# 각 전략의 신호 규칙은 기존 메서드 그대로 (VIX / P/E / Bull-Bear 는 분석 메서드의 구간 규칙, 구간 진입일 기준)
+SIGNAL_EVENTS = {
+    'zscore_trend':      lambda c: to_events(c.generate_zscore_trend_signals(), date_col='action_date'),
+    'm2_margin':         lambda c: flag_events(c.get_m2_margin_release_signals().dropna(subset=['effective_date']),
+                                               'effective_date', buy='buy_signal', sell='sell_signal'),
+    'margin_yoy':        lambda c: flag_events(c.generate_mdyoy_signals(), 'action_date', buy='buy_signal', sell='sell_signal'),
+    'rate_cut_sell':     lambda c: flag_events(c.generate_rate_cut_signals(), 'date', sell='signal'),
+    'hike_buy':          lambda c: flag_events(c.generate_buy_signals_from_hike(), 'date', buy='buy_signal'),
+    'ecri_unemployment': _ecri_events,
+    'lei_pmi_fed':       lambda c: flag_events(c.generate_lei_pmi_fed_signals(), 'date', buy='buy_signal'),
+    'put_call_ratio':    lambda c: flag_events(c.generate_pcr_signals(), 'date', buy='buy_signal', sell='sell_signal'),
+    'bull_bear_spread':  lambda c: threshold_events(c.bull_bear_spread_updater.df, 'spread', buy=('<', -0.2), sell=('>', 0.4)),
+    'vix_bands':         lambda c: threshold_events(c.get_vix_index(), 'vix_index', buy=('>=', 30), sell=('<', 12)),
+    'forward_pe':        lambda c: threshold_events(c.snp_forwardpe_updater.df, 'forward_pe', buy=('<', 12), sell=('>', 22)),
+}
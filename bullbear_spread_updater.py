@@ -1,18 +1,12 @@
 import requests
-from bs4 import BeautifulSoup
 import pandas as pd
 from datetime import datetime
 import os
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support import expected_conditions as EC
-from webdriver_manager.chrome import ChromeDriverManager
-from bs4 import BeautifulSoup
 import time
 
+from page_fetcher import get_page_fetcher, parse_ycharts_stats
+
 class BullBearSpreadUpdater:
 
     def __init__(self, csv_path="bull_bear_spread.csv"):
@@ -32,57 +26,17 @@ class BullBearSpreadUpdater:
 
         url = "https://ycharts.com/indicators/us_investor_sentiment_bull_bear_spread"
 
-        options = Options()
-        options.add_argument("--headless")
-        options.add_argument("--disable-gpu")
-        options.add_argument("--no-sandbox")
- 
-
-        # 수정: webdriver-manager를 사용해 자동으로 드라이버 관리
-        service = Service(ChromeDriverManager().install())
-        driver = webdriver.Chrome(service=service, options=options)
-        driver.get(url)
-
-        try:
-            # ✅ time.sleep(5) 대신 WebDriverWait를 사용하여 요소가 나타날 때까지 대기
-            WebDriverWait(driver, 30).until(
-                    EC.presence_of_element_located((By.CSS_SELECTOR, "div.panel-data"))
-                )
-            soup = BeautifulSoup(driver.page_source, 'html.parser')
-
-            # 'Stats' 제목을 가진 패널을 찾기
-            stats_panel = None
-            for panel in soup.find_all('div', class_='panel-data'):
-                title = panel.find('h3', class_='panel-title')
-                if title and title.get_text(strip=True) == 'Stats':
-                    stats_panel = panel
-                    break
-            
-            if not stats_panel:
-                raise ValueError("❌ 'Stats' 패널을 찾을 수 없습니다. 웹사이트 구조가 변경되었을 수 있습니다.")
-
-            # 선택된 'Stats' 패널 내에서 'Last Value'와 'Latest Period'를 찾음
-            last_value_td = stats_panel.find('td', string='Last Value')
-            latest_period_td = stats_panel.find('td', string='Latest Period')
-
-            if last_value_td and last_value_td.find_next_sibling('td'):
-                bull_bear_spread = last_value_td.find_next_sibling('td').get_text(strip=True)
-            
-            if latest_period_td and latest_period_td.find_next_sibling('td'):
-                date = latest_period_td.find_next_sibling('td').get_text(strip=True)
-
-            if bull_bear_spread and date:
-                return {
-                    "date": date,
-                    "spread": bull_bear_spread
-                }
-            else:
-                raise ValueError("❌ 'Last Value' 또는 'Latest Period'를 찾을 수 없습니다.")
-                
-        finally:
-            driver.quit()
-
-
+        # HTTP 로 Stats 패널을 먼저 시도하고, 실패 시에만 공용 브라우저 풀 사용
+        stats = get_page_fetcher().fetch(
+            url,
+            parse_ycharts_stats,
+            wait_for=(By.CSS_SELECTOR, "div.panel-data"),
+            name="us_investor_sentiment_bull_bear_spread",
+        )
+        return {
+            "date": stats["date"],
+            "spread": stats["value"]
+        }
 
     def update_csv(self):
         bb_spread = self.get_bull_bear_spread()
@@ -0,0 +1,60 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pandas as pd
+
+
+# 호스트별 동시 요청 상한
+# - yfinance 는 내부 전역 버퍼(shared._DFS)를 쓰므로 동시에 1개만 실행
+HOST_LIMITS = {
+    'api.stlouisfed.org': 4,
+    'query2.finance.yahoo.com': 1,
+    'local': 8,
+}
+
+
+class ConcurrentFetcher:
+    '''
+    여러 데이터 소스를 bounded thread pool 에서 동시에 가져오는 실행기
+    - 전체 워커 수(max_workers)와 호스트별 상한(host_limits)을 함께 적용
+    - 개별 실패는 빈 DataFrame 으로 대체 (나머지 결과는 그대로 반환)
+    '''
+
+    def __init__(self, max_workers=8, host_limits=None):
+        self.max_workers = max_workers
+        self.host_limits = dict(HOST_LIMITS)
+        if host_limits:
+            self.host_limits.update(host_limits)
+        self._semaphores = {}
+        self._lock = threading.Lock()
+
+    def _semaphore(self, host):
+        with self._lock:
+            if host not in self._semaphores:
+                limit = self.host_limits.get(host, self.max_workers)
+                self._semaphores[host] = threading.BoundedSemaphore(limit)
+            return self._semaphores[host]
+
+    def _run_job(self, key, host, func):
+        with self._semaphore(host):
+            try:
+                return func()
+            except Exception as e:
+                print(f"[ERROR] 동시 조회 실패 ({key}) : {e}")
+                return pd.DataFrame()
+
+    def run(self, jobs):
+        '''
+        jobs : {key: (host, callable)} → {key: DataFrame}
+        결과 dict 는 jobs 의 key 순서를 유지
+        '''
+        if not jobs:
+            return {}
+
+        workers = min(self.max_workers, len(jobs))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {
+                key: executor.submit(self._run_job, key, host, func)
+                for key, (host, func) in jobs.items()
+            }
+            return {key: future.result() for key, future in futures.items()}
@@ -0,0 +1,205 @@
+'''
+신호 합의 행렬 (거래일 × 전략, int8)
+- 오늘의 시그널 페이지의 판단 규칙을 전체 거래일에 한 번에 적용 → BUY = 1 / HOLD = 0 / SELL = -1
+- consensus 컬럼 = 전략 코드 합 (양수면 매수 우세, 음수면 매도 우세)
+- 갱신 주기(CONSENSUS_TTL)마다 한 번 생성해 Parquet 으로 저장 → 오늘 판단 / 히트맵 / API 는 행 조회만
+
+규칙 (각 날짜에 그날까지 알려진 마지막 값 기준)
+- m2_margin     : Margin Debt / M2 z-score < -1.2 & 전월비 상승 → BUY, 전월비 < -7% → SELL
+                  (get_m2_margin_release_signals, 발표 후 첫 거래일부터 다음 발표 전까지 유지)
+- vix           : VIX ≥ 30 → BUY, < 12 → SELL
+- bull_bear     : Bull-Bear Spread < -0.2 → BUY, > 0.4 → SELL
+- put_call      : Equity Put/Call Ratio > 1.5 → BUY, < 0.4 → SELL
+- disparity_50  : 50일 이동평균 이격도 ≤ -5% → BUY, > 10% → SELL
+- disparity_200 : 200일 이동평균 이격도 ≤ -10% → BUY, > 20% → SELL
+                  (analyze_disparity_with_ma 해석 구간의 양 끝 : 침체 → BUY, 극단 과열 → SELL)
+- lei_pmi       : LEI > 100 & PMI > 50 & 기준금리 6개월 변화 ≥ +0.25%p → BUY
+                  (get_lei_pmi_fed_pit_panel - 공개일은 PIT_SERIES 발표 규칙)
+- forward_pe    : Forward P/E < 12 → BUY, > 22 → SELL
+(이평선 상회 비율 / TTM P/E 는 당일 값만 조회 가능해 제외)
+
+실행: python consensus.py  (현재 데이터 모드로 합의 행렬 재생성)
+'''
+import os
+from datetime import timedelta
+
+import matplotlib.pyplot as plt
+import numpy as np
+import pandas as pd
+
+from master_panel import MasterPanel
+from series_cache import CACHE_DB_PATH
+from signal_ops import CONDITION_OPS, publish_to_calendar
+
+
+CONSENSUS_PATH = os.path.join(os.path.dirname(CACHE_DB_PATH) or ".", "signal_consensus.parquet")
+CONSENSUS_TTL = timedelta(hours=1)
+
+SIGNAL_CODES = {'BUY': 1, 'HOLD': 0, 'SELL': -1}
+SIGNAL_LABELS = {code: label for label, code in SIGNAL_CODES.items()}
+
+# 이동평균 기간 → (매수, 매도) 구간 = analyze_disparity_with_ma 의 interpret_disparity_50 / _200 양 끝
+DISPARITY_BANDS = {
+    50:  {'buy': ('<=', -5),  'sell': ('>', 10)},
+    200: {'buy': ('<=', -10), 'sell': ('>', 20)},
+}
+
+
+def band_codes(values, buy=None, sell=None):
+    '''
+    값 배열 → BUY/SELL/HOLD 코드 (int8, 결측은 HOLD, 둘 다 만족하면 SELL 우선)
+
+    Parameters:
+        buy, sell (tuple): (연산자, 임계값) 예) ('>=', 30)
+    '''
+    values = np.asarray(values, dtype=float)
+    codes = np.zeros(len(values), dtype=np.int8)
+    with np.errstate(invalid='ignore'):
+        if buy is not None:
+            codes[CONDITION_OPS[buy[0]](values, buy[1])] = 1
+        if sell is not None:
+            codes[CONDITION_OPS[sell[0]](values, sell[1])] = -1
+    return codes
+
+
+def asof_levels(calendar, df, date_column, column):
+    '''
+    관측값 DataFrame → 각 거래일에 그날까지 관측된 마지막 값
+    '''
+    src = pd.DataFrame({
+        'date': pd.to_datetime(df[date_column], errors='coerce'),
+        'value': pd.to_numeric(df[column], errors='coerce'),
+    }).dropna()
+    return publish_to_calendar(calendar, src['date'], src['value'])
+
+
+def _level_rule(loader, column, buy, sell, date_column='date'):
+    def rule(crawler, calendar):
+        return band_codes(asof_levels(calendar, loader(crawler), date_column, column), buy=buy, sell=sell)
+    return rule
+
+
+def _m2_margin_codes(crawler, calendar):
+    # 오늘의 시그널(get_today_signal_with_m2_and_margin_debt)과 같은 발표분별 신호를 다음 발표 전까지 유지
+    releases = crawler.get_m2_margin_release_signals().dropna(subset=['effective_date'])
+    codes = np.where(releases['sell_signal'], -1, np.where(releases['buy_signal'], 1, 0))   # 둘 다면 SELL
+    published = publish_to_calendar(calendar, releases['effective_date'], codes)
+    return np.nan_to_num(published).astype(np.int8)
+
+
+def _lei_pmi_codes(crawler, calendar, buy_delta_pp=0.25):
+    known = crawler.get_lei_pmi_fed_pit_panel().known_at(calendar)
+    with np.errstate(invalid='ignore'):
+        buy = ((known['LEI'].to_numpy() > 100) & (known['PMI'].to_numpy() > 50)
+               & (known['fed_funds_6m_chg'].to_numpy() >= buy_delta_pp))
+    return buy.astype(np.int8)
+
+
+def _disparity_rule(window):
+    def rule(crawler, calendar):
+        name = f'sp500_disparity_{window}'
+        return band_codes(asof_levels(calendar, crawler.get_derived(name), 'date', name), **DISPARITY_BANDS[window])
+    return rule
+
+
+# 전략 → (crawler, 거래일 DatetimeIndex) → int8 코드 배열
+CONSENSUS_SIGNALS = {
+    'm2_margin':     _m2_margin_codes,
+    'vix':           _level_rule(lambda c: c.get_vix_index(), 'vix_index', buy=('>=', 30), sell=('<', 12)),
+    'bull_bear':     _level_rule(lambda c: c.bull_bear_spread_updater.df, 'spread', buy=('<', -0.2), sell=('>', 0.4)),
+    'put_call':      _level_rule(lambda c: c.put_call_ratio_updater.df, 'equity_value', buy=('>', 1.5), sell=('<', 0.4)),
+    'disparity_50':  _disparity_rule(50),
+    'disparity_200': _disparity_rule(200),
+    'lei_pmi':       _lei_pmi_codes,
+    'forward_pe':    _level_rule(lambda c: c.snp_forwardpe_updater.df, 'forward_pe', buy=('<', 12), sell=('>', 22)),
+}
+
+
+def build_consensus_matrix(crawler, signals=None):
+    '''
+    MacroCrawler → 거래일 × 전략 int8 코드 + consensus (조회 실패한 전략은 HOLD)
+    '''
+    signals = signals or CONSENSUS_SIGNALS
+    calendar = pd.DatetimeIndex(
+        pd.to_datetime(crawler.get_sp500()['date']).drop_duplicates().sort_values(), name='date'
+    )
+
+    columns = {}
+    with crawler.memo_scope():
+        for name, rule in signals.items():
+            try:
+                columns[name] = rule(crawler, calendar)
+            except Exception as e:
+                print(f"⚠️ 합의 행렬 {name} 계산 실패 → HOLD : {e}")
+                columns[name] = np.zeros(len(calendar), dtype=np.int8)
+
+    matrix = pd.DataFrame(columns, index=calendar).astype(np.int8)
+    matrix['consensus'] = matrix.sum(axis=1).astype(np.int8)
+    return matrix
+
+
+class ConsensusMatrix(MasterPanel):
+    '''
+    합의 행렬 Parquet 파일 (생성 / 신선도 확인 / 구간 읽기 - MasterPanel 과 같은 방식)
+    '''
+
+    def __init__(self, path=CONSENSUS_PATH, ttl=CONSENSUS_TTL):
+        super().__init__(path, ttl)
+
+    def refresh(self, crawler):
+        matrix = build_consensus_matrix(crawler)
+        self.save(matrix)
+        print(f"✅ 합의 행렬 생성 완료 {matrix.shape} → {self.path}")
+        return matrix
+
+    def load(self, columns=None, start=None, end=None, ffill=False):
+        return super().load(columns=columns, start=start, end=end, ffill=False)
+
+
+def today_consensus(matrix):
+    '''
+    합의 행렬 마지막 행 → {'date', 'signals': {전략: 'BUY'/'HOLD'/'SELL'}, 'consensus', 'buy', 'sell'}
+    '''
+    row = matrix.iloc[-1]
+    strategies = row.drop('consensus')
+    return {
+        'date': matrix.index[-1].strftime('%Y-%m-%d'),
+        'signals': {name: SIGNAL_LABELS[int(code)] for name, code in strategies.items()},
+        'consensus': int(row['consensus']),
+        'buy': int((strategies == 1).sum()),
+        'sell': int((strategies == -1).sum()),
+    }
+
+
+def plot_consensus_heatmap(matrix, days=250):
+    '''
+    최근 days 거래일 전략별 신호 히트맵 (BUY 빨강 / SELL 파랑) + consensus 막대
+    '''
+    recent = matrix.iloc[-days:]
+    strategies = recent.drop(columns='consensus')
+
+    fig, (ax1, ax2) = plt.subplots(2, 1, figsize=(13, 6), sharex=True,
+                                   gridspec_kw={'height_ratios': [3, 1]})
+    ax1.imshow(strategies.T.to_numpy(), aspect='auto', cmap='RdBu_r', vmin=-1, vmax=1, interpolation='nearest')
+    ax1.set_yticks(range(len(strategies.columns)))
+    ax1.set_yticklabels(strategies.columns)
+    ax1.set_title("Signal consensus (BUY = red, SELL = blue)")
+
+    x = np.arange(len(recent))
+    ax2.bar(x, recent['consensus'], color=np.where(recent['consensus'] >= 0, 'red', 'navy'), width=1.0)
+    ax2.axhline(0, color='black', linewidth=0.6)
+    ax2.set_ylabel("consensus")
+
+    ticks = np.linspace(0, len(recent) - 1, min(8, len(recent))).astype(int)
+    ax2.set_xticks(ticks)
+    ax2.set_xticklabels(recent.index[ticks].strftime('%Y-%m-%d'), rotation=0)
+    fig.tight_layout()
+    return fig
+
+
+if __name__ == "__main__":
+    from macro_crawling import MacroCrawler
+
+    crawler = MacroCrawler()
+    crawler.refresh_consensus_matrix()
+    print(crawler.get_today_consensus())
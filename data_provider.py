@@ -0,0 +1,360 @@
+'''
+외부 데이터 소스 공급자 (MacroCrawler 하위 계층)
+
+MACRO_DATA_MODE 환경변수로 선택:
+- live    : 실제 FRED / yfinance / 웹 페이지 호출 (기본값, API 키 필요)
+- record  : live 와 같지만 모든 HTTP / 브라우저 / 가격 응답을 카세트 디렉토리에 저장
+- replay  : 카세트 디렉토리에 저장된 응답만 사용 (네트워크·API 키 불필요)
+- offline : 저장소에 커밋된 스냅샷 CSV/HTML 만 사용 (네트워크·API 키 불필요)
+
+예) MACRO_DATA_MODE=offline streamlit run macro_dashboard/streamlit_app.py
+'''
+import hashlib
+import json
+import os
+import threading
+from urllib.parse import urlparse
+
+import pandas as pd
+import requests
+
+from fred_client import FRED_OBSERVATIONS_URL, build_http_session
+from series_cache import CACHE_DB_PATH
+
+
+CASSETTE_DIR = os.environ.get("MACRO_CASSETTE_DIR", "cassettes")
+
+# FRED series_id → 저장소 스냅샷 CSV (index, realtime_start, realtime_end, date, value[, 별칭])
+FRED_SNAPSHOTS = {
+    'GS10': '10years_ty.csv',
+    'GS2': '2years_ty.csv',
+    'CPIAUCSL': 'cpi_data.csv',
+    'M2SL': 'm2_df.csv',
+    'FEDFUNDS': 'fed_fund_rate.csv',
+    'UNRATE': 'unemploy.csv',
+    'UMCSENT': 'umcsent.csv',
+    'USSLIND': 'erci_df.csv',
+    'NFCI': 'NFCI_data.csv',
+}
+
+# 스크래핑 URL → 저장소 스냅샷 HTML
+PAGE_SNAPSHOTS = {
+    'https://www.barchart.com/stocks/momentum': 'barchart_momentum.html',
+}
+
+
+class ProviderUnavailable(requests.exceptions.ConnectionError):
+    '''
+    현재 모드에서 제공할 수 없는 요청 (기존 requests 예외 처리 경로를 그대로 타도록 ConnectionError 상속)
+    '''
+
+
+class SnapshotResponse:
+    '''
+    requests.Response 대용 (text / json() / raise_for_status() 만 지원)
+    '''
+
+    def __init__(self, text, status_code=200, url=""):
+        self.text = text
+        self.status_code = status_code
+        self.url = url
+
+    @property
+    def content(self):
+        return self.text.encode("utf-8")
+
+    def json(self):
+        return json.loads(self.text)
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise requests.exceptions.HTTPError(f"{self.status_code} : {self.url}", response=self)
+
+
+def _request_key(url, params=None):
+    '''
+    요청 식별 키 (api_key 는 제외 → 키 없이도 재생 가능)
+    '''
+    params = {k: v for k, v in (params or {}).items() if k != 'api_key'}
+    raw = f"GET {url}?{json.dumps(params, sort_keys=True, default=str)}"
+    return hashlib.sha1(raw.encode("utf-8")).hexdigest()[:16]
+
+
+def _slug(url):
+    parsed = urlparse(url)
+    tail = parsed.path.rstrip('/').split('/')[-1] or parsed.netloc
+    return "".join(c if c.isalnum() or c in "-_" else "_" for c in tail)[:40]
+
+
+class LiveProvider:
+    '''
+    실제 외부 호출 (기존 동작)
+    '''
+    name = "live"
+    requires_api_keys = True
+    use_cache = True
+    updates_local_files = True
+    cache_db_path = CACHE_DB_PATH
+
+    def http_session(self):
+        return build_http_session()
+
+    def browser(self):
+        from webdriver_pool import get_pool
+        return get_pool()
+
+    def download_prices(self, tickers, start):
+        '''
+        yf.download 1회 → {ticker: date, open, high, low, close, volume}
+        '''
+        import yfinance as yf
+        from price_store import normalize_download
+
+        raw = yf.download(tickers=list(tickers), start=start, interval="1d", group_by="ticker",
+                          progress=False, auto_adjust=True, threads=False)
+        bars = {}
+        for ticker in tickers:
+            try:
+                bars[ticker] = normalize_download(raw, ticker)
+            except KeyError:
+                bars[ticker] = pd.DataFrame()
+        return bars
+
+
+class CassetteSession:
+    '''
+    카세트 기반 requests.Session 대용
+    - 저장된 응답이 있으면 반환, record 모드면 실제 요청 후 저장, 그 외에는 ProviderUnavailable
+    '''
+
+    def __init__(self, cassette_dir, inner=None):
+        self.folder = os.path.join(cassette_dir, "http")
+        self.inner = inner
+        self.headers = inner.headers if inner is not None else {}
+        os.makedirs(self.folder, exist_ok=True)
+
+    def _path(self, url, params):
+        return os.path.join(self.folder, f"{_slug(url)}_{_request_key(url, params)}.json")
+
+    def get(self, url, params=None, **kwargs):
+        path = self._path(url, params)
+        if os.path.exists(path):
+            with open(path, encoding="utf-8") as f:
+                saved = json.load(f)
+            return SnapshotResponse(saved["text"], saved["status_code"], url)
+
+        if self.inner is None:
+            raise ProviderUnavailable(f"카세트에 없는 요청입니다: {url}")
+
+        response = self.inner.get(url, params=params, **kwargs)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({"url": url, "status_code": response.status_code, "text": response.text}, f, ensure_ascii=False)
+        return response
+
+    def close(self):
+        if self.inner is not None:
+            self.inner.close()
+
+
+class CassetteBrowser:
+    '''
+    카세트 기반 WebDriverPool 대용 (렌더링된 HTML 저장/재생)
+    '''
+
+    def __init__(self, cassette_dir, inner=None):
+        self.folder = os.path.join(cassette_dir, "browser")
+        self.inner = inner
+        os.makedirs(self.folder, exist_ok=True)
+
+    def fetch(self, url, wait_for=None, timeout=30):
+        path = os.path.join(self.folder, f"{_slug(url)}_{_request_key(url)}.html")
+        if os.path.exists(path):
+            with open(path, encoding="utf-8") as f:
+                return f.read()
+
+        if self.inner is None:
+            raise ProviderUnavailable(f"카세트에 없는 페이지입니다: {url}")
+
+        html = self.inner.fetch(url, wait_for=wait_for, timeout=timeout)
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(html)
+        return html
+
+    def close(self):
+        if self.inner is not None:
+            self.inner.close()
+
+
+class CassetteProvider:
+    '''
+    record=True  : live 호출 + 응답 저장
+    record=False : 저장된 응답만 재생 (replay)
+    '''
+    use_cache = False
+    updates_local_files = False
+
+    def __init__(self, cassette_dir=CASSETTE_DIR, record=False):
+        self.cassette_dir = cassette_dir
+        self.record = record
+        self.name = "record" if record else "replay"
+        self.requires_api_keys = record
+        self.cache_db_path = os.path.join(cassette_dir, "price_cache.sqlite")
+        self._live = LiveProvider() if record else None
+        os.makedirs(os.path.join(cassette_dir, "prices"), exist_ok=True)
+
+    def http_session(self):
+        return CassetteSession(self.cassette_dir, self._live.http_session() if self.record else None)
+
+    def browser(self):
+        return CassetteBrowser(self.cassette_dir, self._live.browser() if self.record else None)
+
+    def download_prices(self, tickers, start):
+        key = hashlib.sha1(f"{sorted(tickers)}|{start}".encode("utf-8")).hexdigest()[:16]
+        path = os.path.join(self.cassette_dir, "prices", f"{key}.csv")
+
+        if os.path.exists(path):
+            saved = pd.read_csv(path, parse_dates=["date"])
+            return {t: saved[saved["ticker"] == t].drop(columns="ticker") for t in tickers}
+
+        if not self.record:
+            raise ProviderUnavailable(f"카세트에 없는 가격 요청입니다: {tickers} / {start}")
+
+        bars = self._live.download_prices(tickers, start)
+        frames = [df.assign(ticker=t) for t, df in bars.items() if not df.empty]
+        if frames:
+            pd.concat(frames, ignore_index=True).to_csv(path, index=False)
+        return bars
+
+
+class SnapshotSession:
+    '''
+    저장소 스냅샷 기반 requests.Session 대용
+    - FRED observations : FRED_SNAPSHOTS CSV → FRED JSON 형태로 변환
+    - 스크래핑 페이지   : PAGE_SNAPSHOTS HTML
+    - 그 외             : ProviderUnavailable
+    '''
+    headers = {}
+
+    def get(self, url, params=None, **kwargs):
+        if url == FRED_OBSERVATIONS_URL:
+            return self._fred(params or {})
+        if url in PAGE_SNAPSHOTS and os.path.exists(PAGE_SNAPSHOTS[url]):
+            with open(PAGE_SNAPSHOTS[url], encoding="utf-8") as f:
+                return SnapshotResponse(f.read(), 200, url)
+        raise ProviderUnavailable(f"offline 모드에서 제공하지 않는 요청입니다: {url}")
+
+    def _fred(self, params):
+        series_id = params.get('series_id')
+        path = FRED_SNAPSHOTS.get(series_id)
+        if not path or not os.path.exists(path):
+            raise ProviderUnavailable(f"스냅샷이 없는 FRED series 입니다: {series_id}")
+
+        df = pd.read_csv(path, usecols=['date', 'value'])
+        start = params.get('observation_start')
+        if start:
+            df = df[pd.to_datetime(df['date']) >= pd.Timestamp(start)]
+        df['value'] = df['value'].astype(str).replace('nan', '.')
+        payload = {'observations': df.to_dict(orient='records')}
+        return SnapshotResponse(json.dumps(payload), 200, FRED_OBSERVATIONS_URL)
+
+    def close(self):
+        pass
+
+
+class SnapshotBrowser:
+    def fetch(self, url, wait_for=None, timeout=30):
+        if url in PAGE_SNAPSHOTS and os.path.exists(PAGE_SNAPSHOTS[url]):
+            with open(PAGE_SNAPSHOTS[url], encoding="utf-8") as f:
+                return f.read()
+        raise ProviderUnavailable(f"offline 모드에서 제공하지 않는 페이지입니다: {url}")
+
+    def close(self):
+        pass
+
+
+class OfflineProvider:
+    '''
+    저장소 스냅샷 CSV/HTML 만 사용 (가격은 PriceStore 가 스냅샷 CSV 로 적재)
+    '''
+    name = "offline"
+    requires_api_keys = False
+    use_cache = False
+    updates_local_files = False
+    cache_db_path = os.path.join(os.path.dirname(CACHE_DB_PATH) or ".", "offline_cache.sqlite")
+
+    def http_session(self):
+        return SnapshotSession()
+
+    def browser(self):
+        return SnapshotBrowser()
+
+    def download_prices(self, tickers, start):
+        return {}
+
+
+def create_provider(mode=None):
+    '''
+    모드 이름 → 공급자 (없으면 MACRO_DATA_MODE 환경변수, 기본 live)
+    '''
+    mode = (mode or os.environ.get("MACRO_DATA_MODE", "live")).lower()
+    if mode == "live":
+        return LiveProvider()
+    if mode == "record":
+        return CassetteProvider(record=True)
+    if mode == "replay":
+        return CassetteProvider(record=False)
+    if mode == "offline":
+        return OfflineProvider()
+    raise ValueError(f"지원하지 않는 MACRO_DATA_MODE 입니다: {mode}")
+
+
+_provider = None
+_provider_lock = threading.Lock()
+
+
+def get_provider():
+    '''
+    프로세스 공용 공급자 (MacroCrawler / 업데이트기 / PageFetcher 가 함께 사용)
+    '''
+    global _provider
+    with _provider_lock:
+        if _provider is None:
+            _provider = create_provider()
+        return _provider
+
+
+def use_provider(provider):
+    '''
+    공용 공급자 교체 (PageFetcher 도 새 공급자로 다시 생성)
+    '''
+    global _provider
+    with _provider_lock:
+        changed = _provider is not provider
+        _provider = provider
+    if changed:
+        import page_fetcher
+        page_fetcher.reset_page_fetcher()
+    return provider
+
+
+if __name__ == "__main__":
+    # 현재 모드로 주요 신호 계산 시간 측정
+    # 예) MACRO_DATA_MODE=offline python data_provider.py
+    import time
+    from macro_crawling import MacroCrawler
+
+    crawler = MacroCrawler()
+    checks = [
+        ("get_rate_signal", crawler.get_rate_signal),
+        ("check_today_md_signal", crawler.check_today_md_signal),
+        ("generate_fed_rate_turning_points", crawler.generate_fed_rate_turning_points),
+        ("analyze_vix", crawler.analyze_vix),
+    ]
+    for name, func in checks:
+        started = time.perf_counter()
+        try:
+            func()
+            status = "✅"
+        except Exception as e:
+            status = f"📛 {e}"
+        print(f"⏱️ [{crawler.provider.name}] {name:<34} {time.perf_counter() - started:6.2f}s {status}")
@@ -0,0 +1,311 @@
+'''
+파생 시리즈 의존성 그래프 (DAG) - 증분 재계산
+- 원자료(DERIVED_INPUTS) → 파생 시리즈(DERIVED_SERIES) : 각 노드가 입력과 벡터화 변환을 선언
+- 원자료가 바뀌면(보통 최근 행 추가) 하위 노드만, 바뀐 날짜 이후 꼬리 구간만 다시 계산
+- lookback : 변환이 한 행을 계산할 때 참조하는 과거 행 수 (예: 12개월 YoY → 12, 36개월 롤링 → 35)
+- online : 롤링 z-score 노드는 뒤에 행이 추가되면 RollingStats 상태로 행당 O(1) 갱신
+           (상태는 JSON 저장 → 새 프로세스도 저장된 마지막 날짜 이후 행만 push)
+
+실행: python derived.py  (증분 재계산 결과 = 전체 재계산 결과 점검)
+'''
+import threading
+
+import numpy as np
+import pandas as pd
+
+from alignment import period_start
+from rolling_stats import RollingStats, RollingStatsStore
+
+
+# 원자료 → (MacroCrawler 조회 경로, 날짜/값 컬럼, 월별 여부, fetch_many 용 id)
+# - monthly=True 면 날짜를 월 1일로 맞추고 같은 달은 마지막 값 사용
+DERIVED_INPUTS = {
+    'cpi':            {'loader': 'get_cpi',                    'date_column': 'date',       'column': 'value',          'monthly': True,  'fetch': 'CPIAUCSL'},
+    'm2':             {'loader': 'get_m2',                     'date_column': 'date',       'column': 'value',          'monthly': True,  'fetch': 'M2SL'},
+    'margin_debt':    {'loader': 'update_margin_debt_data',    'date_column': 'Month/Year', 'column': "Debit Balances in Customers' Securities Margin Accounts", 'monthly': True},
+    '10y':            {'loader': 'get_10years_treasury_yeild', 'date_column': 'date',       'column': 'value',          'monthly': True,  'fetch': 'GS10'},
+    '2y':             {'loader': 'get_2years_treasury_yeild',  'date_column': 'date',       'column': 'value',          'monthly': True,  'fetch': 'GS2'},
+    'fed_funds_rate': {'loader': 'get_fed_funds_rate',         'date_column': 'date',       'column': 'fed_funds_rate', 'monthly': True,  'fetch': 'FEDFUNDS'},
+    'sp500_close':    {'loader': 'get_sp500',                  'date_column': 'date',       'column': 'sp500_close',    'monthly': False, 'fetch': '^GSPC'},
+}
+
+
+def _yoy(s):
+    return s.pct_change(periods=12, fill_method=None) * 100
+
+
+def _change_pct(s):
+    return s.pct_change(fill_method=None) * 100
+
+
+def _ratio(a, b):
+    a, b = a.align(b, join='inner')
+    return a / b
+
+
+def _difference(a, b):
+    a, b = a.align(b, join='inner')
+    return a - b
+
+
+def _rolling_z(s, window=36, min_periods=12):
+    return (s - s.rolling(window=window, min_periods=min_periods).mean()) / \
+           s.rolling(window=window, min_periods=min_periods).std()
+
+
+def _disparity(close, ma):
+    close, ma = close.align(ma, join='inner')
+    return (close - ma) / ma * 100
+
+
+# 파생 시리즈 → (입력, 변환, lookback[, online 롤링 설정])
+DERIVED_SERIES = {
+    'cpi_yoy':                    {'inputs': ['cpi'],                   'transform': _yoy,                                    'lookback': 12},
+    'm2_yoy':                     {'inputs': ['m2'],                    'transform': _yoy,                                    'lookback': 12},
+    'margin_yoy':                 {'inputs': ['margin_debt'],           'transform': _yoy,                                    'lookback': 12},
+    'margin_m2_ratio':            {'inputs': ['margin_debt', 'm2'],     'transform': _ratio,                                  'lookback': 0},
+    'margin_m2_ratio_z':          {'inputs': ['margin_m2_ratio'],       'transform': _rolling_z,                              'lookback': 35,
+                                   'online': {'window': 36, 'min_periods': 12}},
+    'margin_m2_ratio_change_pct': {'inputs': ['margin_m2_ratio'],       'transform': _change_pct,                             'lookback': 1},
+    'spread':                     {'inputs': ['10y', '2y'],             'transform': _difference,                             'lookback': 0},
+    'real_10y':                   {'inputs': ['10y', 'cpi_yoy'],        'transform': _difference,                             'lookback': 0},
+    'real_2y':                    {'inputs': ['2y', 'cpi_yoy'],         'transform': _difference,                             'lookback': 0},
+    'fed_funds_6m_chg':           {'inputs': ['fed_funds_rate'],        'transform': lambda s: s - s.shift(6),                'lookback': 6},
+    'sp500_ma_50':                {'inputs': ['sp500_close'],           'transform': lambda s: s.rolling(window=50).mean(),  'lookback': 49},
+    'sp500_ma_200':               {'inputs': ['sp500_close'],           'transform': lambda s: s.rolling(window=200).mean(), 'lookback': 199},
+    'sp500_disparity_50':         {'inputs': ['sp500_close', 'sp500_ma_50'],  'transform': _disparity,                       'lookback': 0},
+    'sp500_disparity_200':        {'inputs': ['sp500_close', 'sp500_ma_200'], 'transform': _disparity,                       'lookback': 0},
+}
+
+
+def to_input_series(df, spec):
+    '''
+    조회 DataFrame → 날짜 index 의 float Series (결측 제거, 날짜 오름차순, 같은 날짜는 마지막 값)
+    '''
+    values = df[spec['column']]
+    if values.dtype == object or pd.api.types.is_string_dtype(values):
+        values = values.astype(str).str.replace(',', '', regex=False)
+    src = pd.DataFrame({
+        'date': pd.to_datetime(df[spec['date_column']], format='mixed'),
+        'value': pd.to_numeric(values, errors='coerce'),
+    }).dropna()
+    if spec.get('monthly'):
+        src['date'] = period_start(src['date']).to_numpy()
+    src = src.sort_values('date', kind='stable').drop_duplicates('date', keep='last')
+    return pd.Series(src['value'].to_numpy(dtype=float), index=pd.DatetimeIndex(src['date'], name='date'))
+
+
+def first_change(old, new):
+    '''
+    old → new 에서 처음 달라진 날짜 (같으면 None, old 가 없으면 new 의 첫 날짜)
+    '''
+    if old is None:
+        return new.index[0] if len(new) else None
+
+    n = min(len(old), len(new))
+    old_values, new_values = old.to_numpy()[:n], new.to_numpy()[:n]
+    same = (old.index.values[:n] == new.index.values[:n]) & \
+           ((old_values == new_values) | (np.isnan(old_values) & np.isnan(new_values)))
+    if not same.all():
+        i = int(np.argmin(same))
+        return min(old.index[i], new.index[i])
+    if len(new) > n:
+        return new.index[n]      # 뒤에 행 추가
+    if len(old) > n:
+        return old.index[n]      # 뒤쪽 행 삭제
+    return None
+
+
+def _topological_order(specs):
+    order, state = [], {}
+
+    def visit(name):
+        if state.get(name) == 'done' or name not in specs:
+            return
+        if state.get(name) == 'visiting':
+            raise ValueError(f"파생 시리즈 의존성에 순환이 있습니다: {name}")
+        state[name] = 'visiting'
+        for parent in specs[name]['inputs']:
+            visit(parent)
+        state[name] = 'done'
+        order.append(name)
+
+    for name in specs:
+        visit(name)
+    return order
+
+
+class DerivedGraph:
+    '''
+    원자료/파생 시리즈 값 보관 + 변경분 전파
+
+    사용 예:
+        graph.set_input('cpi', cpi_series)   # 바뀐 날짜 이후만 하위 노드 재계산
+        graph.get('real_10y')
+    '''
+
+    def __init__(self, specs=None, state_path=None):
+        self.specs = specs or DERIVED_SERIES
+        self.order = _topological_order(self.specs)
+        self.state_path = state_path
+        self._lock = threading.RLock()
+        self._values = {}
+        self._states = self._load_states()    # online 노드 → RollingStats
+        self.last_run = {}      # 노드 → 'full' / 'tail' / 'online' (최근 재계산 방식, 점검용)
+
+    def _load_states(self):
+        '''
+        저장된 online 노드 상태 (윈도우 설정이 지금 노드 설정과 같은 것만)
+        '''
+        if not self.state_path:
+            return {}
+        states = {}
+        for name, stats in RollingStatsStore(self.state_path).load().items():
+            online = self.specs.get(name, {}).get('online')
+            if online and (stats.window, stats.min_periods) == (online['window'], online.get('min_periods', online['window'])):
+                states[name] = stats
+        return states
+
+    def inputs_of(self, names=None):
+        '''
+        names 계산에 필요한 원자료 이름 (names 가 없으면 전체)
+        '''
+        stack, seen, raw = list(names or self.specs), set(), []
+        while stack:
+            name = stack.pop()
+            if name in seen:
+                continue
+            seen.add(name)
+            if name in self.specs:
+                stack.extend(self.specs[name]['inputs'])
+            else:
+                raw.append(name)
+        return sorted(raw)
+
+    def set_input(self, name, series):
+        '''
+        원자료 교체 → 처음 달라진 날짜부터 하위 노드 재계산 (바뀐 것이 없으면 아무것도 하지 않음)
+        '''
+        if name in self.specs:
+            raise ValueError(f"{name} 은(는) 파생 시리즈라 직접 넣을 수 없습니다.")
+        series = series.rename(name)
+        with self._lock:
+            start = first_change(self._values.get(name), series)
+            if start is None:
+                return
+            self._values[name] = series
+            self._propagate({name: start})
+            if self.state_path and self._states:
+                RollingStatsStore(self.state_path).save(self._states)
+
+    def _propagate(self, dirty):
+        for name in self.order:
+            spec = self.specs[name]
+            starts = [dirty[i] for i in spec['inputs'] if i in dirty]
+            if not starts or any(i not in self._values for i in spec['inputs']):
+                continue
+
+            old = self._values.get(name)
+            new = self._compute(name, spec, min(starts), old)
+            start = first_change(old, new)
+            if start is not None:
+                self._values[name] = new
+                dirty[name] = start
+
+    def _compute(self, name, spec, start, old):
+        inputs = [self._values[i] for i in spec['inputs']]
+        online = spec.get('online')
+        stats = self._states.get(name)
+
+        # 뒤에 행만 추가됐고 상태가 직전 마지막 날짜까지 반영돼 있으면 새 행만 push
+        if online and old is not None and len(old) and stats is not None \
+                and stats.last_date == old.index[-1] and start > old.index[-1]:
+            added = inputs[0][inputs[0].index > old.index[-1]]
+            values = [stats.push(value, date).zscore(value) for date, value in added.items()]
+            self.last_run[name] = 'online'
+            return pd.concat([old, pd.Series(values, index=added.index, dtype=float)]).rename(name)
+
+        # 프로세스 첫 계산: 저장된 상태가 입력과 맞으면 그 날짜까지만 변환하고 이후 행은 push
+        if online and old is None and self._matches(stats, inputs[0]):
+            known = inputs[0][inputs[0].index <= stats.last_date]
+            added = inputs[0][inputs[0].index > stats.last_date]
+            values = [stats.push(value, date).zscore(value) for date, value in added.items()]
+            self.last_run[name] = 'online' if len(added) else 'full'
+            return pd.concat([spec['transform'](known), pd.Series(values, index=added.index, dtype=float)]).rename(name)
+
+        if online:
+            self._states[name] = RollingStats.from_series(inputs[0], **online)
+
+        if old is None:
+            self.last_run[name] = 'full'
+            return spec['transform'](*inputs).rename(name)
+
+        # 꼬리 구간: 각 입력에서 start 위치 - lookback 행부터 변환 → start 이후만 교체
+        lookback = spec.get('lookback', 0)
+        sliced = [s.iloc[max(s.index.searchsorted(start) - lookback, 0):] for s in inputs]
+        tail = spec['transform'](*sliced)
+        self.last_run[name] = 'tail'
+        return pd.concat([old[old.index < start], tail[tail.index >= start]]).rename(name)
+
+    @staticmethod
+    def _matches(stats, series):
+        '''
+        저장된 상태의 윈도우 값 = 입력의 마지막 날짜(last_date)까지 마지막 window 행 (수정치가 없었는지)
+        '''
+        if stats is None or stats.last_date is None or stats.last_date not in series.index:
+            return False
+        window = series[series.index <= stats.last_date].to_numpy()[-stats.window:]
+        return len(window) == len(stats.values) and \
+            np.allclose(window, np.array(stats.values), rtol=0, atol=0, equal_nan=True)
+
+    def get(self, name):
+        with self._lock:
+            if name not in self._values:
+                raise KeyError(f"{name} 값이 없습니다. 원자료를 먼저 넣어 주세요.")
+            return self._values[name].copy()
+
+    def frame(self, names):
+        '''
+        여러 시리즈 → DataFrame (date + names, 모든 시리즈에 있는 날짜만)
+        '''
+        df = pd.concat([self.get(name) for name in names], axis=1, join='inner')
+        return df.reset_index()
+
+
+_graphs = {}
+_graphs_lock = threading.Lock()
+
+
+def get_derived_graph(key="default", state_path=None):
+    '''
+    프로세스 공용 DerivedGraph (데이터 모드별로 하나, state_path 는 처음 만들 때만 사용)
+    '''
+    with _graphs_lock:
+        if key not in _graphs:
+            _graphs[key] = DerivedGraph(state_path=state_path)
+        return _graphs[key]
+
+
+if __name__ == "__main__":
+    from macro_crawling import MacroCrawler
+
+    crawler = MacroCrawler()
+    with crawler.memo_scope():
+        raw = {name: to_input_series(getattr(crawler, spec['loader'])(), spec)
+               for name, spec in DERIVED_INPUTS.items()}
+
+    # 마지막 3행을 빼고 만든 뒤 추가 → 증분 결과가 전체 재계산과 같은지 확인
+    incremental = DerivedGraph()
+    for name, series in raw.items():
+        incremental.set_input(name, series.iloc[:-3])
+    for name, series in raw.items():
+        incremental.set_input(name, series)
+
+    full = DerivedGraph()
+    for name, series in raw.items():
+        full.set_input(name, series)
+
+    for name in DERIVED_SERIES:
+        a, b = incremental.get(name), full.get(name)
+        ok = a.index.equals(b.index) and np.allclose(a, b, equal_nan=True)
+        print(f"{'✅' if ok else '❌'} {name:28s} {incremental.last_run.get(name)} ({len(a)} rows)")
@@ -0,0 +1,149 @@
+'''
+신호 이벤트 스터디 - 신호일 전후 S&P500 평균 경로
+- 이벤트마다 진입일(이벤트 날짜 이후 첫 거래일)을 0 으로 -before ~ +after 거래일 구간을 잘라
+  진입일 종가 대비 누적 수익률(%) 경로로 만듦
+- 이벤트 × 구간 위치 2차원 인덱스 행렬 하나로 종가 배열에서 한 번에 가져오고 (앞뒤는 NaN 패딩),
+  평균 / 중앙값 / 분위수 경로도 축 방향 한 번에 계산
+- (전략, 파라미터, 구간, 원자료 버전) 별로 프로세스 안에서 한 번만 계산 (EventStudyCache)
+  키를 신호 생성 전에 만들어, 캐시에 있으면 신호 이벤트도 다시 만들지 않음
+'''
+import threading
+import warnings
+from collections import OrderedDict
+
+import matplotlib.pyplot as plt
+import numpy as np
+import pandas as pd
+
+
+EVENT_STUDY_QUANTILES = (0.1, 0.25, 0.75, 0.9)
+
+
+def event_paths(events, prices, before=20, after=60, date_col='date', price_col='sp500_close'):
+    '''
+    이벤트 → 진입일 종가 대비 누적 수익률 경로 (%)
+
+    Returns:
+        offsets (ndarray): -before ~ +after
+        paths (ndarray): 이벤트 × 구간 위치 (가격이 없는 위치는 NaN)
+        events (DataFrame): 달력 안에 진입일이 있는 이벤트 (paths 행 순서)
+    '''
+    px = prices[[date_col, price_col]].dropna().drop_duplicates(date_col).sort_values(date_col)
+    calendar = pd.to_datetime(px[date_col]).to_numpy()
+    close = px[price_col].to_numpy(dtype=float)
+
+    entry = np.searchsorted(calendar, pd.to_datetime(events['date']).to_numpy(dtype=calendar.dtype), side='left')
+    inside = entry < len(calendar)
+    events, entry = events[inside].reset_index(drop=True), entry[inside]
+
+    offsets = np.arange(-before, after + 1)
+    padded = np.concatenate([np.full(before, np.nan), close, np.full(after, np.nan)])
+    paths = padded[entry[:, None] + before + offsets] / close[entry, None]
+    return offsets, (paths - 1) * 100, events
+
+
+def event_study(events, prices, before=20, after=60, quantiles=EVENT_STUDY_QUANTILES,
+                date_col='date', price_col='sp500_close'):
+    '''
+    이벤트 테이블 (date, signal[, strategy]) → 전략 × 신호 × 구간 위치별 경로 통계
+
+    Returns:
+        DataFrame: [strategy,] signal, offset, count, mean, median, q10, q25, q75, q90 (%)
+    '''
+    offsets, paths, events = event_paths(events, prices, before, after, date_col, price_col)
+    keys = [c for c in ('strategy', 'signal') if c in events.columns]
+    qs = (0.5,) + tuple(quantiles)
+    q_names = ['median'] + [f'q{round(q * 100)}' for q in quantiles]
+
+    frames = []
+    for key, group in events.groupby(keys, sort=False):
+        block = paths[group.index.to_numpy()]
+        frame = pd.DataFrame({'offset': offsets, 'count': np.sum(~np.isnan(block), axis=0)})
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore', RuntimeWarning)   # 가격이 없는 위치 (All-NaN slice)
+            frame['mean'] = np.nanmean(block, axis=0)
+            frame[q_names] = np.nanquantile(block, qs, axis=0).T
+        for col, value in zip(keys, key if isinstance(key, tuple) else (key,)):
+            frame[col] = value
+        frames.append(frame)
+
+    columns = keys + ['offset', 'count', 'mean'] + q_names
+    if not frames:
+        return pd.DataFrame(columns=columns)
+    return pd.concat(frames, ignore_index=True)[columns]
+
+
+class EventStudyCache:
+    '''
+    (전략, 파라미터, 구간, 원자료 버전) → 이벤트 스터디 결과 보관
+    - 키는 호출하는 쪽이 신호 생성 전에 만듦 (MacroCrawler.get_event_study → data_version)
+    - 원자료가 바뀌면 버전이 달라져 자동으로 다시 계산
+    - 오래된 항목부터 max_entries 개를 넘으면 삭제
+    '''
+
+    def __init__(self, max_entries=64):
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._values = OrderedDict()
+
+    def get(self, make_key, compute):
+        '''
+        make_key() 키가 있으면 저장된 결과, 없으면 compute() (신호 이벤트 생성 + event_study) 결과를 저장 후 반환
+        - 저장 키는 계산 뒤 다시 만듦 (계산 중 증분 조회로 원자료가 갱신되면 갱신된 버전으로 저장)
+        '''
+        key = make_key()
+        with self._lock:
+            if key in self._values:
+                self._values.move_to_end(key)
+                return self._values[key].copy()
+
+        out = compute()
+
+        with self._lock:
+            self._values[make_key()] = out
+            while len(self._values) > self.max_entries:
+                self._values.popitem(last=False)
+        return out.copy()
+
+    def clear(self):
+        with self._lock:
+            self._values.clear()
+
+
+_cache = EventStudyCache()
+
+
+def get_event_study_cache():
+    '''
+    프로세스 공용 EventStudyCache
+    '''
+    return _cache
+
+
+def plot_event_study(study, title=None):
+    '''
+    신호별 평균 / 중앙값 경로 + 분위수 밴드 (q10~q90, q25~q75)
+    '''
+    signals = list(dict.fromkeys(study['signal']))
+    fig, axes = plt.subplots(1, max(len(signals), 1), figsize=(6.5 * max(len(signals), 1), 4.5), squeeze=False)
+    colors = {'BUY': 'red', 'SELL': 'navy'}
+
+    for ax, signal in zip(axes[0], signals):
+        part = study[study['signal'] == signal]
+        color = colors.get(signal, 'gray')
+        ax.fill_between(part['offset'], part['q10'], part['q90'], color=color, alpha=0.12, label='q10–q90')
+        ax.fill_between(part['offset'], part['q25'], part['q75'], color=color, alpha=0.25, label='q25–q75')
+        ax.plot(part['offset'], part['mean'], color=color, linewidth=2, label='mean')
+        ax.plot(part['offset'], part['median'], color=color, linestyle='--', linewidth=1.2, label='median')
+        ax.axvline(0, color='black', linewidth=0.8)
+        ax.axhline(0, color='black', linewidth=0.5, alpha=0.6)
+        ax.set_title(f"{signal} (n={int(part['count'].max())})")
+        ax.set_xlabel("Trading days from entry")
+        ax.set_ylabel("S&P500 return vs entry (%)")
+        ax.grid(True, alpha=0.3)
+        ax.legend(loc='upper left')
+
+    if title:
+        fig.suptitle(title)
+    fig.tight_layout()
+    return fig
@@ -0,0 +1,150 @@
+import pandas as pd
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+
+FRED_OBSERVATIONS_URL = 'https://api.stlouisfed.org/fred/series/observations'
+
+# series_id → 출력 컬럼 / 조회 시작일 / 발표 빈도(D·W·M, 캐시 TTL 기준)
+# column 이 'value' 가 아니면 value 컬럼을 해당 이름으로 한 번 더 복사해 준다 (기존 get_* 반환 형태 유지)
+# release_day : 월간 시리즈의 전월 값이 FRED 에 올라오는 대략적인 날짜 (지나면 캐시 만료 → SeriesCache.is_fresh)
+FRED_SERIES = {
+    'GS10':             {'column': 'value',             'start': '2000-01-01', 'frequency': 'M', 'release_day': 1},   # 10년물 국채 금리
+    'GS2':              {'column': 'value',             'start': '2000-01-01', 'frequency': 'M', 'release_day': 1},   # 2년물 국채 금리
+    'CPIAUCSL':         {'column': 'value',             'start': '1999-01-01', 'frequency': 'M', 'release_day': 10},  # CPI (YoY 계산용 1년 앞당김)
+    'M2SL':             {'column': 'value',             'start': '2000-01-01', 'frequency': 'M', 'release_day': 22},  # M2 통화량 (넷째 주 화요일경)
+    'FEDFUNDS':         {'column': 'fed_funds_rate',    'start': '2000-01-01', 'frequency': 'M', 'release_day': 1},   # 기준 금리
+    'UNRATE':           {'column': 'unemployment_rate', 'start': '2000-01-01', 'frequency': 'M', 'release_day': 1},   # 실업률 (첫째 주 금요일)
+    'UMCSENT':          {'column': 'umcsent_index',     'start': '2000-01-01', 'frequency': 'M', 'release_day': 1},   # 미시간 소비자 심리지수
+    'USSLIND':          {'column': 'LI_index',          'start': '2000-01-01', 'frequency': 'M', 'release_day': 1},   # 선행지수 (ECRI 대용)
+    'USALOLITONOSTSAM': {'column': 'CLI_index',         'start': '2000-01-01', 'frequency': 'M', 'release_day': 10},  # OECD CLI
+    'NFCI':             {'column': 'NFCI_index',        'start': '2000-01-01', 'frequency': 'W'},  # 금융여건지수
+    'DTWEXBGS':         {'column': 'value',             'start': '2000-01-01', 'frequency': 'D'},  # 달러 인덱스
+    'DEXUSEU':          {'column': 'value',             'start': '2000-01-01', 'frequency': 'D'},  # 유로 환율
+    'DEXJPUS':          {'column': 'value',             'start': '2000-01-01', 'frequency': 'D'},  # 엔화 환율
+    'BAMLH0A0HYM2':     {'column': 'value',             'start': '2000-01-01', 'frequency': 'D'},  # 하이일드 스프레드
+}
+
+
+def build_http_session(pool_maxsize=10, retries=3):
+    '''
+    keep-alive 커넥션 풀을 가진 requests.Session 생성
+    - 같은 호스트로 가는 요청은 TCP/TLS 연결을 재사용
+    - 429/5xx 응답은 backoff 후 재시도
+    '''
+    session = requests.Session()
+    retry = Retry(
+        total=retries,
+        backoff_factor=0.5,
+        status_forcelist=[429, 500, 502, 503, 504],
+        allowed_methods=["GET"],
+    )
+    adapter = HTTPAdapter(pool_connections=pool_maxsize, pool_maxsize=pool_maxsize, max_retries=retry)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def with_output_column(series_id, df):
+    '''
+    레지스트리에 지정된 출력 컬럼(value 복사본) 추가
+    '''
+    column = FRED_SERIES.get(series_id, {}).get('column', 'value')
+    if column != 'value' and not df.empty:
+        df[column] = df['value']
+    return df
+
+
+def parse_observations(series_id, observations):
+    '''
+    FRED observations(list[dict]) → DataFrame
+    - date : datetime64, value : float (결측 '.' 은 NaN)
+    - 레지스트리에 지정된 출력 컬럼이 있으면 함께 생성
+    '''
+    df = pd.DataFrame(observations)
+    if df.empty or 'date' not in df.columns:
+        return pd.DataFrame()
+
+    df['date'] = pd.to_datetime(df['date'])
+    df['value'] = pd.to_numeric(df['value'], errors='coerce')
+    return with_output_column(series_id, df)
+
+
+class FredClient:
+    '''
+    FRED API 공용 클라이언트
+    - 하나의 Session(커넥션 풀)으로 모든 series 요청을 처리
+    - series_id 레지스트리(FRED_SERIES)로 출력 컬럼/시작일/빈도 관리
+    - cache(SeriesCache)가 있으면 TTL 안에서는 캐시 반환, 만료 시 증분 조회 후 병합
+    '''
+
+    def __init__(self, api_key, session=None, timeout=10, cache=None):
+        self.api_key = api_key
+        self.session = session or build_http_session()
+        self.timeout = timeout
+        self.cache = cache
+
+    def fetch_observations(self, series_id, observation_start=None):
+        '''
+        FRED API 호출 → observations 리스트 반환 (실패 시 예외)
+        '''
+        spec = FRED_SERIES.get(series_id, {})
+        params = {
+            'series_id': series_id,
+            'api_key': self.api_key,
+            'file_type': 'json',
+            'observation_start': observation_start or spec.get('start', '2000-01-01'),
+        }
+
+        response = self.session.get(FRED_OBSERVATIONS_URL, params=params, timeout=self.timeout)
+        response.raise_for_status()  # HTTP 에러 발생 시 예외 처리
+        data = response.json()
+
+        if 'observations' not in data:
+            raise ValueError(f"'observations' 키가 없음 : {data}")
+        return data['observations']
+
+    def get_series(self, series_id, refresh=False):
+        '''
+        series_id 의 관측치를 DataFrame 으로 반환
+        - refresh=True 이면 TTL 과 무관하게 증분 조회
+        - 실패 시 캐시가 있으면 캐시(만료분 포함), 없으면 빈 DataFrame 반환
+        '''
+        if self.cache is None:
+            return self._fetch_full(series_id)
+
+        spec = FRED_SERIES.get(series_id, {})
+        frequency = spec.get('frequency', 'D')
+
+        if not refresh and self.cache.is_fresh(series_id, frequency, spec.get('release_day')):
+            return with_output_column(series_id, self.cache.load(series_id))
+
+        start = self.cache.refresh_start(series_id, frequency, spec.get('start', '2000-01-01'))
+        try:
+            observations = self.fetch_observations(series_id, start)
+        except Exception as e:
+            print(f"[ERROR] FRED API 호출 실패 ({series_id}) : {e}")
+            cached = self.cache.load(series_id)
+            if not cached.empty:
+                print(f"⚠️ 캐시된 {series_id} 데이터로 대체합니다.")
+            return with_output_column(series_id, cached) if not cached.empty else pd.DataFrame()
+
+        fresh = parse_observations(series_id, observations)
+        self.cache.upsert(series_id, fresh)
+        return with_output_column(series_id, self.cache.load(series_id))
+
+    def _fetch_full(self, series_id):
+        try:
+            observations = self.fetch_observations(series_id)
+        except Exception as e:
+            print(f"[ERROR] FRED API 호출 실패 ({series_id}) : {e}")
+            return pd.DataFrame()
+
+        df = parse_observations(series_id, observations)
+        if df.empty:
+            print(f"❌ observations 비어있음 ({series_id})")
+        return df
+
+    def close(self):
+        self.session.close()
@@ -1,15 +1,33 @@
 import os
 import pandas as pd
 import re
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support import expected_conditions as EC
-from webdriver_manager.chrome import ChromeDriverManager
-from bs4 import BeautifulSoup
 
+from page_fetcher import get_page_fetcher
+
+
+
+def parse_ism_pmi_row(soup):
+    '''
+    TradingEconomics 관련 지표 표에서 'ISM 제조업 PMI' 행 추출
+    → {'지표명': ..., '값': '49.00', '발표일': 'Jul 2025'}
+    '''
+    table = soup.find('table', class_='table table-hover')
+    if not table or not table.find('tbody'):
+        raise ValueError("❌ 테이블을 찾을 수 없습니다.")
+
+    for row in table.find('tbody').find_all('tr'):
+        columns = row.find_all('td')
+        if len(columns) >= 5:
+            name = columns[0].get_text(strip=True)
+            if "ISM 제조업 PMI" in name:
+                return {
+                    "지표명": name,
+                    "값": columns[1].get_text(strip=True),
+                    "발표일": columns[4].get_text(strip=True)
+                }
+
+    raise ValueError("❌ 'ISM 제조업 PMI' 항목을 찾을 수 없습니다.")
 
 
 class ISMPMIUpdater:
@@ -90,49 +108,16 @@ class ISMPMIUpdater:
         """
         url = "https://ko.tradingeconomics.com/united-states/manufacturing-pmi"
 
-        options = Options()
-        options.add_argument('--headless')  # ← 일단 꺼두세요
-        options.add_argument('--disable-gpu')
-        options.add_argument('--no-sandbox')
-        options.add_argument('--disable-dev-shm-usage')
-        options.add_argument(
-            "user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/124.0.0.0 Safari/537.36"
-        )
-
-        service = Service(ChromeDriverManager().install())
-        driver = webdriver.Chrome(options=options)
-        driver.get(url)
-
         try:
-            WebDriverWait(driver, 15).until(
-                EC.presence_of_element_located((By.CSS_SELECTOR, "table.table"))
+            # 표가 서버 HTML 에 포함돼 있으면 HTTP 만으로 추출, 아니면 브라우저 풀 사용
+            return get_page_fetcher().fetch(
+                url,
+                parse_ism_pmi_row,
+                wait_for=(By.CSS_SELECTOR, "table.table"),
+                name="ism_manufacturing_pmi",
             )
-            soup = BeautifulSoup(driver.page_source, 'html.parser')
         except Exception as e:
-            driver.quit()
-            raise Exception("❌ 페이지 로딩 실패: table 요소를 찾을 수 없습니다.") from e
-        finally:
-            driver.quit()
-
-        table = soup.find('table', class_='table table-hover')
-        if not table:
-            raise Exception("❌ 테이블을 찾을 수 없습니다.")
-
-        rows = table.find('tbody').find_all('tr')
-        for row in rows:
-            columns = row.find_all('td')
-            if len(columns) >= 5:
-                name = columns[0].get_text(strip=True)
-                if "ISM 제조업 PMI" in name:
-                    value = columns[1].get_text(strip=True)
-                    date = columns[4].get_text(strip=True)
-                    return {
-                        "지표명": name,
-                        "발표일": date,
-                        "값": value
-                    }
-
-        raise Exception("❌ 'ISM 제조업 PMI' 항목을 찾을 수 없습니다.")
+            raise Exception(f"❌ 'ISM 제조업 PMI' 항목을 찾을 수 없습니다. ({e})") from e
 
     def parse_tradingeconomics_date(self, date_str):
         # """
@@ -10,6 +10,8 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.support import expected_conditions as EC
 from bs4 import BeautifulSoup
 
+from page_fetcher import get_page_fetcher
+
 
 
 class LEIUpdater:
@@ -100,7 +102,7 @@ class LEIUpdater:
         try:
             # 웹 페이지에 GET 요청 보내기
             print(f"URL에 접속 중: {url}")
-            response = requests.get(url, headers=headers)
+            response = get_page_fetcher().http_get(url, name="us_leading_economic_index", headers=headers)
             response.raise_for_status() # HTTP 오류가 발생하면 예외 발생
 
             # BeautifulSoup으로 HTML 파싱
@@ -1,6 +1,5 @@
 import os
-import time
-from dateutil.relativedelta import relativedelta
+import warnings
 import pandas as pd
 import numpy as np
 from datetime import datetime
@@ -10,16 +9,11 @@ import matplotlib.font_manager as fm
 import matplotlib as mpl
 import matplotlib.pyplot as plt
 import seaborn as sns
-import yfinance as yf
 from bs4 import BeautifulSoup
 from scipy.stats import linregress
 from io import StringIO
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support import expected_conditions as EC
 from zoneinfo import ZoneInfo
 import streamlit as st
 
@@ -33,6 +27,37 @@ from SNP_forward_pe_updater import forwardpe_updater
 from putcall_ratio_updater import PutCallRatioUpdater
 from bullbear_spread_updater import BullBearSpreadUpdater
 from lei_updater import LEIUpdater
+from fred_client import FredClient, FRED_SERIES
+from concurrent_fetch import ConcurrentFetcher
+from series_cache import SeriesCache
+from price_store import PriceStore
+from memo import MemoStore, memoized, request_scoped
+from page_fetcher import get_page_fetcher, parse_ycharts_stats
+from data_provider import get_provider, use_provider
+from ism_pmi_updater import parse_ism_pmi_row
+from SNP_forward_pe_updater import parse_macromicro_last_value
+from alignment import align, aligned
+from pit_panel import PIT_SERIES, PointInTimePanel, release_dates
+from master_panel import MasterPanel, MASTER_PANEL_PATH, to_float64
+from derived import DERIVED_INPUTS, get_derived_graph, to_input_series
+from backtest import SIGNAL_EVENTS, EVENT_COLUMNS, run_backtest, summarize
+from sweep import SWEEP_STRATEGIES, run_sweep
+from walkforward import walk_forward
+from significance import bootstrap_significance
+from event_study import event_study, get_event_study_cache, plot_event_study
+from consensus import ConsensusMatrix, CONSENSUS_PATH, today_consensus, plot_consensus_heatmap
+from signal_ops import (
+    resolve_entry_exit, next_on_calendar, score_rate_signals, event_window_signal,
+)
+
+# ycharts Stats 패널의 'Last Value' 셀 (페이지 렌더링 완료 판단 기준)
+YCHARTS_STATS_SELECTOR = (By.XPATH, "//td[contains(normalize-space(.), 'Last Value')]")
+
+# Margin Debt / M2, LEI + PMI + 기준금리 전략이 시점 기준 패널에서 읽는 시리즈 (PIT_SERIES 이름)
+M2_MARGIN_PIT_SERIES = ("margin_m2_ratio", "margin_m2_ratio_z", "margin_m2_ratio_change_pct")
+LEI_PMI_FED_PIT_SERIES = ("LEI", "PMI", "fed_funds_6m_chg")
+# plot_sp500_with_lei_signals / decide_today_lei_signal_min 의 lag_months (호환용 인자, 넘기면 경고 후 무시)
+LAG_MONTHS_DEPRECATED = "lag_months 는 더 이상 사용하지 않습니다 (발표시차 = pit_panel.PIT_SERIES 발표 규칙)."
 
 # 한글 폰트 설정 (Windows에서는 기본적으로 'Malgun Gothic' 가능)
 mpl.rcParams['font.family'] = 'Malgun Gothic'  # 또는 'NanumGothic', 'AppleGothic' (Mac)
@@ -44,16 +69,49 @@ load_dotenv()  # .env 파일 읽어서 os.environ에 자동으로 등록
 
 
 class MacroCrawler:
-    def __init__(self):
+    def __init__(self, provider=None):
+        # 데이터 공급자 (live / record / replay / offline, 기본값은 MACRO_DATA_MODE 환경변수)
+        self.provider = use_provider(provider or get_provider())
+
         self.fred_api_key = os.environ.get("FRED_API_KEY")
         self.eia_api_key = os.environ.get("EIA_API_KEY")
         
-        if not self.fred_api_key:
-            raise ValueError("FRED_API_KEY가 환경변수에 설정되어 있지 않습니다.")
-        if not self.eia_api_key:
-            raise ValueError("EIA_API_KEY가 환경변수에 설정되어 있지 않습니다.")
-        
-        print("✅ FRED & EIA API 키 불러오기 성공")
+        if self.provider.requires_api_keys:
+            if not self.fred_api_key:
+                raise ValueError("FRED_API_KEY가 환경변수에 설정되어 있지 않습니다.")
+            if not self.eia_api_key:
+                raise ValueError("EIA_API_KEY가 환경변수에 설정되어 있지 않습니다.")
+            print("✅ FRED & EIA API 키 불러오기 성공")
+        else:
+            print(f"✅ {self.provider.name} 모드: API 키 없이 실행합니다.")
+
+        # 요청 단위 메모 저장소 (같은 요청 안의 중복 조회/계산 제거)
+        self.memo = MemoStore()
+
+        # FRED 공용 클라이언트 (커넥션 풀 재사용 + 로컬 캐시 증분 갱신)
+        self.series_cache = SeriesCache() if self.provider.use_cache else None
+        self.fred = FredClient(self.fred_api_key, session=self.provider.http_session(), cache=self.series_cache)
+        # yfinance 일봉 저장소 (스냅샷 CSV 적재 후 증분 다운로드)
+        self.price_store = PriceStore(db_path=self.provider.cache_db_path, provider=self.provider)
+        # 여러 시리즈 동시 조회용 실행기
+        self.fetcher = ConcurrentFetcher()
+        # 일별 마스터 패널 (live 외 모드는 모드별 파일)
+        if self.provider.name == "live":
+            self.master_panel = MasterPanel(MASTER_PANEL_PATH)
+        else:
+            cache_dir = os.path.dirname(self.provider.cache_db_path) or "."
+            self.master_panel = MasterPanel(os.path.join(cache_dir, f"master_panel_{self.provider.name}.parquet"))
+        # 신호 합의 행렬 (live 외 모드는 모드별 파일)
+        if self.provider.name == "live":
+            self.consensus = ConsensusMatrix(CONSENSUS_PATH)
+        else:
+            cache_dir = os.path.dirname(self.provider.cache_db_path) or "."
+            self.consensus = ConsensusMatrix(os.path.join(cache_dir, f"signal_consensus_{self.provider.name}.parquet"))
+        # 파생 시리즈 DAG (프로세스 공용, 데이터 모드별) + 롤링 통계 상태 파일
+        stats_dir = os.path.dirname(self.provider.cache_db_path) or "."
+        self.derived = get_derived_graph(
+            self.provider.name, state_path=os.path.join(stats_dir, f"rolling_stats_{self.provider.name}.json")
+        )
 
         # 마진 부채 업데이트기 연결
         self.margin_updater = MarginDebtUpdater("md_df.csv")
@@ -68,112 +126,106 @@ class MacroCrawler:
         # LEI 업데이트기 연결
         self.lei_updater = LEIUpdater("lei_data.csv")
 
-
-    # Clear 1개월 딜레이 데이터
-    def get_10years_treasury_yeild(self):
-        '''
-        FRED API : 미국 10년물 국채 수익률
+    def memo_scope(self):
         '''
+        하나의 논리적 요청(페이지 렌더링, API 호출 등) 동안 조회/계산 결과를 공유
 
-        url = 'https://api.stlouisfed.org/fred/series/observations'
-        params = {
-            'series_id' : 'GS10', # 10년물 국채 금리
-            'api_key' : self.fred_api_key,
-            'file_type' : 'json',
-            'observation_start' : '2000-01-01' # 시작일(원하는 날짜짜)
-        }
-
-        try:
-            response = requests.get(url, params= params, timeout=10)
-            response.raise_for_status() # HTTP 에러 발생 시 예외 처리
-            data = response.json()
+        사용 예:
+            with crawler.memo_scope():
+                crawler.check_today_md_signal()
+                crawler.plot_sp500_with_signals_and_graph()
+        '''
+        return self.memo.scope()
 
-            if 'observations' not in data:
-                raise ValueError(F"'observations' 키가 없음 : {data}")
+    def invalidate_memo(self, name=None):
+        '''
+        메모 결과 삭제 (name: 메서드 이름, 없으면 전체)
+        예) crawler.invalidate_memo('get_sp500')
+        '''
+        self.memo.invalidate(name)
 
-            # 데이터프레임 변환
-            df = pd.DataFrame(data['observations'])
-            df['date'] = pd.to_datetime(df['date'])
-            df['value'] = pd.to_numeric(df['value'], errors= 'coerce')
+    @request_scoped
+    def fetch_many(self, series_ids):
+        '''
+        FRED series_id / yfinance 티커 / 로컬 CSV 를 동시에 조회
 
-            return df
-        
-        except Exception as e:
-            print(f"[ERROR] FRED API 호출 실패 : {e}")
-            return pd.DataFrame()
+        Parameters:
+            series_ids (list): 예) ['GS10', 'GS2', '^GSPC', 'md_df.csv']
 
-    # Clear - 1개월 딜레이 데이터    
-    def get_2years_treasury_yeild(self):
-        url = 'https://api.stlouisfed.org/fred/series/observations'
-        params = {
-            'series_id' : 'GS2', # 2년물 국채 금리
-            'api_key' : self.fred_api_key,
-            'file_type' : 'json',
-            'observation_start' : '2000-01-01' # 시작일(원하는 날짜짜)
+        Returns:
+            dict: {series_id: DataFrame} (각 값은 해당 get_* 메서드 반환 형태와 동일)
+        '''
+        price_tickers = {
+            '^GSPC': self.get_sp500,
+            '^VIX': self.get_vix_index,
+            'HG=F': self.get_copper_price_F,
+            'GC=F': self.get_gold_price_F,
+            'CL=F': self.get_oil_price_F,
         }
 
-        try:
-            response = requests.get(url, params= params, timeout=10)
-            response.raise_for_status() # HTTP 에러 발생 시 예외 처리
-            data = response.json()
+        jobs = {}
+        price_keys = []
+        for key in series_ids:
+            if key in FRED_SERIES:
+                jobs[key] = ('api.stlouisfed.org', lambda k=key: self.get_fred_series(k))
+            elif key in price_tickers:
+                price_keys.append(key)
+            elif str(key).endswith('.csv'):
+                jobs[key] = ('local', lambda k=key: pd.read_csv(k))
+            else:
+                raise ValueError(f"알 수 없는 series_id 입니다: {key}")
 
-            if 'observations' not in data:
-                raise ValueError(F"'observations' 키가 없음 : {data}") 
+        # 가격 티커는 한 번의 yf.download 로 갱신한 뒤 각 get_* 반환 형태로 변환
+        def load_prices():
+            self.price_store.update(price_keys)
+            return {k: price_tickers[k]() for k in price_keys}
 
-            # 데이터프레임 변환
-            df = pd.DataFrame(data['observations'])
-            df['date'] = pd.to_datetime(df['date'])
-            df['value'] = pd.to_numeric(df['value'], errors= 'coerce')
+        if price_keys:
+            jobs['__prices__'] = ('query2.finance.yahoo.com', load_prices)
 
+        results = self.fetcher.run(jobs)
+        prices = results.pop('__prices__', {})
+        if not isinstance(prices, dict):
+            prices = {}
 
-            return df
-        
-        except Exception as e:
-            print(f"[ERROR] FRED API 호출 실패 : {e}")
-            return pd.DataFrame()
-
-    # Clear - 1개월 딜레이 데이터     
-    def get_cpi(self):
-        url = 'https://api.stlouisfed.org/fred/series/observations'
-        params = {
-            'series_id': 'CPIAUCSL',  # CPI
-            'api_key': self.fred_api_key,
-            'file_type': 'json',
-            'observation_start': '1999-01-01'
-        }
-        
-        try:
-            response = requests.get(url, params=params, timeout=10)
-            response.raise_for_status()
-            data = response.json()
-        except Exception as e:
-            print("❌ API 요청 또는 JSON 파싱 실패:", e)
-            print("📦 응답 내용:", response.text)
-            return pd.DataFrame()
+        return {k: results[k] if k in results else prices.get(k, pd.DataFrame()) for k in series_ids}
 
-        if 'observations' not in data:
-            print("❌ 'observations' 키 없음. 응답 내용:", data)
-            return pd.DataFrame()
+    @memoized
+    def get_fred_series(self, series_id):
+        '''
+        FRED series 조회 (같은 요청 안에서는 한 번만 호출)
+        '''
+        return self.fred.get_series(series_id)
 
-        if not data['observations']:
-            print("❌ observations 리스트 비어있음:", data)
-            return pd.DataFrame()
 
-        df = pd.DataFrame(data['observations'])
+    # Clear 1개월 딜레이 데이터
+    def get_10years_treasury_yeild(self):
+        '''
+        FRED API : 미국 10년물 국채 수익률
+        '''
+        return self.get_fred_series('GS10')
 
-        if 'date' not in df.columns:
-            print("❌ 'date' 컬럼이 존재하지 않음. df.columns:", df.columns)
-            return pd.DataFrame()
+    # Clear - 1개월 딜레이 데이터    
+    def get_2years_treasury_yeild(self):
+        return self.get_fred_series('GS2')
 
-        df['date'] = pd.to_datetime(df['date'])
-        df['value'] = pd.to_numeric(df['value'], errors='coerce')
+    # Clear - 1개월 딜레이 데이터     
+    @memoized
+    def get_cpi(self):
+        df = self.get_fred_series('CPIAUCSL')
+        if df.empty:
+            return df
 
-        df.to_csv("cpi_data.csv", encoding='utf-8-sig')
+        if self.provider.updates_local_files:
+            df.to_csv("cpi_data.csv", encoding='utf-8-sig')
 
         return df
-    
-    def get_cpi_yoy(self):
-        df = self.get_cpi() # 원래 CPIAUCSL 지수 불러오기
+
+    @memoized
+    def get_cpi_yoy(self, df=None):
+        if df is None:
+            # 파생 시리즈 DAG (CPIAUCSL → 12개월 전 대비 변화율)
+            return self.get_derived_frame('cpi', 'cpi_yoy').rename(columns={'cpi': 'value', 'cpi_yoy': 'CPI YOY(%)'})
         df = df.sort_values('date').dropna()
 
         df['CPI YOY(%)'] = df['value'].pct_change(periods=12)*100 # 12개월 전 대비 변화율
@@ -181,38 +233,23 @@ class MacroCrawler:
     
     # Clear - 1개월 딜레이 데이터  
     def get_m2(self) : 
-        url = 'https://api.stlouisfed.org/fred/series/observations'
-        params = {
-            'series_id': 'M2SL',  # M2 통화량
-            'api_key': self.fred_api_key,
-            'file_type': 'json',
-            'observation_start': '2000-01-01'
-        }
-        try:
-            response = requests.get(url, params=params)
-            data = response.json()
-        except Exception as e:
-            print("❌ API 요청 또는 JSON 파싱 실패:", e)
-            print("📦 응답 내용:", response.text)
-            return pd.DataFrame()
-        
-        df = pd.DataFrame(data['observations'])
-        df['date'] = pd.to_datetime(df['date'])
-        df['value'] = pd.to_numeric(df['value'], errors='coerce')
-        return df
-    
+        return self.get_fred_series('M2SL')
+
   
+    @memoized
     def get_m2_yoy(self):
-        df = self.get_m2()
-        df = df.sort_values('date')
-        df['m2_yoy'] = df['value'].pct_change(periods=12) * 100
-        return df[['date', 'm2_yoy']]
+        return self.get_derived('m2_yoy')
 
     # Clear 1개월 딜레이 데이터
+    @memoized
     def update_margin_debt_data(self):
         '''
         로컬에 저장된 margin_debt 파일 불러오기
         '''
+        # live 모드가 아니면 네트워크 갱신 없이 저장된 CSV 그대로 사용
+        if not self.provider.updates_local_files:
+            return self.margin_updater.df
+
         try:
             md_df = self.margin_updater.update_csv()
             print("✅ 마진 부채 CSV 업데이트 완료")
@@ -282,6 +319,7 @@ class MacroCrawler:
 
     
     # Clear  
+    @memoized
     def get_margin_yoy_change(self):
         '''
         마진 부채의 전년 대비 YOY (%) 변화율 계산
@@ -295,12 +333,13 @@ class MacroCrawler:
         df["margin_debt_clean"] = df["margin_debt"].astype(str).str.replace(',', '', regex=False)
         df["margin_debt"] = pd.to_numeric(df["margin_debt_clean"], errors="coerce").fillna(0).astype(int)
         df = df.drop(columns=["margin_debt_clean"])
-        df["Margin YoY (%)"] = df["margin_debt"].pct_change(periods=12) * 100
+        df["Margin YoY (%)"] = df["Month/Year"].map(self.get_derived('margin_yoy').set_index('date')['margin_yoy'])
         return df[["Month/Year", "margin_debt", "Margin YoY (%)"]]
 
 
     ## 유동성 관련
     # Clear
+    @memoized
     def generate_zscore_trend_signals(self):
         """
         Margin Debt / M2 비율의 z-score 및 추세 조건 기반 전략
@@ -313,131 +352,469 @@ class MacroCrawler:
             - z-score > 1.5
             - 비율이 전월 대비 -5% 이상 급락
 
-        실제 매매는 신호일 기준 +2개월 후 진입
+        실제 매매는 발표일(release_date, 다음 달 25일) 이후 첫 월초에 진입 (= 신호월 +2개월)
         수익률은 진입일부터 3개월 후까지의 S&P500 종가 기준
 
-        Parameters:
-            df : DataFrame with 'date', 'm2', 'margin_debt', 'sp500_close' columns
+        z-score / 전월 대비 변화율은 파생 시리즈 DAG 값 (비율 전체 이력 기준 36개월 롤링)
+        - 차트 / 오늘 신호 / 발표일 신호와 같은 값
+        - 기존 병합표(2000년~) 기준 롤링과는 비율 이력이 병합 구간보다 길 때만 초반 36개월이 다름
+          (저장소 스냅샷은 둘 다 2000-01 시작 → tests/test_margin_signals.py 에서 동일 확인)
 
         Returns:
             DataFrame with signal type, signal date, action date, and 3-month return
         """
         df = self.merge_m2_margin_sp500_abs()
         df = df.sort_values("date").copy()
-        df["ratio"] = df["margin_debt"] / df["m2"]
-        df["ratio_z"] = (df["ratio"] - df["ratio"].rolling(window=36, min_periods=12).mean()) / \
-                        df["ratio"].rolling(window=36, min_periods=12).std()
-        df["ratio_change_pct"] = df["ratio"].pct_change() * 100
+        derived = self.get_derived_frame("margin_m2_ratio_z", "margin_m2_ratio_change_pct").set_index("date")
+        df["ratio_z"] = df["date"].map(derived["margin_m2_ratio_z"])
+        df["ratio_change_pct"] = df["date"].map(derived["margin_m2_ratio_change_pct"])
 
         # 신호 정의
         df["buy_signal"] = (df["ratio_z"] < -1.2) & (df["ratio_change_pct"] > 0)
         df["sell_signal"] = (df["ratio_z"] > 1.5) & (df["ratio_change_pct"] < -5)
 
-        results = []
-        for idx, row in df.iterrows():
-            if row["buy_signal"] or row["sell_signal"]:
-                signal = "BUY" if row["buy_signal"] else "SELL"
-                signal_date = row["date"]
-                action_date = signal_date + relativedelta(months=2)
-
-                future_df = df[df["date"] >= action_date].reset_index(drop=True)
-                if len(future_df) < 3:
-                    continue
-
-                entry_price = future_df.loc[0, "sp500_close"]
-                exit_price = future_df.loc[2, "sp500_close"]
-                return_pct = (exit_price - entry_price) / entry_price
-
-                results.append({
-                    "signal": signal,
-                    "original_signal_date": signal_date,
-                    "action_date": future_df.loc[0, "date"],
-                    "return_3m": return_pct
-                })
+        # 발표일 이후 첫 행(월초)에서 진입, 2행(개월) 뒤 청산
+        trades = resolve_entry_exit(df, df["buy_signal"] | df["sell_signal"],
+                                    hold=2, available_col="release_date")
+        is_buy = df["buy_signal"].to_numpy()[trades["signal_pos"].to_numpy()]
+        results = pd.DataFrame({
+            "signal": np.where(is_buy, "BUY", "SELL"),
+            "original_signal_date": trades["signal_date"],
+            "action_date": trades["action_date"],
+            "return_3m": trades["return_pct"],
+        })
 
-        return pd.DataFrame(results)
+        return results
     
     # Clear
+    @memoized
     def generate_mdyoy_signals(self):
         '''
-        Margin Debt YoY 전략 기반 매수/매도 신호 생성 함수 (2개월 발표 지연 반영)
+        Margin Debt YoY 전략 기반 매수/매도 신호 생성 함수 (발표 지연 반영)
         df : 병합된 데이터프레임(merge_m2_margin_sp500_abs)
+        action_date : 발표일(release_date, 다음 달 25일) 이후 첫 월초 (= 신호월 +2개월)
         '''
 
         df = self.merge_m2_margin_sp500_abs()
         df = df.copy()
-        df["margin_yoy"] = df["margin_debt"].pct_change(periods=12) * 100
+        df["margin_yoy"] = df["date"].map(self.get_derived('margin_yoy').set_index('date')['margin_yoy'])
+        # 병합 구간 시작 후 12개월 동안은 YoY 없음 (기존 병합표 기준 pct_change(12) 와 같은 워밍업)
+        warmup_end = df["date"].min() + pd.DateOffset(months=12)
+        df.loc[df["date"] < warmup_end, "margin_yoy"] = np.nan
 
         # 신호 조건
         df["buy_signal"] = (df["margin_yoy"] > 0) & (df["margin_yoy"].shift(1) <= 0)
         df["sell_signal"] = (df["margin_yoy"] < -10) & (df["margin_yoy"].shift(1) >= -10)
 
-        # 발표 지연 감안한 진입 시점 계산
+        # 발표 지연 감안한 진입 시점 계산 (발표일 이후 첫 월초)
         df["signal_date"] = df["date"]
-        df["action_date"] = df["signal_date"] + pd.DateOffset(months=2)
+        df["release_date"] = release_dates(df["date"], PIT_SERIES["margin_yoy"]["release"])
+        df["action_date"] = df["release_date"] + pd.offsets.MonthBegin(0)
 
         return df
 
     # Clear - 실시간 데이터
+    @memoized
     def get_sp500(self):
         '''
         S&P500 지수 조회
         '''
   
-        ticker = '^GSPC'
-        df = yf.download(ticker, start='2000-01-01', interval="1d", progress=False )
-        # 인덱스를 컬럼으로 변환
-        df = df.reset_index()
-
-        # 멀티인덱스 컬럼 --> 단일 컬럼으로 변환
-        df.columns = [col[0] if isinstance(col,tuple) else col for col in df.columns]
+        df = self.price_store.get('^GSPC')
 
         # 컬럼명 정리
-        df = df.rename(columns={'Date': 'date', 'Close': 'sp500_close'})
+        df = df.rename(columns={'close': 'sp500_close'})
         
         # 월 단위로 맞춰주기 (Period → Timestamp)
         df['date'] = pd.to_datetime(df['date']) #dt.to_period('M').dt.to_timestamp()
 
         # 필요한 컬럼만 반환
         df = df[['date', 'sp500_close']]
-        
+
 
         return df
 
+    @memoized
+    def get_pit_panel(self, *names):
+        '''
+        시점 기준 매크로 패널 (PIT_SERIES 의 발표 규칙 적용, 일별 캘린더 = S&P500 거래일)
+        - names 를 주면 그 시리즈만 (조회 실패 시 예외 - 신호 계산용)
+        - 없으면 전체 시리즈, 조회 실패한 시리즈는 제외하고 나머지로 생성
+        '''
+        try:
+            calendar = self.get_sp500()['date']
+        except Exception as e:
+            print(f"⚠️ S&P500 거래일 캘린더 조회 실패 : {e}")
+            calendar = None
+
+        panel = PointInTimePanel(calendar=calendar)
+        for name in names or PIT_SERIES:
+            spec = PIT_SERIES[name]
+            try:
+                panel.add(name, getattr(self, spec['loader'])(*spec.get('args', ())))
+            except Exception as e:
+                if names:
+                    raise
+                print(f"⚠️ 시점 기준 패널에서 {name} 제외 : {e}")
+        return panel
+
+    def get_known_values(self, date=None, names=()):
+        '''
+        date(기본 오늘) 시점에 공개돼 있던 최신 값 / 관측월 / 공개일 (names 가 없으면 전체 시리즈)
+        '''
+        return self.get_pit_panel(*names).as_of(date)
+
+    def refresh_master_panel(self):
+        '''
+        전체 시리즈 조회 → 일별 마스터 패널 Parquet 재생성
+        '''
+        return self.master_panel.refresh(self)
+
+    def get_master_panel(self, columns=None, start=None, end=None, ffill=True, refresh=False):
+        '''
+        일별 마스터 패널에서 필요한 컬럼/구간만 읽기
+        - 파일이 없거나 MASTER_PANEL_TTL 이 지났으면 먼저 재생성
+        - 재생성에 실패해도 이전 파일이 있으면 그대로 사용
+
+        Parameters:
+            columns (list): MASTER_PANEL_SERIES 컬럼 이름 (없으면 전체)
+            start, end: 날짜 구간 (포함)
+            ffill (bool): True 면 월별/주별 지표를 직전 관측값으로 채움
+            refresh (bool): True 면 신선도와 관계없이 재생성
+        '''
+        if refresh or not self.master_panel.is_fresh():
+            try:
+                self.refresh_master_panel()
+            except Exception as e:
+                if self.master_panel.built_at() is None:
+                    raise
+                print(f"⚠️ 마스터 패널 재생성 실패 → {self.master_panel.built_at()} 생성본 사용 : {e}")
+        return self.master_panel.load(columns=columns, start=start, end=end, ffill=ffill)
+
+    @memoized
+    def get_master_series(self, column, start=None, end=None):
+        '''
+        마스터 패널의 한 컬럼 → 관측값이 있는 날만 (date, column, 값은 to_float64 로 복원한 float64)
+        '''
+        df = self.get_master_panel([column], start=start, end=end, ffill=False).dropna()
+        df[column] = to_float64(df[column])
+        return df.reset_index()
+
+    @memoized
+    def get_master_monthly(self, *columns):
+        '''
+        마스터 패널 컬럼 → 월별 (date = 해당 월 1일, 각 컬럼의 그 달 첫 관측값, 값은 float64 로 복원)
+        - 월별 지표는 그 달 관측값, S&P500 은 월초 첫 거래일 종가 (get_sp500_aligned 와 같은 규칙)
+        - 어느 컬럼에도 값이 없는 달은 제외
+        '''
+        df = self.get_master_panel(list(columns), ffill=False)
+        df = df.groupby(df.index.to_period('M')).first().dropna(how='all')
+        out = pd.DataFrame({'date': df.index.to_timestamp()})
+        for column in columns:
+            out[column] = to_float64(df[column])
+        return out
+
+    def refresh_consensus_matrix(self):
+        '''
+        전체 거래일 × 전략 신호 합의 행렬 Parquet 재생성 (consensus 참고)
+        '''
+        return self.consensus.refresh(self)
+
+    def get_consensus_matrix(self, start=None, end=None, refresh=False):
+        '''
+        신호 합의 행렬 (거래일 × 전략 int8 코드 BUY=1 / HOLD=0 / SELL=-1 + consensus)
+        - 파일이 없거나 CONSENSUS_TTL 이 지났으면 먼저 재생성
+        - 재생성에 실패해도 이전 파일이 있으면 그대로 사용
+        '''
+        if refresh or not self.consensus.is_fresh():
+            try:
+                self.refresh_consensus_matrix()
+            except Exception as e:
+                if self.consensus.built_at() is None:
+                    raise
+                print(f"⚠️ 합의 행렬 재생성 실패 → {self.consensus.built_at()} 생성본 사용 : {e}")
+        return self.consensus.load(start=start, end=end)
+
+    def get_today_consensus(self):
+        '''
+        합의 행렬 마지막 거래일 → 전략별 BUY/HOLD/SELL + consensus
+        '''
+        return today_consensus(self.get_consensus_matrix())
+
+    def plot_consensus_heatmap(self, days=250, save_to=None):
+        '''
+        최근 days 거래일 전략별 신호 히트맵
+        '''
+        fig = plot_consensus_heatmap(self.get_consensus_matrix(), days=days)
+        if save_to:
+            fig.savefig(save_to, dpi=150)
+        return fig
+
+    def sync_derived_inputs(self, names=None):
+        '''
+        파생 시리즈 원자료 다시 읽기 → 바뀐 원자료의 하위 노드만 꼬리 구간 재계산
+
+        Parameters:
+            names (list): 필요한 파생/원자료 이름 (없으면 전체)
+        '''
+        inputs = self.derived.inputs_of(names)
+        with self.memo_scope():
+            fetch_ids = [DERIVED_INPUTS[name]['fetch'] for name in inputs if 'fetch' in DERIVED_INPUTS[name]]
+            if len(fetch_ids) > 1:
+                self.fetch_many(fetch_ids)   # 동시 조회로 메모 채우기
+
+            for name in inputs:
+                spec = DERIVED_INPUTS[name]
+                try:
+                    df = getattr(self, spec['loader'])()
+                    self.derived.set_input(name, to_input_series(df, spec))
+                except Exception as e:
+                    print(f"⚠️ 파생 시리즈 원자료 {name} 갱신 실패 → 이전 값 사용 : {e}")
+
+    @memoized
+    def get_derived(self, name):
+        '''
+        파생 시리즈 (date, name) - derived.DERIVED_SERIES 참고
+        '''
+        return self.get_derived_frame(name)
+
+    @memoized
+    def get_derived_frame(self, *names):
+        '''
+        여러 원자료/파생 시리즈 → date + names (모든 시리즈에 있는 날짜만)
+        '''
+        self.sync_derived_inputs(list(names))
+        return self.derived.frame(names)
+
+    @memoized
+    def get_signal_events(self, strategy):
+        '''
+        전략 신호 → 이벤트 테이블 (date, signal, strategy) - backtest.SIGNAL_EVENTS 참고
+        '''
+        if strategy not in SIGNAL_EVENTS:
+            raise ValueError(f"알 수 없는 전략입니다: {strategy} (가능: {list(SIGNAL_EVENTS)})")
+        events = SIGNAL_EVENTS[strategy](self)
+        events['strategy'] = strategy
+        return events[EVENT_COLUMNS]
+
+    @request_scoped
+    def backtest_signals(self, strategies=None, horizons=None, n_draws=None, seed=None):
+        '''
+        여러 전략 신호를 S&P500 일별 종가로 한 번에 백테스트
+
+        Parameters:
+            strategies (list): SIGNAL_EVENTS 이름 (없으면 전체, 신호 조회 실패한 전략은 제외)
+            horizons (list): 보유기간 ('1W', '1M', '3M', '6M', '12M', 없으면 전체)
+            n_draws (int): 지정하면 무작위 진입 부트스트랩 유의성도 계산 (significance 참고)
+            seed (int): 부트스트랩 난수 시드
+
+        Returns:
+            dict: {'trades': 이벤트별 성과, 'summary': 전략 × 신호 × 보유기간 요약
+                   [, 'significance': 무작위 진입 대비 p-value]}
+        '''
+        frames = []
+        for strategy in strategies or SIGNAL_EVENTS:
+            try:
+                frames.append(self.get_signal_events(strategy))
+            except Exception as e:
+                print(f"⚠️ 백테스트에서 {strategy} 제외 : {e}")
+
+        events = pd.concat(frames, ignore_index=True) if frames else pd.DataFrame(columns=EVENT_COLUMNS)
+        result = run_backtest(events, self.get_sp500(), horizons=horizons)
+        if n_draws:
+            result['significance'] = bootstrap_significance(
+                result['trades'], self.get_sp500(), horizons=horizons, n_draws=n_draws, seed=seed
+            )
+        return result
+
+    def sweep_strategy(self, strategy, grid=None, horizons=None, workers=None,
+                       rank_by='mean_pnl_3M', min_events=5, save_to=None):
+        '''
+        전략 임계치/파라미터 그리드 스윕 → 순위표 (CSV 저장)
+        - 원자료와 S&P500 은 여기서 한 번만 조회하고 워커에는 읽기 전용으로 전달 (sweep.SWEEP_STRATEGIES 참고)
+
+        Parameters:
+            strategy (str): SWEEP_STRATEGIES 이름
+            grid (dict): 파라미터 → 후보 값 리스트 (없으면 기본 그리드)
+            horizons (list): 보유기간 ('1W', '1M', '3M', '6M', '12M', 없으면 전체)
+            workers (int): 프로세스 수 (없으면 CPU 수)
+            rank_by (str): 순위 기준 (예: mean_pnl_3M, hit_rate_6M)
+            min_events (int): 순위에 넣을 최소 이벤트 수
+            save_to (str): 결과 CSV 경로 (없으면 캐시 폴더의 sweep_<strategy>.csv)
+        '''
+        if strategy not in SWEEP_STRATEGIES:
+            raise ValueError(f"알 수 없는 스윕 전략입니다: {strategy} (가능: {list(SWEEP_STRATEGIES)})")
+
+        with self.memo_scope():
+            data = SWEEP_STRATEGIES[strategy]['data'](self)
+            prices = self.get_sp500()
+
+        results = run_sweep(strategy, data, prices, grid=grid, horizons=horizons, workers=workers,
+                            rank_by=rank_by, min_events=min_events)
+
+        save_to = save_to or os.path.join(os.path.dirname(self.provider.cache_db_path) or ".", f"sweep_{strategy}.csv")
+        results.to_csv(save_to, index=False)
+        print(f"✅ 스윕 결과 저장 → {save_to}")
+        return results
+
+    def walk_forward_signals(self, strategies=None, grid=None, train_months=60, test_months=1, step_months=None,
+                             rank_by='mean_pnl_3M', min_events=5, horizons=None, workers=None):
+        '''
+        전략별 워크포워드 (학습 구간마다 파라미터 재선택 → 검증 구간 신호만 이어 붙여 백테스트)
+
+        Parameters:
+            strategies (list): SWEEP_STRATEGIES 이름 (없으면 전체, 실패한 전략은 제외)
+            grid (dict): 파라미터 그리드 (전략 하나일 때만, 없으면 전략별 기본 그리드)
+            train_months, test_months, step_months (int): 학습 / 검증 / 이동 간격 (개월)
+            rank_by (str): 학습 구간 선택 기준 (mean_pnl_<h> / hit_rate_<h>)
+
+        Returns:
+            dict: {'folds': 전략 × 폴드별 선택 파라미터, 'trades': 검증 구간 이벤트 성과, 'summary': 요약}
+        '''
+        strategies = strategies or list(SWEEP_STRATEGIES)
+        if grid is not None and len(strategies) > 1:
+            raise ValueError("grid 는 전략 하나를 지정했을 때만 사용할 수 있습니다.")
+
+        with self.memo_scope():
+            prices = self.get_sp500()
+            folds, trades = [], []
+            for strategy in strategies:
+                try:
+                    data = SWEEP_STRATEGIES[strategy]['data'](self)
+                    result = walk_forward(strategy, data, prices, grid=grid, train_months=train_months,
+                                          test_months=test_months, step_months=step_months, rank_by=rank_by,
+                                          min_events=min_events, horizons=horizons, workers=workers)
+                except Exception as e:
+                    print(f"⚠️ 워크포워드에서 {strategy} 제외 : {e}")
+                    continue
+                for key, frames in (('folds', folds), ('trades', trades)):
+                    result[key].insert(0, 'strategy', strategy)
+                    frames.append(result[key])
+
+        if not trades:
+            raise ValueError("워크포워드를 계산한 전략이 없습니다.")
+        trades = pd.concat(trades, ignore_index=True)
+        return {
+            'folds': pd.concat(folds, ignore_index=True),
+            'trades': trades,
+            'summary': summarize(trades, horizons),
+        }
+
+    def data_version(self):
+        '''
+        원자료 버전 = FRED 캐시 / 가격 저장소 DB + 업데이터 CSV 파일의 수정 시각
+        - 증분 조회나 CSV 업데이트로 원자료가 바뀌면 달라짐 (신호를 만들지 않고 확인 가능한 캐시 키)
+        '''
+        paths = [self.price_store.db_path]
+        if self.series_cache is not None:
+            paths.append(self.series_cache.db_path)
+        paths += [updater.csv_path for updater in (
+            self.margin_updater, self.pmi_updater, self.snp_forwardpe_updater,
+            self.put_call_ratio_updater, self.bull_bear_spread_updater, self.lei_updater,
+        )]
+        return tuple(os.path.getmtime(p) if os.path.exists(p) else None for p in paths)
+
+    def get_event_study(self, strategy, params=None, before=20, after=60):
+        '''
+        전략 신호일 전후 S&P500 경로 통계 (평균 / 중앙값 / 분위수, event_study 참고)
+        - params 가 없으면 SIGNAL_EVENTS 의 현재 규칙, 있으면 SWEEP_STRATEGIES 이벤트 함수에 기본값 대신 사용
+        - (전략, 파라미터, 구간, 원자료 버전) 이 같으면 신호 생성부터 다시 하지 않음
+        '''
+        if params and strategy not in SWEEP_STRATEGIES:
+            raise ValueError(f"파라미터를 바꿀 수 없는 전략입니다: {strategy} (가능: {list(SWEEP_STRATEGIES)})")
+        if not params and strategy not in SIGNAL_EVENTS:
+            raise ValueError(f"알 수 없는 전략입니다: {strategy} (가능: {list(SIGNAL_EVENTS)})")
+
+        def compute():
+            with self.memo_scope():
+                if params:
+                    spec = SWEEP_STRATEGIES[strategy]
+                    events = spec['events'](spec['data'](self), **{**spec['defaults'], **params})
+                    events['strategy'] = strategy
+                else:
+                    events = self.get_signal_events(strategy)
+                return event_study(events, self.get_sp500(), before=before, after=after)
+
+        def make_key():
+            return (strategy, tuple(sorted((params or {}).items())), before, after, self.data_version())
+
+        return get_event_study_cache().get(make_key, compute)
+
+    @request_scoped
+    def plot_event_study(self, strategy, params=None, before=20, after=60, save_to=None):
+        '''
+        전략 신호별 이벤트 스터디 그래프
+
+        Returns
+        -------
+        fig : matplotlib.figure.Figure
+        study : pd.DataFrame  # signal, offset, count, mean, median, q10, q25, q75, q90
+        '''
+        study = self.get_event_study(strategy, params=params, before=before, after=after)
+        if study.empty:
+            raise ValueError(f"{strategy} 신호 이벤트가 없습니다.")
+        fig = plot_event_study(study, title=f"{strategy} : S&P500 path around signals")
+        if save_to:
+            fig.savefig(save_to, dpi=150)
+        return fig, study
+
+    @memoized
+    def get_sp500_aligned(self, freq='M', how='first'):
+        '''
+        S&P500 일별 종가 → 월/주/분기 대표값 (date = 구간 시작일, sp500_close)
+        - 기본값: 각 월 첫 거래일 종가를 해당 월 1일 라벨로
+        - 같은 가격 이력이면 프로세스 안에서 한 번만 계산 (alignment 공용 캐시)
+        '''
+        return aligned('^GSPC', self.get_sp500(), freq=freq, how=how, value_cols=['sp500_close'])
+
     
     # Clear + 디버깅 코드 삭제
+    @memoized
     def merge_m2_margin_sp500_abs(self):
         '''
-        M2, margin_debt, S&P500 지수 데이터프레임 병합
+        M2, margin_debt, S&P500 지수 월별 병합 (마스터 패널 월별 슬라이스, 세 값이 모두 있는 달만)
+        - S&P500 은 각 월의 첫 거래일 종가 (날짜는 해당 월 1일)
         '''
+        df = self.get_master_monthly('m2', 'margin_debt', 'sp500_close').dropna().reset_index(drop=True)
+        df["ratio"] = df["margin_debt"] / df["m2"]
+        # 그 달 값이 공개되는 날 (PIT_SERIES 발표 규칙, 다음 달 25일) → 신호는 이 날 이후 첫 월초에 사용
+        df["release_date"] = release_dates(df["date"], PIT_SERIES["margin_m2_ratio"]["release"])
+        return df
+ 
+    @memoized
+    def get_m2_margin_release_signals(self):
+        """
+        Margin Debt / M2 발표분(관측월)별 신호 테이블 - 시점 기준 패널 (PIT_SERIES 발표 규칙)
 
-        df_m2 = self.get_m2().copy()
-        df_m2['date'] = df_m2['date'].dt.to_period('M').dt.to_timestamp()
-        df_m2 = df_m2.rename(columns={'value' : 'm2'})
+        - release_date   : 발표일 (다음 달 25일)
+        - effective_date : 발표 후 첫 거래일 = 주문일 (거래일 캘린더 밖이면 NaT)
+        - 매수 : z-score < -1.2 & 전월 대비 상승 / 매도 : 전월 대비 -7% 미만
 
-        df_margin = self.get_margin_yoy_change().copy()
-        df_margin['date'] = df_margin['Month/Year'].dt.to_period('M').dt.to_timestamp()
+        Returns:
+            DataFrame: month_start, release_date, effective_date, ratio, ratio_z, ratio_change_pct,
+                       buy_signal, sell_signal (발표일 순)
+        """
+        panel = self.get_pit_panel(*M2_MARGIN_PIT_SERIES)
+        m_month = panel.releases("margin_m2_ratio").rename(
+            columns={"observed": "month_start", "released": "release_date", "value": "ratio"}
+        )
 
-        df_sp500 = self.get_sp500().copy()
-        df_sp500['date'] = pd.to_datetime(df_sp500['date'])  # 혹시 모르니 안전하게
-        df_sp500['month'] =  df_sp500['date'].dt.to_period('M').dt.to_timestamp()
+        # 발표일 시점에 알 수 있었던 z-score / 전월비 (같은 관측월 값만 사용)
+        known = panel.known_at(m_month["release_date"], list(M2_MARGIN_PIT_SERIES[1:]))
+        same_month = m_month["month_start"].to_numpy()
+        for name, column in (("margin_m2_ratio_z", "ratio_z"), ("margin_m2_ratio_change_pct", "ratio_change_pct")):
+            matched = known[f"{name}_observed"].to_numpy() == same_month
+            m_month[column] = np.where(matched, known[name].to_numpy(), np.nan)
 
-        # 각 월의 첫 번째 날짜에 해당하는 S&P500 값만 추출
-        sp_monthly_first = df_sp500.sort_values('date').groupby('month').first().reset_index()
+        m_month["buy_signal"]  = (m_month["ratio_z"] < -1.2) & (m_month["ratio_change_pct"] > 0)
+        m_month["sell_signal"] = (m_month["ratio_change_pct"] < -7)
+        m_month["effective_date"] = next_on_calendar(panel.calendar, m_month["release_date"])
 
-        # ✅ 기존 'date' 컬럼 제거 (중복 방지)
-        sp_monthly_first = sp_monthly_first.drop(columns=['date'])
-        
-        # ✅ 날짜를 해당 월의 1일로 바꿔줌
-        sp_monthly_first = sp_monthly_first.rename(columns={'month': 'date'})
-        sp_monthly_first = sp_monthly_first[["date", "sp500_close"]]
+        return m_month[["month_start", "release_date", "effective_date", "ratio", "ratio_z", "ratio_change_pct",
+                        "buy_signal", "sell_signal"]].reset_index(drop=True)
 
-        df = pd.merge(df_m2, df_margin[['date', 'margin_debt']], on='date', how='inner')
-        df = pd.merge(df, sp_monthly_first, on='date', how='inner')
-        df["ratio"] = df["margin_debt"] / df["m2"]   # ← 이 줄 추가
-        return df
- 
     # Clear
+    @request_scoped
     def plot_sp500_with_signals_and_graph(self, save_to=None):
         """
         S&P500 종가 + Margin Debt/M2 비율 + 발표시차(다음달 25일) 반영 신호 시각화
@@ -451,123 +828,25 @@ class MacroCrawler:
         import pandas as pd
         import matplotlib.pyplot as plt
 
-        # 1) 원자료 병합 (일단 일별 S&P500과 월별 지표가 함께 들어있는 df라 가정)
-        df = self.merge_m2_margin_sp500_abs().copy()
-        df["date"] = pd.to_datetime(df["date"])
-        df = df.sort_values("date")
-
-        # ---- 월별 테이블 만들기 (각 월 1일 기준) ----
-        # margin_debt, m2는 월별이므로 월 초 기준으로 대표값을 하나 뽑아온다.
-        # (여기서는 해당 월의 첫 값 사용; 필요시 last/mean으로 바꿀 수 있음)
-        # m_month = (
-        #     df.loc[:, ["date", "margin_debt", "m2"]]
-        #     .dropna(subset=["margin_debt", "m2"])
-        #     .copy()
-        # )
-        # m_month["month"] = m_month["date"].values.astype("datetime64[M]")  # 월 단위로 버킷팅 (MS)
-        # m_month = (
-        #     m_month.sort_values(["month", "date"])
-        #         .groupby("month", as_index=False)
-        #         .first()[["month", "margin_debt", "m2"]]
-        # )
-        # m_month = m_month.rename(columns={"month": "month_start"})  # 월 초(예: 2025-07-01)
-
-        m_src = (
-        df.loc[:, ["date", "margin_debt", "m2"]]
-        .dropna(subset=["margin_debt", "m2"])
-        .copy()
-        )
-
-        # 월초 라벨로 그룹핑하고 '그 달의 마지막 관측값'을 사용
-        monthly = (
-            m_src.set_index("date")
-                .groupby(pd.Grouper(freq="MS"))
-                .last()                # 그 달 말일 시점의 '알고 있던' 값
-                .dropna()
-                .reset_index()
-        )
-
-        # ★ 핵심: 이 값은 '이전 월'의 경제지표이므로 월 라벨을 1개월 뒤로 당겨서(−1M) 실제 기준월로 맞춤
-        # monthly["month_start"] = (monthly["date"] - pd.offsets.MonthBegin(1))
-        monthly["month_start"] = monthly["date"]
-                                  
-        m_month = (
-            monthly[["month_start", "margin_debt", "m2"]]
-                .sort_values("month_start")
-                .reset_index(drop=True)
-        )
-
-        # 2) 월별 비율 및 z-score 계산 (36개월 롤링)
-        m_month["ratio"] = m_month["margin_debt"] / m_month["m2"]
-        m_month["ratio_ma"] = m_month["ratio"].rolling(window=36, min_periods=12).mean()
-        m_month["ratio_sd"] = m_month["ratio"].rolling(window=36, min_periods=12).std()
-        m_month["ratio_z"] = (m_month["ratio"] - m_month["ratio_ma"]) / m_month["ratio_sd"]
-        m_month["ratio_change_pct"] = m_month["ratio"].pct_change() * 100
-
-        # 3) 월별 신호 (완화 조건 그대로 사용)
-        m_month["buy_signal"]  = (m_month["ratio_z"] < -1.2) & (m_month["ratio_change_pct"] > 0)
-        m_month["sell_signal"] = (m_month["ratio_change_pct"] < -7)
-        # m_month["sell_signal"] = (m_month["ratio_z"] > 1.2) & (m_month["ratio_change_pct"] < -5)
-
-        # 4) '발표일' 계산: 다음 달 25일
-        #    예: 7월 데이터 -> 8월 25일
-        m_month["release_date"] = (
-            m_month["month_start"] + pd.offsets.MonthBegin(1) + pd.DateOffset(days=24)
-        )
-
-    
-        # 5) 발표일을 '발표일 이후 첫 거래일'로 맞추기
-        # ✅ 반드시 '일별' S&P500 라인 확보
-        sp_daily = self.get_sp500().copy()  # 일별로 받는 함수 사용(없으면 self.get_sp500())
-        sp_daily["date"] = pd.to_datetime(sp_daily["date"])
-
-        # 컬럼 표준화
-        if "close" in sp_daily.columns:
-            sp_daily = sp_daily.rename(columns={"close": "sp500_close"})
-        elif "Close" in sp_daily.columns:
-            sp_daily = sp_daily.rename(columns={"Close": "sp500_close"})
-        # 이미 sp500_close면 그대로 사용
+        # 1) 발표분(관측월)별 비율 / z-score / 신호 + 발표일 / 주문일 (시점 기준 패널)
+        m_month = self.get_m2_margin_release_signals()
 
+        # 2) 일별 S&P500 라인 (거래일 캘린더 = 실제 가격이 있는 날짜, 휴일 자동 제외)
         sp_line = (
-            sp_daily[["date", "sp500_close"]]
+            self.get_sp500()[["date", "sp500_close"]]
             .dropna()
             .drop_duplicates(subset=["date"])
             .sort_values("date")
             .reset_index(drop=True)
         )
 
-        # 거래일 캘린더 = 실제 가격이 있는 날짜로 사용 (휴일 자동 제외)
-        trade_days = sp_line[["date"]].copy()
-        sp_dates = trade_days["date"].to_numpy()
-
-        def next_trading_day(dt):
-            i = np.searchsorted(sp_dates, np.datetime64(dt), side="left")
-            return pd.NaT if i >= len(sp_dates) else pd.Timestamp(sp_dates[i])
-
-        m_month["effective_date"] = m_month["release_date"].apply(next_trading_day)
-
-        # 6) '발표 후에만 보이는' 일별 비율 시계열 만들기 (거래일 캘린더 기준)
-        full_days = trade_days.copy()
-        full_days["ratio_published"] = np.nan
-
-        published = (
-            m_month.loc[:, ["effective_date", "ratio"]]
-                .dropna()
-                .sort_values("effective_date")
+        # 3) '발표 후에만 보이는' 일별 비율 시계열 (각 거래일에 공개돼 있던 마지막 값)
+        published = self.get_pit_panel(*M2_MARGIN_PIT_SERIES).history(["margin_m2_ratio"])
+        plot_df = sp_line.merge(
+            published.rename(columns={"margin_m2_ratio": "ratio_published"}).reset_index(),
+            on="date", how="left",
         )
 
-        eff  = published["effective_date"].to_list()
-        vals = published["ratio"].to_list()
-
-        for i, start in enumerate(eff):
-            end = eff[i+1] if i+1 < len(eff) else full_days["date"].iloc[-1] + pd.Timedelta(days=1)
-            mask = (full_days["date"] >= start) & (full_days["date"] < end)
-            full_days.loc[mask, "ratio_published"] = vals[i]
-
-        # 플롯용 DF: 거래일 ⨯ 가격 ⨯ ratio_published
-        plot_df = trade_days.merge(sp_line, on="date", how="left").merge(full_days, on="date", how="left")
-        plot_df["sp500_close"] = pd.to_numeric(plot_df["sp500_close"], errors="coerce").ffill()  # ✔ 연속 라인 보장
-
         # --- 시그널 DF 만들기 (가격 붙이기) ---
         signals = m_month.loc[
             (m_month["buy_signal"] | m_month["sell_signal"]) & m_month["effective_date"].notna(),
@@ -634,7 +913,48 @@ class MacroCrawler:
 
         # ✅ 그래프와 신호 테이블 반환
         return fig, ax1, signals
-    
+
+    @request_scoped
+    def plot_sp500_with_mdyoy_signals_and_graph(self, save_to=None):
+        '''
+        S&P500, Margin Debt / M2, YoY 전략 기반 매수/매도 시점 시각화 (generate_mdyoy_signals)
+        '''
+        df = self.generate_mdyoy_signals()
+
+        fig, ax1 = plt.subplots(figsize=(14, 6))
+
+        # S&P500
+        ax1.plot(df["date"], df["sp500_close"], label="S&P500", color="black")
+        ax1.set_ylabel("S&P500 지수", fontsize=12)
+        ax1.set_xlabel("날짜", fontsize=12)
+        ax1.tick_params(axis='y')
+        ax1.legend(loc="upper left")
+
+        # 매수/매도 시점
+        buy_dates = df[df["buy_signal"]]["action_date"]
+        buy_prices = df[df["buy_signal"]]["sp500_close"]
+        sell_dates = df[df["sell_signal"]]["action_date"]
+        sell_prices = df[df["sell_signal"]]["sp500_close"]
+
+        ax1.scatter(buy_dates, buy_prices, color='blue', label='매수 시점', marker='^', s=100, zorder=5)
+        ax1.scatter(sell_dates, sell_prices, color='red', label='매도 시점', marker='v', s=100, zorder=5)
+
+        # 오른쪽 y축: Margin Debt / M2 비율
+        ax2 = ax1.twinx()
+        ax2.plot(df["date"], df["ratio"], label="Margin Debt / M2", color="green", alpha=0.4)
+        ax2.set_ylabel("Margin Debt / M2", fontsize=12)
+        ax2.tick_params(axis='y')
+
+        fig.suptitle("📉 Margin Debt YoY 전략: S&P500 및 Margin Debt / M2 비율", fontsize=14)
+        fig.legend(loc="upper center", bbox_to_anchor=(0.5, -0.05), ncol=3)
+        plt.tight_layout()
+        if save_to:
+            fig.savefig(save_to, format='png')
+            plt.close(fig)
+        else:
+            plt.show()
+
+    @request_scoped
     def get_today_signal_with_m2_and_margin_debt(self, today=None, market_tz="America/New_York"):
         """
         오늘 날짜 기준 매수/매도/대기 의사결정 + 컨텍스트(최근 발표분) 반환
@@ -654,55 +974,12 @@ class MacroCrawler:
             today_ts = t.normalize()
         today_naive = today_ts.tz_localize(None)
 
-        # ── 월별 지표 테이블 (라벨 보정) ───────────────────────────────────────
-        df = self.merge_m2_margin_sp500_abs().copy()
-        df["date"] = pd.to_datetime(df["date"])
-        df = df.sort_values("date").reset_index(drop=True)  # ✅ 전체 정렬(중요)
-
-        m_src = df.loc[:, ["date", "margin_debt", "m2"]].dropna().copy()
-
-        monthly = (
-            m_src.set_index("date")
-                .groupby(pd.Grouper(freq="MS"))
-                .last()           # 그 달 말일까지 '알고 있던' 값
-                .dropna()
-                .reset_index()
-        )
-        # 말일값은 실제로 '이전 월' 지표이므로 라벨 -1M
-        # monthly["month_start"] = monthly["date"] - pd.offsets.MonthBegin(1)
-
-        # 수정: 해당 월 그대로 사용
-        monthly["month_start"] = monthly["date"] 
-
-        m_month = (
-            monthly[["month_start", "margin_debt", "m2"]]
-                .sort_values("month_start")
-                .reset_index(drop=True)
-        )
-
-        # ── ratio / z / 모멘텀 ────────────────────────────────────────────────
-        m_month["ratio"] = m_month["margin_debt"] / m_month["m2"]
-        m_month["ratio_ma"] = m_month["ratio"].rolling(36, min_periods=12).mean()
-        m_month["ratio_sd"] = m_month["ratio"].rolling(36, min_periods=12).std()
-        m_month["ratio_z"]  = (m_month["ratio"] - m_month["ratio_ma"]) / m_month["ratio_sd"]
-        m_month["ratio_change_pct"] = m_month["ratio"].pct_change() * 100
-
-        # ── 신호 규칙 ─────────────────────────────────────────────────────────
-        m_month["buy_signal"]  = (m_month["ratio_z"] < -1.2) & (m_month["ratio_change_pct"] > 0)
-        m_month["sell_signal"] = (m_month["ratio_change_pct"] < -7)
-
-        # ── 발표일/주문일(발표 후 첫 거래일) ─────────────────────────────────
-        m_month["release_date"] = m_month["month_start"] + pd.offsets.MonthBegin(1) + pd.DateOffset(days=24)
+        # ── 발표분(관측월)별 신호 테이블 (시점 기준 패널) ─────────────────────
+        m_month = self.get_m2_margin_release_signals()
 
         # 거래일 달력: 가격 일자(최소 요건)로 사용
-        sp_daily = self.get_sp500().copy()
-        sp_daily["date"] = pd.to_datetime(sp_daily["date"])
-        if "close" in sp_daily.columns:
-            sp_daily = sp_daily.rename(columns={"close": "sp500_close"})
-        elif "Close" in sp_daily.columns:
-            sp_daily = sp_daily.rename(columns={"Close": "sp500_close"})
         sp_line = (
-            sp_daily[["date", "sp500_close"]]
+            self.get_sp500()[["date", "sp500_close"]]
             .dropna()
             .drop_duplicates(subset=["date"])
             .sort_values("date")
@@ -714,13 +991,10 @@ class MacroCrawler:
             start = (m_month["release_date"].min() - pd.Timedelta(days=10)).normalize()
             end   = (max(today_naive, m_month["release_date"].max()) + pd.Timedelta(days=10)).normalize()
             trade_days = pd.DataFrame({"date": pd.bdate_range(start, end)})
+            m_month["effective_date"] = next_on_calendar(trade_days["date"], m_month["release_date"])
 
-        td = trade_days["date"].to_numpy()
         def next_trading_day(dt):
-            i = np.searchsorted(td, np.datetime64(dt), side="left")
-            return pd.NaT if i >= len(td) else pd.Timestamp(td[i])
-
-        m_month["effective_date"] = m_month["release_date"].apply(next_trading_day)
+            return pd.Timestamp(next_on_calendar(trade_days["date"], [dt])[0])
 
         # ── 오늘 발생 신호(이벤트) ───────────────────────────────────────────
         mask_today = (
@@ -731,8 +1005,9 @@ class MacroCrawler:
         sig_today = m_month.loc[mask_today].copy()
 
         # ── 최근 발표분 컨텍스트(오늘 주문 없을 때 보여줄 1행) ────────────────
-        mask_ctx = m_month["effective_date"].notna() & (m_month["effective_date"] <= today_naive)
-        context = m_month.loc[mask_ctx].sort_values("effective_date").tail(1).copy()
+        # 오늘 시점에 공개돼 있던 마지막 관측월 (시점 기준 패널 as_of)
+        known = self.get_known_values(today_naive, M2_MARGIN_PIT_SERIES)
+        context = m_month.loc[m_month["month_start"] == known.loc["margin_m2_ratio", "observed"]].copy()
 
         # 가격 붙이고 포맷하기
         def _attach_and_format(df_in):
@@ -781,9 +1056,10 @@ class MacroCrawler:
         is_trading_day = (today_naive.normalize() in set(trade_days["date"])) or (today_naive.weekday() < 5)
 
         # ── 다음 발표/주문 예정(달력 기준으로 항상 '앞'을 가리키게) ───────────
-        rel = (today_naive.replace(day=25)
-            if today_naive.day <= 25
-            else (today_naive + pd.offsets.MonthBegin(1)).replace(day=25))
+        release = PIT_SERIES["margin_m2_ratio"]["release"]
+        rel = pd.Timestamp(release_dates([today_naive - pd.DateOffset(months=1)], release)[0])
+        if rel < today_naive:
+            rel = pd.Timestamp(release_dates([today_naive], release)[0])
         eff = next_trading_day(rel)
         next_rel = {"release_date": rel, "effective_date": eff, "estimated": True}
 
@@ -796,6 +1072,7 @@ class MacroCrawler:
         }
     
     # Clear
+    @request_scoped
     def check_today_md_signal(self):
         """
         오늘이 generate_zscore_trend_signals 또는 generate_mdyoy_signals 기준
@@ -850,22 +1127,10 @@ class MacroCrawler:
         '''
         미국 기준 금리 계산
         '''
-        url = 'https://api.stlouisfed.org/fred/series/observations'
-        params = {
-            'series_id': 'FEDFUNDS',
-            'api_key': self.fred_api_key,
-            'file_type': 'json',
-            'observation_start': '2000-01-01'
-        }
-        response = requests.get(url, params=params)
-        data = response.json()
-        df = pd.DataFrame(data['observations'])
-        df['date'] = pd.to_datetime(df['date'])
-        df['fed_funds_rate'] = pd.to_numeric(df['value'], errors='coerce')
-
-        return df
+        return self.get_fred_series('FEDFUNDS')
 
     # Clear    
+    @memoized
     def generate_fed_rate_turning_points(self):
         """
         기준금리 변화에서 인하 시작점 (rate_cut=True), 인상 시작점 (rate_hike=True)만 잡는 함수
@@ -888,129 +1153,91 @@ class MacroCrawler:
 
         return df[["date", "fed_funds_rate", "rate_cut", "rate_hike"]]
 
+    @memoized
+    def get_rate_panel(self):
+        '''
+        금리 시그널용 월별 패널 (월초 date 기준 10y, 2y, cpi_yoy, fed_funds_rate + 파생 real_10y, real_2y, spread)
+        '''
+        return self.get_derived_frame('10y', '2y', 'cpi_yoy', 'fed_funds_rate', 'real_10y', 'real_2y', 'spread')
+
+    @memoized
+    def get_rate_signal_history(self, use_2y_vs_fed=False):
+        '''
+        월별 금리 시그널 전체 이력 (get_rate_signal / 시그널 플롯 / API 공용)
+
+        Parameters:
+            use_2y_vs_fed (bool): '2Y < 기준금리 → +1' 항목 포함 여부 (기본 제외)
+
+        Returns:
+            DataFrame: date, 10y, 2y, cpi_yoy, fed_funds_rate, 파생 지표, score_*, rate_signal
+        '''
+        return score_rate_signals(self.get_rate_panel(), use_2y_vs_fed=use_2y_vs_fed)
+
     # Clear
-    def get_rate_signal(self):
+    @memoized
+    def get_rate_signal(self, use_2y_vs_fed=False):
         '''
-        금리 기반 보조 지표 시그널 계산
+        금리 기반 보조 지표 시그널 계산 (get_rate_signal_history 의 마지막 행)
 
         Parameters:
-            latest_10y (float): 최신 10년물 국채 수익률 (%)
-            latest_2y (float): 최신 2년물 국채 수익률 (%)
-            latest_fed_rate (float): 최신 미국 기준금리 (%)
-            latest_cpi_yoy (float): 최신 CPI YoY (%)
-            prev_cpi_yoy (float): 직전월 CPI YoY (%)
+            use_2y_vs_fed (bool): '2Y < 기준금리 → +1' 항목 포함 여부 (기본 제외)
 
         Returns:
             signal (int): -1 (매도), 0 (중립), +1 이상 (매수 우호적)
             comments (list): 판단 근거 설명
         '''
-        signal = 0
+        history = self.get_rate_signal_history(use_2y_vs_fed=use_2y_vs_fed)
+        if len(history) < 2:
+            raise ValueError("❌ 금리 시그널 계산에 필요한 월별 데이터가 부족합니다.")
+        latest = history.iloc[-1]
         comments = []
 
-        latest_10y = self.get_10years_treasury_yeild()['value'].iloc[-1]
-        latest_2y = self.get_2years_treasury_yeild()['value'].iloc[-1]
-        prev_10y = self.get_10years_treasury_yeild()['value'].iloc[-2]
-        prev_2y = self.get_2years_treasury_yeild()['value'].iloc[-2]
-        latest_cpi_yoy = self.get_cpi_yoy()['CPI YOY(%)'].iloc[-1]
-        latest_fed_rate = self.get_fed_funds_rate()['fed_funds_rate'].iloc[-1]
-        prev_cpi_yoy = self.get_cpi_yoy()['CPI YOY(%)'].iloc[-2]
-
-        # 실질금리 계산
-        real_10y = latest_10y - latest_cpi_yoy
-        real_2y = latest_2y - latest_cpi_yoy
-
         # 실질금리 조건 (CPI 추세 반영)
-        if real_10y < 0:
-            print("10년물 금리 : ", latest_10y, "CPI_YoY : ", latest_cpi_yoy)
-            if latest_cpi_yoy < prev_cpi_yoy:
-                signal += 1
-                comments.append("🔼 실질금리 < 0 & CPI YoY 하락 → 완화 신호")
-            else:
-                signal -= 1
-                comments.append("⚠️ 실질금리 < 0 but CPI YoY 상승 → 인플레 압력")
+        if latest['score_real_10y'] > 0:
+            print("10년물 금리 : ", latest['10y'], "CPI_YoY : ", latest['cpi_yoy'])
+            comments.append("🔼 실질금리 < 0 & CPI YoY 하락 → 완화 신호")
+        elif latest['score_real_10y'] < 0:
+            print("10년물 금리 : ", latest['10y'], "CPI_YoY : ", latest['cpi_yoy'])
+            comments.append("⚠️ 실질금리 < 0 but CPI YoY 상승 → 인플레 압력")
         else:
             comments.append("ℹ️ 실질금리 양호 (10Y > CPI YoY)")
 
-        if real_2y > 2:
-            print("2년물 금리 : ", latest_2y, "CPI_YoY : ", latest_cpi_yoy)
-            signal -= 1
+        if latest['score_real_2y'] < 0:
+            print("2년물 금리 : ", latest['2y'], "CPI_YoY : ", latest['cpi_yoy'])
             comments.append("📉 단기 실질금리 > 2% → 긴축 우려")
 
         # 금리차 (장단기 스프레드)
-        spread = latest_10y - latest_2y
-        prev_spread = prev_10y - prev_2y
-
-        # 변화량
-        delta_spread = spread - prev_spread
-
-        # 판단
-        if spread < -0.5:
-            if delta_spread > 0:
-                signal += 1
+        if latest['spread'] < -0.5:
+            if latest['score_spread'] > 0:
                 comments.append("🔼 장단기 금리역전 상태지만 정상화 추세 → 긍정적 변화")
             else:
-                signal -= 1
                 comments.append("⚠️ 장단기 금리역전 + 추가 악화 → 침체 신호")
-        elif spread > 0:
-            if delta_spread < 0:
-                signal -= 1
+        elif latest['spread'] > 0:
+            if latest['score_spread'] < 0:
                 comments.append("⚠️ 장단기 금리차 양수지만 역전 방향으로 축소 중 → 주의")
             else:
-                signal += 1
                 comments.append("🔼 장단기 금리차 정상 + 확장 추세 → 회복 기대")
         else:
             comments.append("⏸️ 장단기 금리차 중립 구간")
 
-        # # 기준금리 vs 2년물 (미래 금리 인하 기대 여부)
-        # if latest_2y < latest_fed_rate:
-        #     signal += 1
-        #     comments.append("🔽 2Y < 기준금리 → 금리 인하 기대 (완화 시그널)")
-        # else:
-        #     comments.append("⏸ 2Y ≥ 기준금리 → 긴축 지속 또는 불확실성")
+        # 기준금리 vs 2년물 (미래 금리 인하 기대 여부)
+        if use_2y_vs_fed:
+            if latest['score_2y_vs_fed'] > 0:
+                comments.append("🔽 2Y < 기준금리 → 금리 인하 기대 (완화 시그널)")
+            else:
+                comments.append("⏸ 2Y ≥ 기준금리 → 긴축 지속 또는 불확실성")
 
-        return signal, comments
+        return int(latest['rate_signal']), comments
 
     # Clear
+    @request_scoped
     def plot_rate_indicators_vs_sp500(self):
-        # 데이터 준비
-        sp500 = self.get_sp500()
-        df_10y = self.get_10years_treasury_yeild()
-        df_2y = self.get_2years_treasury_yeild()
-        cpi_yoy = self.get_cpi_yoy()
-        fed = self.get_fed_funds_rate()
-
-        # 월 단위 정렬
-      
-        sp500['date'] = pd.to_datetime(sp500['date'])  # 혹시 모르니 안전하게
-        sp500['month'] = pd.to_datetime(sp500['date']).dt.to_period('M').dt.to_timestamp()
-
-        # 각 월의 첫 번째 날짜에 해당하는 S&P500 값만 추출
-        sp_monthly_first = sp500.sort_values('date').groupby('month').first().reset_index()
-
-        # ✅ 기존 'date' 컬럼 제거 (중복 방지)
-        sp_monthly_first = sp_monthly_first.drop(columns=['date'])
-        
-        # ✅ 날짜를 해당 월의 1일로 바꿔줌
-        sp_monthly_first = sp_monthly_first.rename(columns={'month': 'date'})
-        sp_monthly_first = sp_monthly_first[["date", "sp500_close"]]
-
-
-        df_10y['date'] = df_10y['date'].dt.to_period('M').dt.to_timestamp()
-        df_2y['date'] = df_2y['date'].dt.to_period('M').dt.to_timestamp()
-        cpi_yoy['date'] = cpi_yoy['date'].dt.to_period('M').dt.to_timestamp()
-        fed['date'] = fed['date'].dt.to_period('M').dt.to_timestamp()
+        # 데이터 준비 (월별 금리 패널 + 월초 S&P500)
+        sp_monthly_first = self.get_sp500_aligned()
+        rate_panel = self.get_rate_panel()
 
         # 병합
-        df = sp_monthly_first.copy()
-        df = df.merge(df_10y[['date', 'value']], on='date', how='inner').rename(columns={'value': '10y'})
-        df = df.merge(df_2y[['date', 'value']], on='date', how='inner').rename(columns={'value': '2y'})
-        df = df.merge(cpi_yoy[['date', 'CPI YOY(%)']], on='date', how='inner').rename(columns={'CPI YOY(%)': 'cpi_yoy'})
-        df = df.merge(fed[['date', 'fed_funds_rate']], on='date', how='inner')
-
-        # 지표 계산
-        df['real_10y'] = df['10y'] - df['cpi_yoy']
-        df['spread'] = df['10y'] - df['2y']
-        # df['ffr_vs_2y'] = df['fed_funds_rate'] - df['2y']
+        df = sp_monthly_first.merge(rate_panel, on='date', how='inner')
 
         # 시각화
         fig, axs = plt.subplots(3, 1, figsize=(14, 12), sharex=True)
@@ -1048,86 +1275,15 @@ class MacroCrawler:
         plt.show()
 
     # Clear
-    def plot_rate_indicators_vs_sp500_with_signal(self):
-        # 데이터 준비
-        sp500 = self.get_sp500()
-        df_10y = self.get_10years_treasury_yeild()
-        df_2y = self.get_2years_treasury_yeild()
-        cpi_yoy = self.get_cpi_yoy()
-        fed = self.get_fed_funds_rate()
-
-        # 월 단위 정렬
-      
-        sp500['date'] = pd.to_datetime(sp500['date'])  # 혹시 모르니 안전하게
-        sp500['month'] = pd.to_datetime(sp500['date']).dt.to_period('M').dt.to_timestamp()
-
-        # 각 월의 첫 번째 날짜에 해당하는 S&P500 값만 추출
-        sp_monthly_first = sp500.sort_values('date').groupby('month').first().reset_index()
-
-        # ✅ 기존 'date' 컬럼 제거 (중복 방지)
-        sp_monthly_first = sp_monthly_first.drop(columns=['date'])
-        
-        # ✅ 날짜를 해당 월의 1일로 바꿔줌
-        sp_monthly_first = sp_monthly_first.rename(columns={'month': 'date'})
-        sp_monthly_first = sp_monthly_first[["date", "sp500_close"]]
-
+    @request_scoped
+    def plot_rate_indicators_vs_sp500_with_signal(self, use_2y_vs_fed=False):
+        # 데이터 준비 (월별 금리 시그널 이력 + 월초 S&P500)
+        sp_monthly_first = self.get_sp500_aligned()
+        history = self.get_rate_signal_history(use_2y_vs_fed=use_2y_vs_fed)
 
-        # 날짜 처리
-        for df in [df_10y, df_2y, cpi_yoy, fed]:
-            df['date'] = pd.to_datetime(df['date']).dt.to_period('M').dt.to_timestamp()
-
-        # 병합
-        df = sp_monthly_first.copy()
-        df = df.merge(df_10y[['date', 'value']], on='date').rename(columns={'value': '10y'})
-        df = df.merge(df_2y[['date', 'value']], on='date').rename(columns={'value': '2y'})
-        df = df.merge(cpi_yoy[['date', 'CPI YOY(%)']], on='date').rename(columns={'CPI YOY(%)': 'cpi_yoy'})
-        df = df.merge(fed[['date', 'fed_funds_rate']], on='date')
-
-        # 지표 계산
-        df['real_10y'] = df['10y'] - df['cpi_yoy']
-        df['spread'] = df['10y'] - df['2y']
-        # df['ffr_vs_2y'] = df['fed_funds_rate'] - df['2y']
-
-        # 📌 과거 시점별 rate_signal 계산
-        signal_list = []
-        for i in range(1, len(df)):
-            try:
-                latest_10y = df.iloc[i]['10y']
-                latest_2y = df.iloc[i]['2y']
-                prev_10y = df.iloc[i-1]['10y']
-                prev_2y = df.iloc[i-1]['2y']
-                latest_cpi_yoy = df.iloc[i]['cpi_yoy']
-                prev_cpi_yoy = df.iloc[i-1]['cpi_yoy']
-                latest_fed_rate = df.iloc[i]['fed_funds_rate']
-
-                # 재현한 rate_signal 로직
-                signal = 0
-                real_10y = latest_10y - latest_cpi_yoy
-                real_2y = latest_2y - latest_cpi_yoy
-                spread = latest_10y - latest_2y
-                prev_spread = prev_10y - prev_2y
-                delta_spread = spread - prev_spread
-
-                if real_10y < 0:
-                    if latest_cpi_yoy < prev_cpi_yoy:
-                        signal += 1
-                    else:
-                        signal -= 1
-                if real_2y > 2:
-                    signal -= 1
-                if spread < -0.5:
-                    signal += 1 if delta_spread > 0 else -1
-                elif spread > 0:
-                    signal += 1 if delta_spread >= 0 else -1
-                if latest_2y < latest_fed_rate:
-                    signal += 1
-
-                signal_list.append(signal)
-            except:
-                signal_list.append(None)
-
-        df = df.iloc[1:].copy()
-        df['rate_signal'] = signal_list
+        # 병합 (전월 값이 없는 첫 행 제외)
+        df = sp_monthly_first.merge(history, on='date')
+        df = df[df['rate_signal'].notna()].copy()
 
         # 시각화
         fig, axs = plt.subplots(3, 1, figsize=(14, 12), sharex=True)
@@ -1166,6 +1322,7 @@ class MacroCrawler:
         plt.tight_layout()
         plt.show()
 
+    @request_scoped
     def analyze_rate_correlations(self, show_plot: bool = True):
         """
         S&P500 종가와 금리 관련 주요 지표 간 상관관계 분석 및 시각화
@@ -1176,30 +1333,16 @@ class MacroCrawler:
         Returns:
             dict: 각 지표와 S&P500 간의 피어슨 상관계수
         """
-        # 1. 데이터 불러오기
-        sp500 = self.get_sp500()
-        df_10y = self.get_10years_treasury_yeild()
-        df_2y = self.get_2years_treasury_yeild()
-        cpi_yoy = self.get_cpi_yoy()
-        fed = self.get_fed_funds_rate()
-
-        # 2. 날짜 통일 (월 단위)
-        for df in [sp500, df_10y, df_2y, cpi_yoy, fed]:
-            df['date'] = pd.to_datetime(df['date']).dt.to_period('M').dt.to_timestamp()
-
-        # 3. 병합
-        df = sp500.copy()
-        df = df.merge(df_10y[['date', 'value']], on='date').rename(columns={'value': '10y'})
-        df = df.merge(df_2y[['date', 'value']], on='date').rename(columns={'value': '2y'})
-        df = df.merge(cpi_yoy[['date', 'CPI YOY(%)']], on='date').rename(columns={'CPI YOY(%)': 'cpi_yoy'})
-        df = df.merge(fed[['date', 'fed_funds_rate']], on='date')
-
-        # 4. 지표 계산
+        # 1. 마스터 패널에서 일별 종가 + 월별 금리 (같은 달 안에서만 채움 → 미발표 월은 제외)
+        df = self.get_master_panel(['sp500_close', '10y', '2y', 'cpi_yoy', 'fed_funds_rate'], ffill=False)
+        df = df.groupby(df.index.to_period('M')).ffill().dropna().astype(float)
+
+        # 2. 지표 계산
         df['real_10y'] = df['10y'] - df['cpi_yoy']
         df['spread'] = df['10y'] - df['2y']
         # df['ffr_vs_2y'] = df['fed_funds_rate'] - df['2y']
 
-        # 5. 상관관계 계산
+        # 3. 상관관계 계산
         corr_matrix = df[['sp500_close', 'real_10y', 'spread']].corr()
         result = {
             'S&P500 vs 실질 10Y 금리': round(corr_matrix.loc['sp500_close', 'real_10y'], 3),
@@ -1209,7 +1352,7 @@ class MacroCrawler:
         
         print(result)
 
-        # 6. 시각화 (선택적)
+        # 4. 시각화 (선택적)
         if show_plot:
             import matplotlib.pyplot as plt
             import seaborn as sns
@@ -1223,79 +1366,41 @@ class MacroCrawler:
 
     # Clear - 월별데이터 - 1개월 지연
     def get_unemployment_rate(self):
-        url = 'https://api.stlouisfed.org/fred/series/observations'
-        params = {
-            'series_id': 'UNRATE',
-            'api_key': self.fred_api_key,
-            'file_type': 'json',
-            'observation_start': '2000-01-01'
-        }
-        response = requests.get(url, params=params)
-        data = response.json()
-        df = pd.DataFrame(data['observations'])
-        df['date'] = pd.to_datetime(df['date'])
-        df['unemployment_rate'] = pd.to_numeric(df['value'], errors='coerce')
-    
-        return df
-    
+        return self.get_fred_series('UNRATE')
+
+    @memoized
     def get_ism_pmi(self):
         """
         TradingEconomics 한국어 사이트에서 ISM 제조업 PMI 지표를 추출하는 함수
         """
         url = "https://ko.tradingeconomics.com/united-states/manufacturing-pmi"
 
-        options = Options()
-        # options.add_argument('--headless')  # ← 일단 꺼두세요
-        options.add_argument('--disable-gpu')
-        options.add_argument('--no-sandbox')
-        options.add_argument(
-            "user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/124.0.0.0 Safari/537.36"
-        )
-
-        driver = webdriver.Chrome(options=options)
-        driver.get(url)
-
         try:
-            WebDriverWait(driver, 15).until(
-                EC.presence_of_element_located((By.CSS_SELECTOR, "table.table"))
+            # HTTP 우선 → 표를 못 찾으면 공용 브라우저 풀 사용
+            return get_page_fetcher().fetch(
+                url,
+                parse_ism_pmi_row,
+                wait_for=(By.CSS_SELECTOR, "table.table"),
+                name="ism_manufacturing_pmi",
             )
-            soup = BeautifulSoup(driver.page_source, 'html.parser')
         except Exception as e:
-            driver.quit()
-            raise Exception("❌ 페이지 로딩 실패: table 요소를 찾을 수 없습니다.") from e
-        finally:
-            driver.quit()
-
-        table = soup.find('table', class_='table table-hover')
-        if not table:
-            raise Exception("❌ 테이블을 찾을 수 없습니다.")
-
-        rows = table.find('tbody').find_all('tr')
-        for row in rows:
-            columns = row.find_all('td')
-            if len(columns) >= 5:
-                name = columns[0].get_text(strip=True)
-                if "ISM 제조업 PMI" in name:
-                    value = columns[1].get_text(strip=True)
-                    date = columns[4].get_text(strip=True)
-                    return {
-                        "지표명": name,
-                        "값": value,
-                        "발표일": date
-                    }
-
-        raise Exception("❌ 'ISM 제조업 PMI' 항목을 찾을 수 없습니다.")
+            raise Exception(f"❌ 'ISM 제조업 PMI' 항목을 찾을 수 없습니다. ({e})") from e
     
     # Clear - 월별 데이터 - 1개월 지연
     def update_ism_pmi_data(self):
         '''
         로컬에 저장된 ism_pmi 파일 불러오기
         '''
+        # live 모드가 아니면 네트워크 갱신 없이 저장된 CSV 그대로 사용
+        if not self.provider.updates_local_files:
+            return self.pmi_updater.df
+
         try:
             pmi_df = self.pmi_updater.update_csv()
             print("✅ ISM PMI data CSV 업데이트 완료")
         except Exception as e:
             print("📛 ISM PMI data 업데이트 실패:", e)
+            pmi_df = self.pmi_updater.df
         return pmi_df
 
     # Clear - 월별데이터 - 2개월 지연
@@ -1307,23 +1412,10 @@ class MacroCrawler:
         60~80 : 소비자 불안정, 소비 위축 가능성
         60 이하 : 경기 침체 신호 가능성(소비 급감 우려려)
         '''
-
-        url = 'https://api.stlouisfed.org/fred/series/observations'
-        params = {
-            'series_id': 'UMCSENT',
-            'api_key': self.fred_api_key,
-            'file_type': 'json',
-            'observation_start': '2000-01-01'
-        }
-        response = requests.get(url, params=params)
-        data = response.json()
-        df = pd.DataFrame(data['observations'])
-        df['date'] = pd.to_datetime(df['date'])
-        df['umcsent_index'] = pd.to_numeric(df['value'], errors='coerce')
-  
-        return df 
+        return self.get_fred_series('UMCSENT')
 
     # 미국 선행 지수 - 월별데이터
+    @memoized
     def get_us_leading_index_actual(self):
         """
         TradingEconomics 웹 페이지에서 미국 선행 지수의 실제값을 가져옵니다.
@@ -1346,7 +1438,7 @@ class MacroCrawler:
         try:
             # 웹 페이지에 GET 요청 보내기
             print(f"URL에 접속 중: {url}")
-            response = requests.get(url, headers=headers)
+            response = get_page_fetcher().http_get(url, name="us_leading_economic_index", headers=headers)
             response.raise_for_status() # HTTP 오류가 발생하면 예외 발생
 
             # BeautifulSoup으로 HTML 파싱
@@ -1435,52 +1527,25 @@ class MacroCrawler:
         '''
         로컬에 저장된 lei 파일 불러오기
         '''
+        # live 모드가 아니면 네트워크 갱신 없이 저장된 CSV 그대로 사용
+        if not self.provider.updates_local_files:
+            return self.lei_updater.df
+
         try:
             lei_df = self.lei_updater.update_csv()
             print("✅ LEI CSV 업데이트 완료")
         except Exception as e:
             print("📛 LEI CSV 업데이트 실패:", e)
+            lei_df = self.lei_updater.df
 
         return lei_df    
 
-    def plot_sp500_with_lei_signals(
-        self,
-        lei_csv_path: str = "lei_data.csv",
-        pmi_csv_path: str = "pmi_data.csv",
-        sell_delta_pp: float = -0.5,   # 6개월 금리 변화 임계값 (매도) : ≤ -0.5%p
-        buy_delta_pp: float = 0.25,     # 6개월 금리 변화 임계값 (매수) : ≥ +0.5%p
-        lag_months: int = 1,           # 발표시차(전월값을 다음달 1일에 알 수 있음)
-        show_components: bool = False, # True면 LEI/PMI/Fed 라인도 보조축에 함께 그림
-        save_to: str | None = None     # 파일로 저장하고 싶으면 경로 지정
-    ):
-        """
-        S&P500 월초(첫 거래일) 종가에 매수/매도 마크업을 찍는 함수
-        - LEI/PMI는 CSV에서 읽고, 기준금리는 self.get_fed_funds_rate()로 호출
-        - 발표시차(전월 데이터를 다음 달 1일에 확인)를 반영하여 신호를 '발표월의 월초 종가'에 표시
-
-        Returns
-        -------
-        fig : matplotlib.figure.Figure
-        signals : pd.DataFrame  # 신호 발생 행만 모은 요약 테이블
-        """
-
-        # 1) 데이터 로드 ----------------------------------------------------------
-        # S&P500 (일별) → 월초 종가(첫 거래일)로 변환
-        sp = self.get_sp500().copy()
-        sp["date"] = pd.to_datetime(sp["date"])
-        sp = sp.sort_values("date")
-        # 월초 빈(label)으로 리샘플하면 해당 월의 첫 관측치가 들어감
-        sp_month_start = (
-            sp.set_index("date")
-            .resample("MS")            # Month Start
-            .first()
-            .rename_axis("date")
-            .reset_index()[["date", "sp500_close"]]
-        )
-        sp_month_start["ym"] = sp_month_start["date"].dt.to_period("M")
-
-        # LEI
-        lei = pd.read_csv(lei_csv_path)
+    @memoized
+    def read_lei_csv(self, csv_path="lei_data.csv"):
+        '''
+        로컬 LEI CSV 읽기 전용 (date, LEI) - 스크래핑 / 파일 갱신 없음
+        '''
+        lei = pd.read_csv(csv_path)
         # 컬럼 유연 처리
         if "date" not in lei.columns:
             raise ValueError("lei_data.csv에는 'date' 컬럼이 필요합니다.")
@@ -1491,12 +1556,15 @@ class MacroCrawler:
                 lei = lei.rename(columns={"value": "LEI"})
             else:
                 raise ValueError("lei_data.csv에서 LEI 값을 찾을 수 없습니다. ('LEI' 또는 'value' 컬럼 필요)")
-        # 월말 기준 대표값
-        lei_m = (lei.set_index("date").resample("M").last().reset_index()[["date", "LEI"]])
-        lei_m["ym"] = lei_m["date"].dt.to_period("M")
+        lei["LEI"] = pd.to_numeric(lei["LEI"], errors="coerce")
+        return lei[["date", "LEI"]]
 
-        # PMI
-        pmi = pd.read_csv(pmi_csv_path)
+    @memoized
+    def read_pmi_csv(self, csv_path="pmi_data.csv"):
+        '''
+        로컬 ISM PMI CSV 읽기 전용 (date, PMI) - 스크래핑 / 파일 갱신 없음
+        '''
+        pmi = pd.read_csv(csv_path)
         # 날짜 컬럼 유연 처리
         if "date" in pmi.columns:
             pmi["date"] = pd.to_datetime(pmi["date"])
@@ -1513,24 +1581,36 @@ class MacroCrawler:
             else:
                 raise ValueError("pmi_data.csv에서 PMI 값을 찾을 수 없습니다. ('PMI' 또는 'value')")
         pmi["PMI"] = pd.to_numeric(pmi["PMI"], errors="coerce")
-        pmi_m = (pmi.set_index("date").resample("M").last().reset_index()[["date", "PMI"]])
+        return pmi[["date", "PMI"]]
+
+    @memoized
+    def get_lei_pmi_fed_panel(self, lei_csv_path="lei_data.csv", pmi_csv_path="pmi_data.csv"):
+        '''
+        LEI/PMI/기준금리 전략용 월별 패널 (발표시차 반영 전)
+        - date(월초 첫 거래일 라벨), ym, sp500_close, LEI, PMI, FEDFUNDS, FEDFUNDS_6M_chg
+        '''
+        # S&P500 (일별) → 월초 종가(첫 거래일)
+        sp_month_start = self.get_sp500_aligned()
+        sp_month_start["ym"] = sp_month_start["date"].dt.to_period("M")
+
+        # LEI / PMI (로컬 CSV, 월별 마지막 값)
+        lei_m = align(self.read_lei_csv(lei_csv_path), how="last", value_cols=["LEI"])
+        lei_m["ym"] = lei_m["date"].dt.to_period("M")
+
+        pmi_m = align(self.read_pmi_csv(pmi_csv_path), how="last", value_cols=["PMI"])
         pmi_m["ym"] = pmi_m["date"].dt.to_period("M")
 
         # Fed Funds (FRED API)
         fed = self.get_fed_funds_rate().copy()
         fed["date"] = pd.to_datetime(fed["date"])
         fed["fed_funds_rate"] = pd.to_numeric(fed["fed_funds_rate"], errors="coerce")
-        # 월말 대표값
-        fed_m = (
-            fed.set_index("date")
-            .resample("M")
-            .last()
-            .reset_index()[["date", "fed_funds_rate"]]
-            .rename(columns={"fed_funds_rate": "FEDFUNDS"})
+        # 월별 마지막 값
+        fed_m = aligned("FEDFUNDS", fed, how="last", value_cols=["fed_funds_rate"]).rename(
+            columns={"fed_funds_rate": "FEDFUNDS"}
         )
         fed_m["ym"] = fed_m["date"].dt.to_period("M")
 
-        # 2) 병합 (월 기준) -------------------------------------------------------
+        # 병합 (월 기준)
         df = (
             sp_month_start[["date", "ym", "sp500_close"]]
             .merge(lei_m[["ym", "LEI"]], on="ym", how="left")
@@ -1540,20 +1620,85 @@ class MacroCrawler:
             .reset_index(drop=True)
         )
 
-        # 3) 금리 6개월 변화(퍼센트 포인트) + 발표시차 반영 --------------------------
-        df["FEDFUNDS_6M_chg"] = df["FEDFUNDS"] - df["FEDFUNDS"].shift(6)
+        # 금리 6개월 변화(퍼센트 포인트)
+        df["FEDFUNDS_6M_chg"] = df["date"].map(self.get_derived("fed_funds_6m_chg").set_index("date")["fed_funds_6m_chg"])
+        return df
 
-        # 발표시차: 전월 데이터를 다음달 1일에 알 수 있으므로 'lag_months'만큼 시프트
-        df["LEI_used"] = df["LEI"].shift(lag_months)
-        df["PMI_used"] = df["PMI"].shift(lag_months)
-        df["FEDFUNDS_6M_chg_used"] = df["FEDFUNDS_6M_chg"].shift(lag_months)
+    @memoized
+    def get_lei_pmi_fed_pit_panel(self, lei_csv_path="lei_data.csv", pmi_csv_path="pmi_data.csv"):
+        '''
+        LEI / PMI / 기준금리 6개월 변화 시점 기준 패널 (PIT_SERIES 발표 규칙)
+        - LEI / PMI 는 get_lei_pmi_fed_panel 과 같은 로컬 CSV (읽기 전용)
+        '''
+        return PointInTimePanel({
+            "LEI": self.read_lei_csv(lei_csv_path),
+            "PMI": self.read_pmi_csv(pmi_csv_path),
+            "fed_funds_6m_chg": self.get_derived("fed_funds_6m_chg"),
+        })
 
-        # 4) 신호 정의 ------------------------------------------------------------
-        # sell_mask = (df["LEI_used"] < 100) & (df["PMI_used"] < 50) & (df["FEDFUNDS_6M_chg_used"] <= sell_delta_pp)
-        buy_mask  = (df["LEI_used"] > 100) & (df["PMI_used"] > 50) & (df["FEDFUNDS_6M_chg_used"] >= buy_delta_pp)
+    @memoized
+    def get_lei_pmi_fed_known_panel(self, lei_csv_path="lei_data.csv", pmi_csv_path="pmi_data.csv"):
+        '''
+        get_lei_pmi_fed_panel + 각 월초 시점에 공개돼 있던 값 (get_lei_pmi_fed_pit_panel)
+        - LEI_used / PMI_used / FEDFUNDS_6M_chg_used
+        - 데이터 기준일 (PMI / 기준금리 관측월), LEI 기준일 (LEI 관측월)
+        '''
+        df = self.get_lei_pmi_fed_panel(lei_csv_path, pmi_csv_path)
+        known = self.get_lei_pmi_fed_pit_panel(lei_csv_path, pmi_csv_path).known_at(df["date"])
+        df["LEI_used"] = known["LEI"].to_numpy()
+        df["PMI_used"] = known["PMI"].to_numpy()
+        df["FEDFUNDS_6M_chg_used"] = known["fed_funds_6m_chg"].to_numpy()
+        df["데이터 기준일"] = known["PMI_observed"].to_numpy()
+        df["LEI 기준일"] = known["LEI_observed"].to_numpy()
+        return df
+
+    @memoized
+    def generate_lei_pmi_fed_signals(
+        self,
+        lei_csv_path: str = "lei_data.csv",
+        pmi_csv_path: str = "pmi_data.csv",
+        buy_delta_pp: float = 0.25,
+    ):
+        '''
+        LEI + PMI + 기준금리 6개월 변화 매수 신호 (월초 패널, get_lei_pmi_fed_known_panel)
+        매수: LEI > 100 & PMI > 50 & 6개월 금리 변화 ≥ buy_delta_pp (각 월초에 공개돼 있던 값)
+        '''
+        df = self.get_lei_pmi_fed_known_panel(lei_csv_path, pmi_csv_path)
+        buy_mask = (df["LEI_used"] > 100) & (df["PMI_used"] > 50) & (df["FEDFUNDS_6M_chg_used"] >= buy_delta_pp)
+        df["buy_signal"] = buy_mask.fillna(False)
+        return df
+
+    @request_scoped
+    def plot_sp500_with_lei_signals(
+        self,
+        lei_csv_path: str = "lei_data.csv",
+        pmi_csv_path: str = "pmi_data.csv",
+        sell_delta_pp: float = -0.5,   # 6개월 금리 변화 임계값 (매도) : ≤ -0.5%p
+        buy_delta_pp: float = 0.25,     # 6개월 금리 변화 임계값 (매수) : ≥ +0.5%p
+        lag_months: int | None = None,  # (사용 안 함) 발표시차는 PIT_SERIES 발표 규칙으로 반영
+        show_components: bool = False, # True면 LEI/PMI/Fed 라인도 보조축에 함께 그림
+        save_to: str | None = None     # 파일로 저장하고 싶으면 경로 지정
+    ):
+        """
+        S&P500 월초(첫 거래일) 종가에 매수/매도 마크업을 찍는 함수
+        - LEI/PMI는 CSV에서 읽고, 기준금리는 self.get_fed_funds_rate()로 호출
+        - 발표시차는 시점 기준 패널(get_lei_pmi_fed_pit_panel)로 반영 : 각 월초에 공개돼 있던 값만 사용
+          (공개일 = pit_panel.PIT_SERIES 의 LEI / PMI / fed_funds_6m_chg 발표 규칙)
+        - lag_months 는 더 이상 쓰지 않음 (넘기면 DeprecationWarning 후 무시)
 
+        Returns
+        -------
+        fig : matplotlib.figure.Figure
+        signals : pd.DataFrame  # 신호 발생 행만 모은 요약 테이블
+        """
+
+        if lag_months is not None:
+            warnings.warn(LAG_MONTHS_DEPRECATED, DeprecationWarning, stacklevel=3)
+
+        # 1) 월초 S&P500 + 각 월초에 공개돼 있던 LEI / PMI / 기준금리 6개월 변화 + 매수 신호 ----------
+        df = self.generate_lei_pmi_fed_signals(lei_csv_path, pmi_csv_path, buy_delta_pp)
+        # sell_mask = (df["LEI_used"] < 100) & (df["PMI_used"] < 50) & (df["FEDFUNDS_6M_chg_used"] <= sell_delta_pp)
         # df["sell_signal"] = sell_mask.fillna(False)
-        df["buy_signal"]  = buy_mask.fillna(False)
 
         # 5) 플롯 -----------------------------------------------------------------
         fig, ax1 = plt.subplots(figsize=(13, 6))
@@ -1597,16 +1742,14 @@ class MacroCrawler:
         # 6) 신호 테이블 반환 ------------------------------------------------------
         signals = df.loc[df["buy_signal"],
                         ["date", "sp500_close", "LEI_used", "PMI_used", "FEDFUNDS_6M_chg_used",
-                        "buy_signal"]].reset_index(drop=True)
+                        "데이터 기준일", "LEI 기준일", "buy_signal"]].reset_index(drop=True)
         
         # 주문일 = 실제 월초 종가가 찍힌 날짜
+        # 데이터 기준일 = PMI / 기준금리 관측월, LEI 기준일 = LEI 관측월
         signals = signals.rename(columns={"date": "주문일"})
 
-        # 데이터 기준일 = 주문일에서 lag_months 만큼 당긴 달
-        signals["데이터 기준일"] = signals["주문일"] - pd.DateOffset(months=lag_months)
-
         # 보기 좋게 컬럼 순서 정리
-        signals = signals[["데이터 기준일", "주문일", "sp500_close",
+        signals = signals[["데이터 기준일", "LEI 기준일", "주문일", "sp500_close",
                         "LEI_used", "PMI_used", "FEDFUNDS_6M_chg_used",
                         "buy_signal"]]
         
@@ -1614,12 +1757,13 @@ class MacroCrawler:
 
         return fig, signals
 
+    @request_scoped
     def decide_today_lei_signal_min(
         self,
         lei_csv_path: str = "lei_data.csv",
         pmi_csv_path: str = "pmi_data.csv",
         buy_delta_pp: float = 0.25,
-        lag_months: int = 1,
+        lag_months: int | None = None,        # (사용 안 함) 발표시차는 PIT_SERIES 발표 규칙으로 반영
         market_tz: str = "America/New_York",  # S&P500 거래월 판단용
         today_tz: str = "Asia/Seoul",         # "오늘 날짜" 표기용
     ):
@@ -1632,98 +1776,31 @@ class MacroCrawler:
         - 오늘 날짜
         - 시그널          ("매수" | "대기" | "데이터없음")
         - 주문일          (이번 달 월초 첫 거래일)
-        - 데이터 기준일    (= 주문일 - lag_months개월)
-        - LEI             (LEI_used)
-        - PMI             (PMI_used)
-        - 6개월 간 금리변동 폭 (FEDFUNDS_6M_chg_used)
+        - 데이터 기준일    (PMI / 기준금리 관측월)
+        - LEI 기준일      (LEI 관측월)
+        - LEI / PMI / Change_rate : 오늘(미국장 기준) 공개돼 있던 값
+          (get_lei_pmi_fed_pit_panel.as_of, 공개일 = pit_panel.PIT_SERIES 발표 규칙)
+        lag_months 는 더 이상 쓰지 않음 (넘기면 DeprecationWarning 후 무시)
         """
         import pandas as pd
         import numpy as np
 
+        if lag_months is not None:
+            warnings.warn(LAG_MONTHS_DEPRECATED, DeprecationWarning, stacklevel=3)
+
         # --- 오늘 날짜(로컬 표기를 위해 today_tz 사용)
         today_local = pd.Timestamp.now(tz=today_tz).date()
 
-        # --- S&P500: 일별 → 월초(첫 거래일)
-        sp = self.get_sp500().copy()
-        sp["date"] = pd.to_datetime(sp["date"])
-        sp = sp.sort_values("date")
-        sp_month_start = (
-            sp.set_index("date").resample("MS").first().rename_axis("date").reset_index()
-        )
-        sp_month_start["ym"] = sp_month_start["date"].dt.to_period("M")
-
-        # --- LEI
-        lei = pd.read_csv(lei_csv_path)
-        if "date" not in lei.columns:
-            raise ValueError("lei_data.csv에는 'date' 컬럼이 필요합니다.")
-        lei["date"] = pd.to_datetime(lei["date"], format='mixed')
-        if "LEI" not in lei.columns:
-            if "value" in lei.columns:
-                lei = lei.rename(columns={"value": "LEI"})
-            else:
-                raise ValueError("lei_data.csv에서 LEI 값을 찾을 수 없습니다. ('LEI' 또는 'value')")
-        lei_m = lei.set_index("date").resample("M").last().reset_index()[["date", "LEI"]]
-        lei_m["ym"] = lei_m["date"].dt.to_period("M")
-
-        # --- PMI
-        pmi = pd.read_csv(pmi_csv_path)
-        if "date" in pmi.columns:
-            pmi["date"] = pd.to_datetime(pmi["date"])
-        elif "Month/Year" in pmi.columns:
-            pmi["date"] = pd.to_datetime(pmi["Month/Year"])
-        elif "DATE" in pmi.columns:
-            pmi["date"] = pd.to_datetime(pmi["DATE"])
-        else:
-            raise ValueError("pmi_data.csv에 날짜 컬럼이 없습니다. (date / Month/Year / DATE 중 하나)")
-        if "PMI" not in pmi.columns:
-            if "value" in pmi.columns:
-                pmi = pmi.rename(columns={"value": "PMI"})
-            else:
-                raise ValueError("pmi_data.csv에서 PMI 값을 찾을 수 없습니다. ('PMI' 또는 'value')")
-        pmi["PMI"] = pd.to_numeric(pmi["PMI"], errors="coerce")
-        pmi_m = pmi.set_index("date").resample("M").last().reset_index()[["date", "PMI"]]
-        pmi_m["ym"] = pmi_m["date"].dt.to_period("M")
-
-        # --- Fed Funds (월말 대표값 → 6개월 변화)
-        fed = self.get_fed_funds_rate().copy()
-        fed["date"] = pd.to_datetime(fed["date"])
-        fed["fed_funds_rate"] = pd.to_numeric(fed["fed_funds_rate"], errors="coerce")
-        fed_m = (
-            fed.set_index("date").resample("M").last().reset_index()[["date", "fed_funds_rate"]]
-            .rename(columns={"fed_funds_rate": "FEDFUNDS"})
-        )
-        fed_m["ym"] = fed_m["date"].dt.to_period("M")
-
-        # --- 병합(월 기준) & 발표시차 반영
-        df = (
-            sp_month_start[["date", "ym", "sp500_close"]]
-            .merge(lei_m[["ym", "LEI"]], on="ym", how="left")
-            .merge(pmi_m[["ym", "PMI"]], on="ym", how="left")
-            .merge(fed_m[["ym", "FEDFUNDS"]], on="ym", how="left")
-            .sort_values("date")
-            .reset_index(drop=True)
-        )
-
-        # --- 발표 시차(매월 25일 규칙) 반영: 오늘 날짜 기준 동적 lag 계산
-        now_us = pd.Timestamp.now(tz=market_tz)  # 미국장 기준 오늘
-        effective_lag = 2 if now_us.day < 30 else 1
+        # --- 월초 S&P500 + LEI / PMI / 기준금리 6개월 변화
+        df = self.get_lei_pmi_fed_panel(lei_csv_path, pmi_csv_path)
 
-
-        df["FEDFUNDS_6M_chg"] = df["FEDFUNDS"] - df["FEDFUNDS"].shift(6)
-
-        df["LEI_used"] = df["LEI"].shift(effective_lag)
-        df["PMI_used"] = df["PMI"].shift(lag_months)
-        df["FEDFUNDS_6M_chg_used"] = df["FEDFUNDS_6M_chg"].shift(lag_months)
-
-        buy_mask = (
-            (df["LEI_used"] > 100)
-            & (df["PMI_used"] > 50)
-            & (df["FEDFUNDS_6M_chg_used"] >= buy_delta_pp)
-        )
-        df["buy_signal"] = buy_mask.fillna(False)
+        # --- 오늘(미국장 기준) 공개돼 있던 LEI / PMI / 기준금리 6개월 변화 (발표 규칙 = PIT_SERIES)
+        now_us = pd.Timestamp.now(tz=market_tz)
+        known = self.get_lei_pmi_fed_pit_panel(lei_csv_path, pmi_csv_path).as_of(now_us.tz_localize(None))
+        lei, pmi, chg = (known.loc[name, "value"] for name in LEI_PMI_FED_PIT_SERIES)
+        buy = (lei > 100) and (pmi > 50) and (chg >= buy_delta_pp)
 
         # --- 이번 달 주문일(미국장 기준 월) 결정
-        now_us = pd.Timestamp.now(tz=market_tz)
         current_period_us = now_us.to_period("M")
 
         this_row = df[df["date"].dt.to_period("M") == current_period_us].tail(1)
@@ -1734,28 +1811,31 @@ class MacroCrawler:
                 "시그널": "데이터없음",
                 "주문일": None,
                 "데이터 기준일": None,
+                "LEI 기준일": None,
                 "LEI": None,
                 "PMI": None,
                 "6개월 간 금리변동 폭": None,
             }
 
-        row = this_row.iloc[0]
-        order_day = pd.to_datetime(row["date"]).date()
-        base_day = (pd.to_datetime(row["date"]) - pd.DateOffset(months=lag_months)).date()
+        order_day = pd.to_datetime(this_row["date"].iloc[0]).date()
 
         # 안전한 소수/결측 처리
         def _fmt(x, nd=2):
             v = None if pd.isna(x) else float(x)
             return None if v is None else (round(v, nd) if nd is not None else v)
 
+        def _day(x):
+            return None if pd.isna(x) else pd.Timestamp(x).date()
+
         result = {
             "오늘 날짜": today_local,
-            "시그널": "BUY" if bool(row["buy_signal"]) else "HOLD",
+            "시그널": "BUY" if buy else "HOLD",
             "주문일": order_day,
-            "데이터 기준일": base_day,
-            "LEI": _fmt(row["LEI_used"], 1),
-            "PMI": _fmt(row["PMI_used"], 1),
-            "Change_rate": _fmt(row["FEDFUNDS_6M_chg_used"], 2),
+            "데이터 기준일": _day(known.loc["PMI", "observed"]),
+            "LEI 기준일": _day(known.loc["LEI", "observed"]),
+            "LEI": _fmt(lei, 1),
+            "PMI": _fmt(pmi, 1),
+            "Change_rate": _fmt(chg, 2),
         }
         return result
 
@@ -1765,49 +1845,24 @@ class MacroCrawler:
         St. Louis Fed가 발표하는 지표를 공식적으로 FRED에 제공하는 형태
         상승시 경기회복/확장 의미, 하락시 경기 둔화/침체 의미
         '''
-        
-        url = 'https://api.stlouisfed.org/fred/series/observations'
-        params = {
-            'series_id': 'USSLIND',
-            'api_key': self.fred_api_key,
-            'file_type': 'json',
-            'observation_start': '2000-01-01'
-        }
-        response = requests.get(url, params=params)
-        data = response.json()
-        df = pd.DataFrame(data['observations'])
-        df['date'] = pd.to_datetime(df['date'])
-        df['LI_index'] = pd.to_numeric(df['value'], errors='coerce')
-        
-        return df
-    
+        return self.get_fred_series('USSLIND')
+
     # Clear - 월별데이터
     def get_CLI(self):
         '''
         CLI가 발표하는 지표를 공식적으로 FRED에 제공하는 형태
         상승시 경기회복/확장 의미, 하락시 경기 둔화/침체 의미
         '''
-        
-        url = 'https://api.stlouisfed.org/fred/series/observations'
-        params = {
-            'series_id': 'USALOLITONOSTSAM',
-            'api_key': self.fred_api_key,
-            'file_type': 'json',
-            'observation_start': '2000-01-01'
-        }
-        response = requests.get(url, params=params)
-        data = response.json()
-        df = pd.DataFrame(data['observations'])
-        df['date'] = pd.to_datetime(df['date'])
-        df['CLI_index'] = pd.to_numeric(df['value'], errors='coerce')
-        
-        return df
+        return self.get_fred_series('USALOLITONOSTSAM')
 
+    @request_scoped
     def analyze_ecri_trend(self):
 
-        df = self.get_CLI()
+        df = self.get_master_series('cli')
+        if df.empty:
+            raise ValueError("❌ CLI 데이터를 불러오지 못했습니다.")
         x = np.arange(len(df))
-        y = df['CLI_index'].values
+        y = df['cli'].to_numpy(dtype=float)
         slope, _, r_value, _, _ = linregress(x, y)
 
         if slope > 0.05:
@@ -1818,6 +1873,7 @@ class MacroCrawler:
             return "➖ 횡보 추세 (불확실성 지속)"
 
     
+    @memoized
     def generate_rate_cut_signals(self):
         """
         기준금리 인하 시점부터 6개월 이내에 CLI < 130 그리고 PMI < 50인 경우 매도 시그널 표시
@@ -1825,54 +1881,23 @@ class MacroCrawler:
         Returns:
             signal_df: 매도 시그널 포함된 DataFrame (date, sp500_close, cli, pmi, rate_cut, signal)
         """
-        # 1. 데이터 불러오기
-        sp500_df = self.get_sp500()
+        # 1. 월초 S&P500 종가 / CLI / PMI (마스터 패널 월별 슬라이스) + 기준금리 전환점
+        df = self.get_master_monthly("sp500_close", "cli", "pmi").rename(columns={"cli": "CLI_index", "pmi": "PMI"})
         fed_df = self.generate_fed_rate_turning_points()  # 전환점만 True
-        cli_df = self.get_CLI()
-        pmi_df = ISMPMIUpdater().preprocess_raw_csv()
-
-        # 2. 날짜 정제
-        sp500_df["date"] = pd.to_datetime(sp500_df["date"])
-        sp500_df['month'] = pd.to_datetime(sp500_df['date']).dt.to_period('M').dt.to_timestamp()
 
-        # 각 월의 첫 번째 날짜에 해당하는 S&P500 값만 추출
-        sp_monthly_first = sp500_df.sort_values('date').groupby('month').first().reset_index()
-
-        # ✅ 기존 'date' 컬럼 제거 (중복 방지)
-        sp_monthly_first = sp_monthly_first.drop(columns=['date'])
-        
-        # ✅ 날짜를 해당 월의 1일로 바꿔줌
-        sp_monthly_first = sp_monthly_first.rename(columns={'month': 'date'})
-        sp_monthly_first = sp_monthly_first[["date", "sp500_close"]]
-
-
-        fed_df["date"] = pd.to_datetime(fed_df["date"])
-        cli_df["date"] = pd.to_datetime(cli_df["date"])
-        pmi_df.rename(columns={"Month/Year": "date"}, inplace=True)
-        pmi_df["date"] = pd.to_datetime(pmi_df["date"])
-
-        # 3. 모든 데이터 병합 (outer merge → date 기준)
-        df = sp_monthly_first.merge(cli_df, on="date", how="outer")
-        df = df.merge(pmi_df, on="date", how="outer")
+        # 2. 기준금리 전환점 병합 (date 기준)
         df = df.merge(fed_df[["date", "rate_cut"]], on="date", how="left")
-
         df = df.sort_values("date").reset_index(drop=True)
 
-        # 4. 매도 시그널 초기화
-        df["signal"] = False
-
-        # 5. 기준금리 인하 시점부터 6개월 동안 조건 체크
-        cut_dates = df[df["rate_cut"] == True]["date"].tolist()
-
-        for cut_date in cut_dates:
-            end_date = cut_date + pd.DateOffset(months=6)
-            mask = (df["date"] > cut_date) & (df["date"] <= end_date)
-            condition = (df["CLI_index"] < 130) & (df["PMI"] < 50)
-            df.loc[mask & condition, "signal"] = True
+        # 3. 기준금리 인하 시점 이후 6개월 이내 + CLI < 130 & PMI < 50 → 매도 시그널
+        df["signal"] = event_window_signal(
+            df, "rate_cut", conditions={"CLI_index": ("<", 130), "PMI": ("<", 50)}, months=6
+        )
 
         return df
 
     # Clear
+    @request_scoped
     def plot_sp500_with_sell_signals(self, save_to = None):
 
         signal_df = self.generate_rate_cut_signals()
@@ -1899,6 +1924,7 @@ class MacroCrawler:
             plt.show()
 
     # Clear
+    @memoized
     def generate_buy_signals_from_hike(self):
 
         """
@@ -1910,41 +1936,23 @@ class MacroCrawler:
         """
         # 데이터 불러오기
         fed_df = self.generate_fed_rate_turning_points()  # includes 'rate_hike'
-        cli_df = self.get_CLI()
-        pmi_df = self.update_ism_pmi_data()
-        pmi_df.rename(columns={"Month/Year": "date", "PMI": "pmi"}, inplace=True)
-        sp_df = self.get_sp500()
-
-        # ✅ 각 달의 첫 거래일만 추출
-        sp_df['year_month'] = sp_df['date'].dt.to_period('M')
-        sp_monthly_first = sp_df.sort_values('date').groupby('year_month').first().reset_index()
-        
-        # ✅ 날짜를 해당 월의 1일로 바꿔줌
-        sp_monthly_first["date"] = sp_monthly_first["year_month"].dt.to_timestamp()
-        sp_monthly_first = sp_monthly_first[["date", "sp500_close"]]
 
+        # ✅ 월초 첫 거래일 종가 / CLI / PMI (마스터 패널 월별 슬라이스, 날짜는 해당 월 1일)
+        monthly = self.get_master_monthly("sp500_close", "cli", "pmi").rename(columns={"cli": "CLI_index"})
 
         # 병합
-        df = fed_df.merge(cli_df, on="date", how="outer")
-        df = df.merge(pmi_df, on="date", how="outer")
-        df = df.merge(sp_monthly_first, on="date", how="outer")
+        df = fed_df.merge(monthly, on="date", how="outer")
         df = df.sort_values("date").reset_index(drop=True)
 
-        # 1. rate_hike 발생 시점 목록
-        hike_dates = df[df["rate_hike"] == True]["date"].tolist()
-
-        # 2. 각 기준금리 인상 시작 이후 6개월 동안 조건 충족 여부 확인
-        df["buy_signal"] = False
-
-        for hike_date in hike_dates:
-            window_end = hike_date + pd.DateOffset(months=6)
-            window_mask = (df["date"] > hike_date) & (df["date"] <= window_end)
-            condition = (df["CLI_index"] > 130) & (df["pmi"] > 50)
-            df.loc[window_mask & condition, "buy_signal"] = True
+        # 기준금리 인상 시작 이후 6개월 이내 + CLI > 130 & PMI > 50 → 매수 시그널
+        df["buy_signal"] = event_window_signal(
+            df, "rate_hike", conditions={"CLI_index": (">", 130), "pmi": (">", 50)}, months=6
+        )
 
         return df[["date", "fed_funds_rate", "rate_hike", "CLI_index", "pmi", "sp500_close", "buy_signal"]]
 
     # Clear
+    @request_scoped
     def plot_buy_signals_from_hike(self, save_to = None):
         """
         generate_buy_signals_from_hike() 결과를 바탕으로
@@ -1973,9 +1981,10 @@ class MacroCrawler:
             plt.show()
 
 
+    @memoized
     def find_signals_from_erci_indicators(self):
         """
-        실업률과 ERCI(USSLIND) 지표 발표 지연을 고려하여 조건 충족 시점을 찾는 함수
+        실업률과 ERCI(USSLIND) 지표 발표 지연(PIT_SERIES 발표 규칙)을 고려하여 조건 충족 시점을 찾는 함수
 
         매수 조건: 실업률 > 평균, ECRI < 95
         매도 조건: 실업률 < 평균, ECRI >= 110
@@ -1983,39 +1992,15 @@ class MacroCrawler:
         Returns:
             signal_df : 매수/매도 시점과 조건 정보를 포함한 DataFrame
         """
-        from pandas.tseries.offsets import MonthBegin
-        import pandas as pd
-
-        # 데이터 불러오기
-        ecri_df = self.get_USSLIND()  # 'LI_index' 또는 'value', 'date' 포함
-        unemp_df = self.get_unemployment_rate()  # 'unemployment_rate' 또는 'value', 'date' 포함
-
-        # date 컬럼이 있으면 인덱스로 지정 + datetime 변환
-        if "date" in ecri_df.columns:
-            ecri_df["date"] = pd.to_datetime(ecri_df["date"])
-            ecri_df = ecri_df.set_index("date")
-
-        if "date" in unemp_df.columns:
-            unemp_df["date"] = pd.to_datetime(unemp_df["date"])
-            unemp_df = unemp_df.set_index("date")
-
-        # 필요한 컬럼 선택 및 이름 지정
-        ecri_series = ecri_df["LI_index"] if "LI_index" in ecri_df.columns else ecri_df["value"]
-        ecri_series.name = "ECRI"
-
-        unemp_series = unemp_df["unemployment_rate"] if "unemployment_rate" in unemp_df.columns else unemp_df["value"]
-        unemp_series.name = "Unemployment"
-
-        # 1개월 발표 지연 적용
-        ecri_shifted = ecri_series.shift(1)
-        ecri_shifted.index = ecri_shifted.index + MonthBegin(1)
-
-        unemp_shifted = unemp_series.shift(1)
-        unemp_shifted.index = unemp_shifted.index + MonthBegin(1)
-
-
-        # 병합 후 조건 적용
-        cond_df = pd.concat([ecri_shifted, unemp_shifted], axis=1).dropna()
+        # ECRI 발표일(월초, 관측월 +2개월)마다 그 시점에 공개돼 있던 ECRI / 실업률 (시점 기준 패널)
+        # - 실업률은 다음 달 7일경 발표 → ECRI 발표일(월초)에는 같은 관측월 값까지 공개
+        panel = self.get_pit_panel("LI_index", "unemployment_rate")
+        release_days = pd.DatetimeIndex(panel.releases("LI_index")["released"]).unique()
+        cond_df = (
+            panel.known_at(release_days, ["LI_index", "unemployment_rate"])[["LI_index", "unemployment_rate"]]
+            .rename(columns={"LI_index": "ECRI", "unemployment_rate": "Unemployment"})
+            .dropna()
+        )
         print("📆 병합 cond_df 마지막 날짜:", cond_df.index.max())
 
         unemp_mean = cond_df["Unemployment"].mean()
@@ -2030,16 +2015,13 @@ class MacroCrawler:
         signal_df = pd.concat([buy_signals, sell_signals]).sort_index()
         return signal_df
     
+    @request_scoped
     def plot_sp500_with_ERCI_signals(self):
         import matplotlib.pyplot as plt
         import seaborn as sns
         sns.set_style("whitegrid")
 
-        sp500 = self.get_sp500().copy()
-        # "date" 컬럼이 존재한다면, 이걸 datetime으로 변환 후 인덱스로 설정
-        sp500["date"] = pd.to_datetime(sp500["date"])
-        sp500 = sp500.set_index("date")
-        sp500 = sp500.sort_index()
+        sp500 = self.get_master_panel(["sp500_close"], ffill=False).dropna()
 
         # 시그널 데이터 정렬
         signal_df = self.find_signals_from_erci_indicators()
@@ -2071,6 +2053,10 @@ class MacroCrawler:
         '''
         로컬에 저장된 S&P500 forward pe 파일 불러오기
         '''
+        # live 모드가 아니면 네트워크 갱신 없이 저장된 CSV 그대로 사용
+        if not self.provider.updates_local_files:
+            return self.snp_forwardpe_updater.df
+
         try:
             snp_fp_df = self.snp_forwardpe_updater.update_forward_pe_csv()
             print("✅ S&P500 Forward PE CSV 업데이트 완료")
@@ -2080,46 +2066,23 @@ class MacroCrawler:
         return snp_fp_df    
 
 
+    @memoized
     def get_forward_pe(self):
             url = 'https://en.macromicro.me/series/20052/sp500-forward-pe-ratio'
 
-            options = Options()
-            # options.add_argument("--headless")
-            options.add_argument("--no-sandbox")
-            options.add_argument("--disable-gpu")
- 
-
-            driver = webdriver.Chrome(options=options)
-            driver.get(url)
-
-
             try:
-                # ✅ 해당 요소가 로드될 때까지 대기 (최대 10초)
-                WebDriverWait(driver, 20).until(
-                    EC.presence_of_element_located((By.CSS_SELECTOR, "div.sidebar-sec.chart-stat-lastrows span.val"))
+                # ✅ HTTP 우선 → 실패 시 브라우저 풀에서 해당 요소가 로드될 때까지 대기
+                return get_page_fetcher().fetch(
+                    url,
+                    parse_macromicro_last_value,
+                    wait_for=(By.CSS_SELECTOR, "div.sidebar-sec.chart-stat-lastrows span.val"),
+                    name="sp500_forward_pe",
                 )
-            except:
-                driver.quit()
+            except Exception:
                 raise RuntimeError("📛 페이지 로딩 중 Forward PE 데이터를 찾지 못했습니다.")
-
-            soup = BeautifulSoup(driver.page_source, 'html.parser')
-            driver.quit()
-
-            latest_val = soup.select_one("div.sidebar-sec.chart-stat-lastrows span.val")
-            date = soup.select_one("div.sidebar-sec.chart-stat-lastrows .date-label")
-
-            if latest_val and date:
-                date_text = date.text.strip()
-                pe_val = float(latest_val.text.strip())
-                df = pd.DataFrame([{"date": date_text, "forward_pe": pe_val}])
-                return {
-                    "date": date_text,
-                    "forward_pe": pe_val
-                }
-            else:
-                raise ValueError("📛 Forward PE 값을 찾을 수 없습니다.")
             
 
+    @memoized
     def get_ttm_pe(self):
         url = "https://www.multpl.com/s-p-500-pe-ratio"
 
@@ -2132,7 +2095,7 @@ class MacroCrawler:
         # driver.get(url)
         # time.sleep(5)  # JS 로딩 대기
 
-        response = requests.get(url)
+        response = get_page_fetcher().http_get(url, name="multpl_ttm_pe")
         soup = BeautifulSoup(response.text, "html.parser")
 
         # 날짜 추출
@@ -2166,6 +2129,7 @@ class MacroCrawler:
 
         return None
 
+    @request_scoped
     def analyze_pe(self,
                 fwd_buy_lt: float = 12.0,
                 fwd_sell_gt: float = 22.0,
@@ -2335,31 +2299,25 @@ class MacroCrawler:
 
     #     return message
     
+    @memoized
     def get_vix_index(self):
         '''
         VIX : VIX는 S&P 500 지수의 옵션 가격에 기초하며, 향후 30일간 지수의 풋옵션1과 콜옵션2 가중 가격을 결합하여 산정
         향후 S&P 500지수가 얼마나 변동할 것으로 투자자들이 생각하는지를 반영
         '''
-        df = yf.download('^VIX', start="2000-01-01", interval="1d")
+        df = self.price_store.get('^VIX')
         if df.empty:
             print("❌ VIX 데이터를 불러오지 못했습니다.")
             return pd.DataFrame()
 
-        # 데이터프레임의 멀티레벨 컬럼을 단일 레벨로 평탄화
-        df.columns = ['_'.join(col) if isinstance(col, tuple) else col for col in df.columns]
-        
-        df = df.reset_index()
-        
-        # 필요한 'Date'와 'Close_^VIX' 컬럼만 선택하고 이름을 변경합니다.
-        df = df[['Date', 'Close_^VIX']].rename(columns={'Date': 'date', 'Close_^VIX': 'vix_index'})
-        
-        df['date'] = pd.to_datetime(df['date'])
+        # 필요한 'date'와 'close' 컬럼만 선택하고 이름을 변경합니다.
+        df = df[['date', 'close']].rename(columns={'close': 'vix_index'})
 
         return df
     
+    @request_scoped
     def analyze_vix(self):
-        df_vix = self.get_vix_index()
-        df_vix = df_vix.sort_values('date')
+        df_vix = self.get_master_series('vix_index')
         latest = df_vix.iloc[-1]
 
         date = latest['date']
@@ -2383,87 +2341,39 @@ class MacroCrawler:
     
     # M2/PER(Forward) 데이터 베이스 구할 수 있나?    
 
+    @memoized
     def get_equity_put_call_ratio(self):
         url = 'https://ycharts.com/indicators/cboe_equity_put_call_ratio'
 
-        options = Options()
-        options.add_argument("--headless")
-        options.add_argument("--disable-gpu")
-        options.add_argument("--no-sandbox")
-
-        driver = webdriver.Chrome(options=options)
-        driver.get(url)
-        time.sleep(5)  # JS 로딩 대기
-
-        soup = BeautifulSoup(driver.page_source, 'html.parser')
-        driver.quit()
+        # HTTP 로 Stats 패널을 먼저 시도하고, 실패 시에만 브라우저 풀('Last Value' 셀 대기) 사용
+        stats = get_page_fetcher().fetch(url, parse_ycharts_stats, wait_for=YCHARTS_STATS_SELECTOR, name="cboe_equity_put_call_ratio")
 
-        # "Last Value" 텍스트가 있는 td 찾기
-        for td in soup.select("td.col-6"):
-            if "Last Value" in td.get_text(strip=True):
-                value_td = td.find_next_sibling("td")
-                if value_td:
-                    equity_value = value_td.get_text(strip=True)
-                    break
-
-        # ✅ Last Period (날짜) 추출 - tr 기반으로 따로 탐색
-        for row in soup.find_all("tr"):
-            tds = row.find_all("td")
-            if len(tds) == 2 and "Latest Period" in tds[0].get_text(strip=True):
-                date = tds[1].get_text(strip=True)
-                break
-
-        if equity_value and date:
-            return {
-                "date": date,
-                "equity_value": equity_value
-            }
-        else:
-            raise ValueError("❌ Last Value 또는 Last Period를 찾을 수 없습니다.")
+        return {
+            "date": stats["date"],
+            "equity_value": stats["value"]
+        }
 
 
+    @memoized
     def get_index_put_call_ratio(self):
         url = 'https://ycharts.com/indicators/cboe_index_put_call_ratio'
 
-        options = Options()
-        options.add_argument("--headless")
-        options.add_argument("--disable-gpu")
-        options.add_argument("--no-sandbox")
-
-        driver = webdriver.Chrome(options=options)
-        driver.get(url)
-        time.sleep(5)  # JS 로딩 대기
-
-        soup = BeautifulSoup(driver.page_source, 'html.parser')
-        driver.quit()
+        # HTTP 로 Stats 패널을 먼저 시도하고, 실패 시에만 브라우저 풀('Last Value' 셀 대기) 사용
+        stats = get_page_fetcher().fetch(url, parse_ycharts_stats, wait_for=YCHARTS_STATS_SELECTOR, name="cboe_index_put_call_ratio")
 
-        # "Last Value" 텍스트가 있는 td 찾기
-        for td in soup.select("td.col-6"):
-            if "Last Value" in td.get_text(strip=True):
-                value_td = td.find_next_sibling("td")
-                if value_td:
-                    index_value = value_td.get_text(strip=True)
-                    break
-
-        # ✅ Last Period (날짜) 추출 - tr 기반으로 따로 탐색
-        for row in soup.find_all("tr"):
-            tds = row.find_all("td")
-            if len(tds) == 2 and "Latest Period" in tds[0].get_text(strip=True):
-                date = tds[1].get_text(strip=True)
-                break
-
-        if index_value and date:
-            return {
-                "date": date,
-                "equity_value": index_value
-            }
-        else:
-            raise ValueError("❌ Last Value 또는 Last Period를 찾을 수 없습니다.")
+        return {
+            "date": stats["date"],
+            "equity_value": stats["value"]
+        }
 
     def update_putcall_ratio(self):
         '''
         로컬에 저장된 PUT CALL RATIO 파일 불러오기
         '''
+        # live 모드가 아니면 네트워크 갱신 없이 저장된 CSV 그대로 사용
+        if not self.provider.updates_local_files:
+            return self.put_call_ratio_updater.df
+
         putcall_df = None  # ✅ 안전한 초깃값
 
         try:
@@ -2474,19 +2384,35 @@ class MacroCrawler:
 
         return putcall_df  
     
+    @memoized
+    def generate_pcr_signals(self, buy_thr=1.5, sell_thr=0.4):
+        """
+        Put/Call Ratio (equity_value) 기준 매수/매도 신호 (S&P500 거래일 기준)
+
+        매수: equity_value > buy_thr
+        매도: equity_value < sell_thr
+
+        Returns
+        -------
+        pandas.DataFrame  # ['date','sp500_close','equity_value','buy_signal','sell_signal']
+        """
+        # 마스터 패널에서 S&P500 일별 종가 + PCR (거래일 기준)
+        df = self.get_master_series("sp500_close").merge(
+            self.get_master_series("equity_pcr").rename(columns={"equity_pcr": "equity_value"}),
+            on="date", how="left",
+        )
+        df["buy_signal"] = df["equity_value"] > buy_thr
+        df["sell_signal"] = df["equity_value"] < sell_thr
+        return df
+
+    @request_scoped
     def plot_sp500_with_pcr_signals(self, save_to: str | None = None):
         """
         Put/Call Ratio (equity_value) 기준으로 S&P500 종가 위에 매수/매도 신호를 표기.
-        동시에 신호 테이블(DataFrame)을 반환합니다.
+        동시에 신호 테이블(DataFrame)을 반환합니다. (신호 = generate_pcr_signals)
 
         Parameters
         ----------
-        pcr_csv : str
-            'date, equity_value, index_value' 컬럼을 갖는 CSV 경로
-        buy_thr : float
-            매수 임계값 (equity_value > buy_thr)
-        sell_thr : float
-            매도 임계값 (equity_value < sell_thr)
         save_to : str | None
             그래프 저장 경로. None이면 저장하지 않음.
 
@@ -2499,48 +2425,16 @@ class MacroCrawler:
         buy_thr = 1.5
         sell_thr = 0.4
 
-        # ---------- 1) S&P500 일별 라인 구성 ----------
-        sp_daily = self.get_sp500().copy()  # 반드시 일별 데이터 반환
-        sp_daily["date"] = pd.to_datetime(sp_daily["date"])
-
-        # 컬럼 표준화
-        if "close" in sp_daily.columns:
-            sp_daily = sp_daily.rename(columns={"close": "sp500_close"})
-        elif "Close" in sp_daily.columns:
-            sp_daily = sp_daily.rename(columns={"Close": "sp500_close"})
-        # 이미 'sp500_close'면 그대로 사용
-
-        sp_line = (
-            sp_daily[["date", "sp500_close"]]
-            .dropna()
-            .drop_duplicates(subset=["date"])
-            .sort_values("date")
-            .reset_index(drop=True)
-        )
-
-        # ---------- 2) PCR 로드 (형식 고정) ----------
-        pcr = pd.read_csv('put_call_ratio.csv')
-        expected_cols = {"date", "equity_value", "index_value"}
-        if set(pcr.columns) != expected_cols:
-            raise ValueError(
-                f"PCR 컬럼은 정확히 {expected_cols} 이어야 합니다. 현재: {list(pcr.columns)}"
-            )
-
-        pcr["date"] = pd.to_datetime(pcr["date"])
-        # 숫자형 보정
-        pcr["equity_value"] = pd.to_numeric(pcr["equity_value"], errors="coerce")
-
-        # ---------- 3) 병합 & 신호 계산 ----------
-        df = sp_line.merge(pcr[["date", "equity_value"]], on="date", how="left")
-
-        buy_mask = df["equity_value"] > buy_thr
-        sell_mask = df["equity_value"] < sell_thr
+        # ---------- 1) 신호 계산 ----------
+        df = self.generate_pcr_signals(buy_thr, sell_thr)
+        buy_mask = df["buy_signal"]
+        sell_mask = df["sell_signal"]
 
         signals_df = df.loc[buy_mask | sell_mask, ["date", "sp500_close", "equity_value"]].copy()
-        signals_df["signal"] = np.where(signals_df["equity_value"] > 1.5, "BUY", "SELL")
+        signals_df["signal"] = np.where(buy_mask[buy_mask | sell_mask], "BUY", "SELL")
         signals_df = signals_df.sort_values("date").reset_index(drop=True)
 
-        # ---------- 4) 시각화 ----------
+        # ---------- 2) 시각화 ----------
         fig, ax = plt.subplots(figsize=(12, 6))
         ax.plot(df["date"], df["sp500_close"], label="S&P 500")
         ax.scatter(df.loc[buy_mask, "date"], df.loc[buy_mask, "sp500_close"],
@@ -2560,9 +2454,10 @@ class MacroCrawler:
 
         return fig, signals_df
 
+    @request_scoped
     def decide_equity_pcr_today(self):
         """
-        put_call_ratio.csv의 가장 최신 관측치를 사용해
+        마스터 패널 equity_pcr 의 가장 최신 관측치를 사용해
         오늘(최근일) 매수/매도/HOLD 시그널을 결정하여 DataFrame으로 반환.
 
         Returns
@@ -2575,16 +2470,7 @@ class MacroCrawler:
         buy_thr: float = 1.5
         sell_thr: float = 0.4
 
-        df = pd.read_csv("put_call_ratio.csv")
-        required = {"date", "equity_value", "index_value"}
-        if not required.issubset(df.columns):
-            raise ValueError(f"put_call_ratio.csv must contain columns: {required}. Got: {list(df.columns)}")
-
-        # 정리
-        df = df.copy()
-        df["date"] = pd.to_datetime(df["date"], errors="coerce")
-        df["equity_value"] = pd.to_numeric(df["equity_value"], errors="coerce")
-        df = df.dropna(subset=["date", "equity_value"]).sort_values("date").reset_index(drop=True)
+        df = self.get_master_series("equity_pcr").rename(columns={"equity_pcr": "equity_value"})
 
         if df.empty:
             # 비어있으면 빈 DF 반환
@@ -2609,6 +2495,7 @@ class MacroCrawler:
         )
         return out
 
+    @request_scoped
     def check_put_call_ratio_warning(self):
         """
         풋콜 레이티오 데이터를 받아와서서
@@ -2642,31 +2529,18 @@ class MacroCrawler:
         FED가 발표하는 지표를 공식적으로 FRED에 제공하는 형태
         상승시 경기회복/확장 의미, 하락시 경기 둔화/침체 의미
         '''
-        
-        url = 'https://api.stlouisfed.org/fred/series/observations'
-        params = {
-            'series_id': 'NFCI',
-            'api_key': self.fred_api_key,
-            'file_type': 'json',
-            'observation_start': '2000-01-01'
-        }
-        response = requests.get(url, params=params)
-        data = response.json()
-        df = pd.DataFrame(data['observations'])
-        df['date'] = pd.to_datetime(df['date'])
-        df['NFCI_index'] = pd.to_numeric(df['value'], errors='coerce')
-        
-        return df
+        return self.get_fred_series('NFCI')
 
+    @request_scoped
     def analyze_nfci(self):
         '''
         nfci < -0.5 금융여건 완화
         nfci > 0.5 금융긴축
         '''
-        df = self.get_nfci()
+        df = self.get_master_series('nfci')
 
         date = df['date'].iloc[-1]
-        nfci_value = df['NFCI_index'].iloc[-1] 
+        nfci_value = float(df['nfci'].iloc[-1])
 
         result = []
 
@@ -2688,34 +2562,8 @@ class MacroCrawler:
         '''
         FRED API : 달러 인덱스
         '''
+        return self.get_fred_series('DTWEXBGS')
 
-        url = 'https://api.stlouisfed.org/fred/series/observations'
-        params = {
-            'series_id' : 'DTWEXBGS', # 달러인덱스
-            'api_key' : self.fred_api_key,
-            'file_type' : 'json',
-            'observation_start' : '2000-01-01' # 시작일(원하는 날짜짜)
-        }
-
-        try:
-            response = requests.get(url, params= params, timeout=10)
-            response.raise_for_status() # HTTP 에러 발생 시 예외 처리
-            data = response.json()
-
-            if 'observations' not in data:
-                raise ValueError(F"'observations' 키가 없음 : {data}")
-
-            # 데이터프레임 변환
-            df = pd.DataFrame(data['observations'])
-            df['date'] = pd.to_datetime(df['date'])
-            df['value'] = pd.to_numeric(df['value'], errors= 'coerce')
-
-            return df
-        
-        except Exception as e:
-            print(f"[ERROR] FRED API 호출 실패 : {e}")
-            return pd.DataFrame()
-      
         # """
         # 달러 인덱스 (DXY) 데이터를 yfinance에서 가져와서 DataFrame으로 반환
         # period: '1d', '5d', '1mo', '3mo', '6mo', '1y', etc.
@@ -2734,83 +2582,21 @@ class MacroCrawler:
         '''
         FRED API : 유로 인덱스
         '''
+        return self.get_fred_series('DEXUSEU')
 
-        url = 'https://api.stlouisfed.org/fred/series/observations'
-        params = {
-            'series_id' : 'DEXUSEU', # 10년물 국채 금리
-            'api_key' : self.fred_api_key,
-            'file_type' : 'json',
-            'observation_start' : '2000-01-01' # 시작일(원하는 날짜짜)
-        }
-
-        try:
-            response = requests.get(url, params= params, timeout=10)
-            response.raise_for_status() # HTTP 에러 발생 시 예외 처리
-            data = response.json()
-
-            if 'observations' not in data:
-                raise ValueError(F"'observations' 키가 없음 : {data}")
-
-            # 데이터프레임 변환
-            df = pd.DataFrame(data['observations'])
-            df['date'] = pd.to_datetime(df['date'])
-            df['value'] = pd.to_numeric(df['value'], errors= 'coerce')
-
-            return df
-        
-        except Exception as e:
-            print(f"[ERROR] FRED API 호출 실패 : {e}")
-            return pd.DataFrame()
-        
     # Clear - 실시간 데이터
     def get_yen_index(self):
         '''
         FRED API : 엔화 인덱스
         '''
+        return self.get_fred_series('DEXJPUS')
 
-        url = 'https://api.stlouisfed.org/fred/series/observations'
-        params = {
-            'series_id' : 'DEXJPUS', # 10년물 국채 금리
-            'api_key' : self.fred_api_key,
-            'file_type' : 'json',
-            'observation_start' : '2000-01-01' # 시작일(원하는 날짜짜)
-        }
-
-        try:
-            response = requests.get(url, params= params, timeout=10)
-            response.raise_for_status() # HTTP 에러 발생 시 예외 처리
-            data = response.json()
-
-            if 'observations' not in data:
-                raise ValueError(F"'observations' 키가 없음 : {data}")
-
-            # 데이터프레임 변환
-            df = pd.DataFrame(data['observations'])
-            df['date'] = pd.to_datetime(df['date'])
-            df['value'] = pd.to_numeric(df['value'], errors= 'coerce')
-
-            return df
-        
-        except Exception as e:
-            print(f"[ERROR] FRED API 호출 실패 : {e}")
-            return pd.DataFrame()
-    
 
     # Clear - 월별 데이터 - 1월 딜레이
+    @memoized
     def get_copper_price_F(self):
         # HG=F: High Grade Copper Futures (구리 선물)
-        df = yf.download("HG=F", start="2000-01-01", interval="1d", group_by="ticker")
-
-        # 1) MultiIndex → 단일 인덱스로 변환
-        if isinstance(df.columns, pd.MultiIndex):
-            df.columns = df.columns.droplevel(0)  # 'CL=F' 레벨 제거 → Price, Close, High...
-            # 또는 df.columns = df.columns.droplevel(0) 하면 'Close', 'High' 등만 남김
-            # 원하는 레벨 선택
-
-        # 2) 인덱스(Date)를 컬럼으로
-        df = df.reset_index()
-        
-        return df
+        return self._futures_frame('HG=F')
 
 
 
@@ -2846,23 +2632,13 @@ class MacroCrawler:
         #     return pd.DataFrame()
     
 
+    @memoized
     def get_gold_price_F(self):
         '''
         FRED API : 금 인덱스
         '''
 
-        df = yf.download("GC=F", start="2000-01-01", interval="1d", group_by="ticker")
-
-        # 1) MultiIndex → 단일 인덱스로 변환
-        if isinstance(df.columns, pd.MultiIndex):
-            df.columns = df.columns.droplevel(0)  # 'CL=F' 레벨 제거 → Price, Close, High...
-            # 또는 df.columns = df.columns.droplevel(0) 하면 'Close', 'High' 등만 남김
-            # 원하는 레벨 선택
-
-        # 2) 인덱스(Date)를 컬럼으로
-        df = df.reset_index()
-        
-        return df
+        return self._futures_frame('GC=F')
 
 
         # url = 'https://api.stlouisfed.org/fred/series/observations'
@@ -2893,55 +2669,42 @@ class MacroCrawler:
         #     return pd.DataFrame()
 
 
+    @memoized
     def get_oil_price_F(self):
         '''
         FRED API : 미국 서부텍사스산 원유 선물
         '''
 
-        df = yf.download("CL=F", start="2000-01-01", interval="1d", group_by="ticker")
-
-        # 1) MultiIndex → 단일 인덱스로 변환
-        if isinstance(df.columns, pd.MultiIndex):
-            df.columns = df.columns.droplevel(0)  # 'CL=F' 레벨 제거 → Price, Close, High...
-            # 또는 df.columns = df.columns.droplevel(0) 하면 'Close', 'High' 등만 남김
-            # 원하는 레벨 선택
+        return self._futures_frame('CL=F')
 
-        # 2) 인덱스(Date)를 컬럼으로
-        df = df.reset_index()
-        
-        return df
+    def _futures_frame(self, ticker):
+        '''
+        가격 저장소 일봉 → 기존 yf.download(group_by="ticker") 평탄화 형태
+        (Date, Close, High, Low, Open, Volume)
+        '''
+        df = self.price_store.get(ticker)
+        df = df.rename(columns={'date': 'Date', 'open': 'Open', 'high': 'High',
+                                'low': 'Low', 'close': 'Close', 'volume': 'Volume'})
+        return df[['Date', 'Close', 'High', 'Low', 'Open', 'Volume']]
 
     def get_high_yield_spread(self):
-        url = 'https://api.stlouisfed.org/fred/series/observations'
-        params = {
-            'series_id': 'BAMLH0A0HYM2',  # 하이일드 스프레드
-            'api_key': self.fred_api_key,
-            'file_type': 'json',
-            'observation_start': '2000-01-01'
-        }
-        response = requests.get(url, params=params)
-        data = response.json()
-        df = pd.DataFrame(data['observations'])
-        df['date'] = pd.to_datetime(df['date'])
-        df['value'] = pd.to_numeric(df['value'], errors='coerce')
-        return df
-    
+        return self.get_fred_series('BAMLH0A0HYM2')
+
 
+    @request_scoped
     def check_high_yield_spread_warning(self):
         """
         하이일드 스프레드 데이터프레임을 받아
         최신값과 전일 대비 변화율을 체크해 경고를 출력하는 함수
         """
-        df = self.get_high_yield_spread()
-        df = df.dropna(subset=['value'])  # NaN 제거
-        df = df.sort_values('date')       # 날짜순 정렬
-        
+        df = self.get_master_series('hy_spread').rename(columns={'hy_spread': 'value'})
+
         today_row = df.iloc[-1]
         date = today_row["date"]
         yesterday_row = df.iloc[-2]
         
-        today_value = today_row['value']
-        yesterday_value = yesterday_row['value']
+        today_value = float(today_row['value'])
+        yesterday_value = float(yesterday_row['value'])
         
         change = today_value - yesterday_value  # 변화량 (포인트)
 
@@ -2967,6 +2730,7 @@ class MacroCrawler:
         }
 
 
+    @memoized
     def get_ma_above_ratio(self):
 
         url = "https://www.barchart.com/stocks/momentum"
@@ -2976,7 +2740,7 @@ class MacroCrawler:
         }
         
         try:
-            response = requests.get(url, headers=headers)
+            response = get_page_fetcher().http_get(url, name="barchart_momentum", headers=headers)
             response.raise_for_status() # HTTP 오류가 발생하면 예외 발생
 
             soup = BeautifulSoup(response.text, 'html.parser')
@@ -3071,6 +2835,7 @@ class MacroCrawler:
             return None, None
 
 
+    @request_scoped
     def interpret_ma_above_ratio(self):
         """
         이평선 상회 비율 해석:
@@ -3134,6 +2899,7 @@ class MacroCrawler:
         return ma_result
     
 
+    @request_scoped
     def analyze_disparity_with_ma(self):
         """
         50일, 200일 이동평균 기준 이격도 계산 및 해석
@@ -3150,20 +2916,18 @@ class MacroCrawler:
                 'long_term_status': 해석 텍스트
             }
         """
-        df = self.get_sp500()
-        df = df.copy()
-        df['MA_50'] = df['sp500_close'].rolling(window=50).mean()
-        df['MA_200'] = df['sp500_close'].rolling(window=200).mean()
-        df.dropna(inplace=True)
+        df = self.get_derived_frame(
+            'sp500_close', 'sp500_ma_50', 'sp500_ma_200', 'sp500_disparity_50', 'sp500_disparity_200'
+        ).dropna()
 
         latest = df.iloc[-1]
         date = latest['date']
         close = latest['sp500_close']
-        ma_50 = latest['MA_50']
-        ma_200 = latest['MA_200']
+        ma_50 = latest['sp500_ma_50']
+        ma_200 = latest['sp500_ma_200']
 
-        disparity_50 = ((close - ma_50) / ma_50) * 100
-        disparity_200 = ((close - ma_200) / ma_200) * 100
+        disparity_50 = latest['sp500_disparity_50']
+        disparity_200 = latest['sp500_disparity_200']
 
         def interpret_disparity_50(val):
             if val <= -5:
@@ -3208,6 +2972,10 @@ class MacroCrawler:
         '''
         로컬에 저장된 bull_bear_spread 파일 불러오기
         '''
+        # live 모드가 아니면 네트워크 갱신 없이 저장된 CSV 그대로 사용
+        if not self.provider.updates_local_files:
+            return self.bull_bear_spread_updater.df
+
         bb_spread = None  # ✅ 변수 초기화
         try:
             bb_spread = self.bull_bear_spread_updater.update_csv()
@@ -3217,45 +2985,20 @@ class MacroCrawler:
         return bb_spread
 
 
+    @memoized
     def get_bull_bear_spread(self):
 
         url = "https://ycharts.com/indicators/us_investor_sentiment_bull_bear_spread"
 
-        options = Options()
-        # options.add_argument("--headless")
-        options.add_argument("--disable-gpu")
-        options.add_argument("--no-sandbox")
-
-        driver = webdriver.Chrome(options=options)
-        driver.get(url)
-        time.sleep(5)  # JS 로딩 대기
+        # HTTP 로 Stats 패널을 먼저 시도하고, 실패 시에만 브라우저 풀('Last Value' 셀 대기) 사용
+        stats = get_page_fetcher().fetch(url, parse_ycharts_stats, wait_for=YCHARTS_STATS_SELECTOR, name="us_investor_sentiment_bull_bear_spread")
 
-        soup = BeautifulSoup(driver.page_source, 'html.parser')
-        driver.quit()
-
-        # "Last Value" 텍스트가 있는 td 찾기
-        for td in soup.select("td.col-6"):
-            if "Last Value" in td.get_text(strip=True):
-                value_td = td.find_next_sibling("td")
-                if value_td:
-                    bull_bear_spread = value_td.get_text(strip=True)
-                    break
-
-        # ✅ Last Period (날짜) 추출 - tr 기반으로 따로 탐색
-        for row in soup.find_all("tr"):
-            tds = row.find_all("td")
-            if len(tds) == 2 and "Latest Period" in tds[0].get_text(strip=True):
-                date = tds[1].get_text(strip=True)
-                break
-
-        if bull_bear_spread and date:
-            return {
-                "date": date,
-                "spread": bull_bear_spread
-            }
-        else:
-            raise ValueError("❌ Last Value 또는 Last Period를 찾을 수 없습니다.")
+        return {
+            "date": stats["date"],
+            "spread": stats["value"]
+        }
         
+    @request_scoped
     def plot_snp_with_bull_bear_signals_from_crawler(
         self,
         buy_th: float = -0.2,
@@ -3268,38 +3011,21 @@ class MacroCrawler:
         save_csv_path: str | None = None,
     ):
         """
-        MacroCrawler.update_bull_bear_spread() + MacroCrawler.get_sp500() 사용.
+        마스터 패널의 bull_bear_spread / sp500_close 사용.
         - Bull-Bear spread < buy_th  → Buy 신호
         - Bull-Bear spread > sell_th → Sell 신호
         - 신호 날짜를 S&P500 최근접 거래일로 정렬(merge_asof)
         - 반환: 신호별 이벤트 DataFrame
         """
-        # 1) 데이터 로드
-        bb = pd.read_csv('bull_bear_spread.csv')  # 필요: ['date','spread']
-        snp = self.get_sp500()                # 필요: ['date','sp500_close']
-
-        # 2) 전처리
-        for df in (bb, snp):
-            if "date" not in df.columns:
-                raise ValueError("입력 데이터에 'date' 컬럼이 없습니다.")
-            df["date"] = pd.to_datetime(df["date"])
-            df.sort_values("date", inplace=True)
-            df.drop_duplicates(subset=["date"], keep="last", inplace=True)
-
-        if "spread" not in bb.columns:
-            cand = [c for c in bb.columns if "spread" in c.lower()]
-            if not cand:
-                raise ValueError("Bull-Bear 데이터에 'spread' 컬럼이 없습니다.")
-            bb = bb.rename(columns={cand[0]: "spread"})
-
-        if "sp500_close" not in snp.columns:
-            raise ValueError("S&P500 데이터에 'sp500_close' 컬럼이 없습니다.")
-
-        # 3) 신호 생성
+        # 1) 데이터 로드 (관측값이 있는 거래일만)
+        bb = self.get_master_series("bull_bear_spread").rename(columns={"bull_bear_spread": "spread"})
+        snp = self.get_master_series("sp500_close")
+
+        # 2) 신호 생성
         buy_df  = bb[bb["spread"] < buy_th].copy()
         sell_df = bb[bb["spread"] > sell_th].copy()
 
-        # 4) 최근접 거래일 매칭
+        # 3) 최근접 거래일 매칭
         snp_slim = snp[["date", "sp500_close"]].rename(columns={"sp500_close": "snp"})
         buy_aligned = pd.merge_asof(
             buy_df.sort_values("date"),
@@ -3319,7 +3045,7 @@ class MacroCrawler:
         ).dropna(subset=["snp"])
         sell_aligned["signal"] = "sell"
 
-        # 5) 이벤트 DataFrame으로 결합 & 정렬
+        # 4) 이벤트 DataFrame으로 결합 & 정렬
         events_df = pd.concat([buy_aligned, sell_aligned], ignore_index=True)
         events_df["threshold_buy"] = buy_th
         events_df["threshold_sell"] = sell_th
@@ -3330,7 +3056,7 @@ class MacroCrawler:
         # if save_csv_path:
         #     events_df.to_csv(save_csv_path, index=False)
 
-        # 6) 시각화
+        # 5) 시각화
         fig, ax = plt.subplots(figsize=(14, 7))
         ax.plot(snp["date"], snp["sp500_close"], label="S&P500")
 
@@ -3358,6 +3084,7 @@ class MacroCrawler:
         return fig, ax, events_df
 
 
+    @memoized
     def generate_bull_bear_signals(self):
         """
         Bull-Bear Spread 기준 투자 전략
@@ -3369,16 +3096,10 @@ class MacroCrawler:
         buy_th = float(-0.2)
         sell_th = float(0.4)
 
-        df = pd.read_csv("bull_bear_spread.csv")
-    
-        if df is None or df.empty:
-            raise ValueError("bull_bear_spread.csv가 비어 있거나 로드에 실패했습니다.")
-        if "date" not in df.columns or "spread" not in df.columns:
-            raise ValueError("bull_bear_spread.csv는 'date', 'spread' 컬럼을 포함해야 합니다.")
-        
-        df = df.dropna(subset=["date", "spread"]).copy()
-        df["date"] = pd.to_datetime(df["date"])
-        df = df.sort_values("date").reset_index(drop=True)
+        df = self.get_master_series("bull_bear_spread").rename(columns={"bull_bear_spread": "spread"})
+
+        if df.empty:
+            raise ValueError("마스터 패널에 bull_bear_spread 관측값이 없습니다.")
 
         df_latest = df.iloc[-1]
         spread_val = float(df_latest["spread"])
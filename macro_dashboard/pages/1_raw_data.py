@@ -207,17 +207,29 @@ def draw_abs_chart(
 # 화면 구성 시작
 # =========================
 st.title("📂 원시 데이터 보기")
-st.header("📊 미국 금리 시각화 대시보드")
 
-# ⬇️ 금리 관련 데이터 로딩
-df_10y = crawler.get_10years_treasury_yeild()
-df_10y['date'] = df_10y['date'].dt.to_period('M').dt.to_timestamp()
+# ⬇️ 페이지에서 쓰는 모든 시리즈를 마스터 패널(Parquet)에서 한 번에 읽기
+panel = crawler.get_master_panel(ffill=False)
+
+def panel_series(columns, names=None, monthly=False):
+    '''
+    패널 컬럼 → 관측값이 있는 날만 (date + 값 컬럼)
+    monthly=True 이면 날짜를 해당 월 1일로 (패널은 월 첫 거래일에 저장)
+    '''
+    columns = [columns] if isinstance(columns, str) else list(columns)
+    names = [names] if isinstance(names, str) else list(names or columns)
+    df = panel[columns].dropna(how='all').astype(float)
+    df = df.rename(columns=dict(zip(columns, names))).reset_index()
+    if monthly:
+        df['date'] = df['date'].dt.to_period('M').dt.to_timestamp()
+    return df
 
-df_2y = crawler.get_2years_treasury_yeild()
-df_2y['date'] = df_2y['date'].dt.to_period('M').dt.to_timestamp()
+st.header("📊 미국 금리 시각화 대시보드")
 
-df_fed = crawler.get_fed_funds_rate()
-df_fed['date'] = df_fed['date'].dt.to_period('M').dt.to_timestamp()
+# ⬇️ 금리 관련 데이터 로딩
+df_10y = panel_series('10y', 'value', monthly=True)
+df_2y = panel_series('2y', 'value', monthly=True)
+df_fed = panel_series('fed_funds_rate', monthly=True)
 
 # ⬇️ 실질 금리(현재 코드는 10Y-2Y 스프레드로 계산)
 diff_rate = pd.DataFrame({
@@ -226,8 +238,7 @@ diff_rate = pd.DataFrame({
 })
 
 # ⬇️ CPI YoY
-df_cpi = crawler.get_cpi_yoy()
-df_cpi['date'] = df_cpi['date'].dt.to_period('M').dt.to_timestamp()
+df_cpi = panel_series('cpi_yoy', 'CPI YOY(%)', monthly=True)
 
 # 🔳 시각화 (1행 3열)
 figsize3 = get_figsize_for_cols(3)
@@ -270,17 +281,10 @@ st.markdown("---")
 st.header("💵 유동성 지표 (M2, Margin Debt)")
 
 # ⬇️ M2
-m2_df = crawler.get_m2()
-m2_df['date'] = pd.to_datetime(m2_df['date'])
-m2_df['value'] = pd.to_numeric(m2_df['value'], errors='coerce')
+m2_df = panel_series('m2', 'value', monthly=True)
 
 # ⬇️ Margin Debt
-md_df = pd.read_csv("md_df.csv")
-md_df['date'] = pd.to_datetime(md_df['Month/Year'], format='mixed', errors='coerce')
-md_df['margin_debt'] = (
-    md_df["Debit Balances in Customers' Securities Margin Accounts"]
-    .astype(str).str.replace(",", "", regex=False).astype(float)
-)
+md_df = panel_series('margin_debt', monthly=True)
 
 col1, col2 = st.columns(2)
 with col1:
@@ -299,30 +303,12 @@ with col2:
 st.markdown("---")
 st.header("💰 통화 및 가격 지표")
 
-dollar_index = crawler.get_dollar_index()
-yen_index = crawler.get_yen_index()
-euro_index = crawler.get_euro_index()
-copper_price = crawler.get_copper_price_F()
-gold_price = crawler.get_gold_price_F()
-oil_price = crawler.get_oil_price_F()
-
-dollar_index['date'] = pd.to_datetime(dollar_index['date'])
-dollar_index['value'] = pd.to_numeric(dollar_index['value'], errors='coerce')
-
-yen_index['date'] = pd.to_datetime(yen_index['date'])
-yen_index['value'] = pd.to_numeric(yen_index['value'], errors='coerce')
-
-euro_index['date'] = pd.to_datetime(euro_index['date'])
-euro_index['value'] = pd.to_numeric(euro_index['value'], errors='coerce')
-
-copper_price['date'] = pd.to_datetime(copper_price['Date'])
-copper_price['value'] = pd.to_numeric(copper_price['Close'], errors='coerce')
-
-gold_price['date'] = pd.to_datetime(gold_price['Date'])
-gold_price['value'] = pd.to_numeric(gold_price['Close'], errors='coerce')
-
-oil_price['date'] = pd.to_datetime(oil_price['Date'])
-oil_price['value'] = pd.to_numeric(oil_price['Close'], errors='coerce')
+dollar_index = panel_series('dollar_index', 'value')
+yen_index = panel_series('yen', 'value')
+euro_index = panel_series('euro', 'value')
+copper_price = panel_series('copper', 'value')
+gold_price = panel_series('gold', 'value')
+oil_price = panel_series('crude_oil', 'value')
 
 figsize3 = get_figsize_for_cols(3)
 col1, col2, col3 = st.columns(3)
@@ -370,14 +356,14 @@ with col3:
 st.markdown("---")
 st.header("📈 기타 경제 지표")
 
-unemployment_rate = crawler.get_unemployment_rate()  # date, unemployment_rate
-pmi_index = pd.read_csv("pmi_data.csv")              # date, PMI
-UMCSENT_index = crawler.get_UMCSENT_index()         # date, umcsent_index
-vix_index = crawler.get_vix_index()                 # date, vix_index
-put_call_ratio = pd.read_csv("put_call_ratio.csv")  # date, equity_value, index_value
-ncfi_data = crawler.get_nfci()                      # date, NFCI_index
-high_yeild_spread = crawler.get_high_yield_spread() # date, value
-bull_bear_spread = pd.read_csv("bull_bear_spread.csv")  # date, spread
+unemployment_rate = panel_series('unemployment_rate', monthly=True)                      # date, unemployment_rate
+pmi_index = panel_series('pmi', 'PMI', monthly=True)                                         # date, PMI
+UMCSENT_index = panel_series('umcsent', 'umcsent_index', monthly=True)                       # date, umcsent_index
+vix_index = panel_series('vix_index')                                                        # date, vix_index
+put_call_ratio = panel_series(['equity_pcr', 'index_pcr'], ['equity_value', 'index_value'])  # date, equity_value, index_value
+ncfi_data = panel_series('nfci', 'NFCI_index')                                               # date, NFCI_index
+high_yeild_spread = panel_series('hy_spread', 'value')                                       # date, value
+bull_bear_spread = panel_series('bull_bear_spread', 'spread')                                # date, spread
 
 figsize2 = get_figsize_for_cols(2)
 col1, col2 = st.columns(2)
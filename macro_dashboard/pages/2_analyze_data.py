@@ -89,6 +89,7 @@ selected_font = setup_font()
 # 🔧 상위 폴더의 macro_crawling 모듈 임포트 설정
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../..")))
 from macro_crawling import MacroCrawler
+from backtest import SIGNAL_EVENTS
 
 # ✅ 실행 환경에 따라 MacroCrawler 인스턴스 처리 (세션에 없으면 생성)
 if "crawler" not in st.session_state or st.session_state.crawler is None:
@@ -195,4 +196,30 @@ else:
 
 st.write("REI & PMI에 따른 주식 매수 시그널")
 st.write("6개월 금리 변화 임계값 (매수) : ≥ +0.25%p + PMI > 50 + 미국선행경기지수 > 100")
-st.write("2015-08-01 부터 데이터 존재")
\ No newline at end of file
+st.write("2015-08-01 부터 데이터 존재")
+# =========================
+# 신호 이벤트 스터디
+# =========================
+st.subheader("신호 이벤트 스터디 (신호일 전후 S&P500 경로)")
+
+col1, col2, col3 = st.columns(3)
+strategy = col1.selectbox("전략", list(SIGNAL_EVENTS), index=list(SIGNAL_EVENTS).index("vix_bands"))
+before = col2.slider("신호 전 거래일", min_value=5, max_value=120, value=20, step=5)
+after = col3.slider("신호 후 거래일", min_value=20, max_value=252, value=60, step=10)
+
+try:
+    fig, study = crawler.plot_event_study(strategy, before=before, after=after)
+    st.pyplot(fig, use_container_width=True)
+    plt.close(fig)
+
+    # 주요 시점 요약 (진입일 종가 대비 %)
+    marks = [d for d in (-before, 5, 21, 63, 126, 252) if d <= after]
+    st.dataframe(
+        study[study["offset"].isin(marks)].drop(columns=["strategy"], errors="ignore").round(2),
+        use_container_width=True,
+    )
+except Exception as e:
+    st.info(f"{strategy} 이벤트 스터디를 계산할 수 없습니다: {e}")
+
+st.write("진입일(신호일 이후 첫 거래일) 종가를 0%로 두고, 모든 신호의 전후 S&P500 수익률 경로를 평균/중앙값/분위수로 요약")
+st.write("진한 밴드: 25~75% 분위, 옅은 밴드: 10~90% 분위")
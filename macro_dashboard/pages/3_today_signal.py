@@ -1,6 +1,7 @@
 # pages/3_today_signal.py
 import streamlit as st
 import pandas as pd
+import matplotlib.pyplot as plt
 import os, sys, importlib
 from pathlib import Path
 
@@ -24,7 +25,7 @@ st.title("📅 Today’s Trading Signal")
 # 세션 크롤러 준비 (메서드 없으면 재생성)
 if "crawler" not in st.session_state:
     st.session_state.crawler = MacroCrawler()
-elif not hasattr(st.session_state.crawler, "get_today_signal_with_m2_and_margin_debt"):
+elif not hasattr(st.session_state.crawler, "get_today_consensus"):
     # 예전 인스턴스(메서드 없음) → 새로 만듦
     st.session_state.crawler = MacroCrawler()
 
@@ -33,6 +34,34 @@ crawler = st.session_state.crawler
 # (선택) 디버그: 실제 로드된 파일 경로 확인
 # st.caption(f"macro_crawling: {mc.__file__}")
 
+# -------------
+# 전략별 오늘 신호 요약 (합의 행렬 마지막 행 조회)
+st.subheader("🚦 전략별 신호 합의")
+
+matrix = crawler.get_consensus_matrix()
+today = crawler.get_today_consensus()
+
+col1, col2, col3 = st.columns(3)
+col1.metric("기준일", today["date"])
+col2.metric("합의 점수", f"{today['consensus']:+d}")
+col3.metric("매수 / 매도", f"{today['buy']} / {today['sell']}")
+
+icons = {"BUY": "🟢 BUY", "SELL": "🔴 SELL", "HOLD": "⚪ HOLD"}
+st.dataframe(
+    pd.DataFrame({"전략": list(today["signals"]), "시그널": [icons[v] for v in today["signals"].values()]}),
+    use_container_width=True, hide_index=True,
+)
+st.caption("이평선 상회 비율 / TTM P/E 는 과거 이력이 없어 합의 점수에서 제외 (아래 세부 내용 참고)")
+
+days = st.slider("히트맵 기간 (거래일)", min_value=60, max_value=min(1500, len(matrix)), value=min(250, len(matrix)), step=10)
+fig = crawler.plot_consensus_heatmap(days=days)
+st.pyplot(fig, use_container_width=True)
+plt.close(fig)
+
+# 지표별 세부 내용은 요청할 때만 계산
+if not st.toggle("지표별 세부 내용 보기", value=False):
+    st.stop()
+
 res = crawler.get_today_signal_with_m2_and_margin_debt()
 
 st.subheader("M2/Margin_Debt에 따른 매수/매도 판단")
@@ -53,8 +82,7 @@ if nr:
 # -------------
 st.subheader("오늘의 VIX 시그널")
 
-df_vix = crawler.get_vix_index()
-df_vix = df_vix.sort_values('date')
+df_vix = crawler.get_master_series('vix_index')
 latest = df_vix.iloc[-1]
 
 date = latest['date']
@@ -183,7 +211,7 @@ with col3:
     st.markdown("**설명**")
     st.write(ma_disparity['comment_50'][0]) # st.write는 글자를 잘라내지 않습니다.
 
-st.caption("임계치 : -10% 미만: 매수 / 20% 이상: 매도")
+st.caption("임계치 : -5% 이하: 매수 / 10% 초과: 매도")
 
 # 200일선
 col1, col2, col3 = st.columns(3)
@@ -198,7 +226,7 @@ with col3:
     st.markdown("**설명**")
     st.write(ma_disparity['comment_200'][0]) # st.write는 글자를 잘라내지 않습니다.
 
-st.caption("임계치 : -10% 미만: 매수 / 20% 이상: 매도")
+st.caption("임계치 : -10% 이하: 매수 / 20% 초과: 매도")
 
 #--------------
 st.subheader("미국선행경기지수 + PMI")
@@ -231,6 +259,7 @@ with c3:
     st.write(lei_pmi_signal["Change_rate"])
 
 st.write(f"임계치 : pmi > 50 + lei > 100 + change_rate : {buy_delta_pp}")
+st.caption(f"LEI 기준일 : {lei_pmi_signal['LEI 기준일']} (매월 30일 발표 → 그 전에는 전전월 값)")
 
 
 #--------------
@@ -309,9 +309,8 @@ if st.button('분석하기'):
                 st.metric("Market Cap", f"{market_cap:,.0f}" if market_cap is not None else "데이터 없음")
 
                 # 주식 매수, 매도 평가
-                df_10y = crawler.get_10years_treasury_yeild()
-                df_10y['date'] = df_10y['date'].dt.to_period('M').dt.to_timestamp()
-                df_10y_rate = df_10y['value'].iloc[-1]
+                df_10y = crawler.get_master_series('10y')
+                df_10y_rate = float(df_10y['10y'].iloc[-1])
                 st.metric("10년물 국채금리", f"{df_10y_rate:0.2f}")
 
                 #5년 평균 영업현금흐름
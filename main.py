@@ -1,4 +1,4 @@
-from fastapi import FastAPI
+from fastapi import FastAPI, Query
 from fastapi.responses import StreamingResponse
 from macro_crawling import MacroCrawler
 import pandas as pd
@@ -11,6 +11,7 @@ import matplotlib.font_manager as fm
 from fastapi.responses import HTMLResponse
 import base64
 from fastapi.responses import PlainTextResponse
+from significance import MAX_DRAWS
 
 font_path = os.path.join("fonts", "NanumGothic.ttf")
 if os.path.exists(font_path):
@@ -42,10 +43,8 @@ def check_today_signal():
             "mdyoy_signal": []
         }
 
-        df = crawler.merge_m2_margin_sp500_abs()
-
         # Z-Score
-        zscore_df = crawler.generate_zscore_trend_signals(df)
+        zscore_df = crawler.generate_zscore_trend_signals()
         zscore_df["action_month"] = zscore_df["action_date"].dt.to_period("M")
         zscore_today = zscore_df[zscore_df["action_month"] == today_month]
 
@@ -58,7 +57,7 @@ def check_today_signal():
             })
 
         # Margin Debt YoY
-        mdyoy_df = crawler.generate_mdyoy_signals(df)
+        mdyoy_df = crawler.generate_mdyoy_signals()
         mdyoy_df["action_month"] = mdyoy_df["action_date"].dt.to_period("M")
         mdyoy_today = mdyoy_df[mdyoy_df["action_month"] == today_month]
         mdyoy_filtered = mdyoy_today[mdyoy_today["buy_signal"] | mdyoy_today["sell_signal"]]
@@ -83,11 +82,9 @@ def plot_mdyoy_graph():
 
     try:
         crawler = MacroCrawler()
-        df = crawler.merge_m2_margin_sp500_abs()
-        df = crawler.generate_mdyoy_signals(df)
 
         buf = BytesIO()
-        crawler.plot_sp500_with_mdyoy_signals_and_graph(df, save_to=buf)
+        crawler.plot_sp500_with_mdyoy_signals_and_graph(save_to=buf)
         buf.seek(0)
 
         return StreamingResponse(buf, media_type="image/png")
@@ -101,10 +98,9 @@ def plot_zscore_graph():
 
     try:
         crawler = MacroCrawler()
-        df = crawler.merge_m2_margin_sp500_abs()
 
         buf = BytesIO()
-        crawler.plot_sp500_with_signals_and_graph(df, save_to=buf)
+        crawler.plot_sp500_with_signals_and_graph(save_to=buf)
         buf.seek(0)
 
         return StreamingResponse(buf, media_type="image/png")
@@ -117,14 +113,13 @@ def plot_zscore_graph():
 def signal_history():
     try:
         crawler = MacroCrawler()
-        df = crawler.merge_m2_margin_sp500_abs()
 
         result = {
             "zscore_signals": [],
             "mdyoy_signals": []
         }
 
-        zscore_df = crawler.generate_zscore_trend_signals(df)
+        zscore_df = crawler.generate_zscore_trend_signals()
         for _, row in zscore_df.iterrows():
             result["zscore_signals"].append({
                 "signal": row["signal"],
@@ -133,7 +128,7 @@ def signal_history():
                 "expected_return_3m": round(row["return_3m"] * 100, 2)
             })
 
-        mdyoy_df = crawler.generate_mdyoy_signals(df)
+        mdyoy_df = crawler.generate_mdyoy_signals()
         filtered_df = mdyoy_df[mdyoy_df["buy_signal"] | mdyoy_df["sell_signal"]]
         for _, row in filtered_df.iterrows():
             signal_type = "BUY" if row["buy_signal"] else "SELL"
@@ -161,21 +156,9 @@ def rate_correlations(show_plot: bool = False):
 
         # show_plot 파라미터가 True이면 히트맵을 그려 StreamingResponse로 반환
         if show_plot:
-            sp500   = crawler.get_sp500()
-            df_10y  = crawler.get_10years_treasury_yeild()
-            df_2y   = crawler.get_2years_treasury_yeild()
-            cpi_yoy = crawler.get_cpi_yoy()
-            fed     = crawler.get_fed_funds_rate()
-
-            # 월 단위 날짜 통일
-            for df in [sp500, df_10y, df_2y, cpi_yoy, fed]:
-                df['date'] = pd.to_datetime(df['date']).dt.to_period('M').dt.to_timestamp()
-
-            # 병합 및 상관행렬 계산(위에서 수정한 컬럼 생성 포함)
-            df = sp500.merge(df_10y[['date','value']], on='date').rename(columns={'value':'10y'})
-            df = df.merge(df_2y[['date','value']], on='date').rename(columns={'value':'2y'})
-            df = df.merge(cpi_yoy[['date','CPI YOY(%)']], on='date').rename(columns={'CPI YOY(%)':'cpi_yoy'})
-            df = df.merge(fed[['date','fed_funds_rate']], on='date')
+            # 마스터 패널 슬라이스 (analyze_rate_correlations 와 같은 월 내 채움)
+            df = crawler.get_master_panel(['sp500_close', '10y', '2y', 'cpi_yoy', 'fed_funds_rate'], ffill=False)
+            df = df.groupby(df.index.to_period('M')).ffill().dropna().astype(float)
             df['real_10y'] = df['10y'] - df['cpi_yoy']
             df['spread']   = df['10y'] - df['2y']
             df['ffr_vs_2y']= df['fed_funds_rate'] - df['2y']
@@ -202,7 +185,112 @@ def rate_correlations(show_plot: bool = False):
         print("❌ /rate-correlations 에러:", e)
         traceback.print_exc()
         return {"error": str(e)}
-    
+
+
+@app.get("/rate-signal-history")
+def rate_signal_history(use_2y_vs_fed: bool = False):
+    """
+    월별 금리 시그널 전체 이력 (get_rate_signal 과 같은 규칙)
+    use_2y_vs_fed=True 이면 '2Y < 기준금리 → +1' 항목 포함
+    """
+    try:
+        crawler = MacroCrawler()
+        df = crawler.get_rate_signal_history(use_2y_vs_fed=use_2y_vs_fed)
+        df = df.dropna(subset=["rate_signal", "real_10y", "real_2y", "spread", "fed_funds_rate"])
+
+        return [
+            {
+                "date": str(row["date"].date()),
+                "rate_signal": int(row["rate_signal"]),
+                "real_10y": round(row["real_10y"], 3),
+                "real_2y": round(row["real_2y"], 3),
+                "spread": round(row["spread"], 3),
+                "fed_funds_rate": round(row["fed_funds_rate"], 3),
+            }
+            for _, row in df.iterrows()
+        ]
+
+    except Exception as e:
+        print("❌ /rate-signal-history 에러:", e)
+        traceback.print_exc()
+        return {"error": str(e)}
+
+
+def _json_records(df, digits=3):
+    """
+    DataFrame → JSON 응답용 레코드 (날짜는 'YYYY-MM-DD', 결측은 None)
+    """
+    df = df.copy()
+    for col in df.columns:
+        if pd.api.types.is_datetime64_any_dtype(df[col]):
+            df[col] = df[col].dt.strftime("%Y-%m-%d")
+        elif pd.api.types.is_float_dtype(df[col]):
+            df[col] = df[col].round(digits)
+    return df.astype(object).where(df.notna(), None).to_dict(orient="records")
+
+
+@app.get("/backtest")
+def backtest(strategies: str = None, horizons: str = None, include_trades: bool = False,
+             n_draws: int = Query(0, ge=0, le=MAX_DRAWS), seed: int = None):
+    """
+    신호 이벤트 백테스트 (전략 × 신호 × 보유기간별 손익, 적중률, MAE, 최대 낙폭)
+    strategies / horizons 는 쉼표로 구분 (예: ?strategies=zscore_trend,vix_bands&horizons=1M,3M)
+    include_trades=True 이면 이벤트별 성과도 함께 반환
+    n_draws > 0 이면 무작위 진입 부트스트랩 p-value 도 함께 반환 (예: &n_draws=5000, 최대 MAX_DRAWS)
+    """
+    try:
+        crawler = MacroCrawler()
+        result = crawler.backtest_signals(
+            strategies=strategies.split(",") if strategies else None,
+            horizons=horizons.split(",") if horizons else None,
+            n_draws=n_draws or None,
+            seed=seed,
+        )
+
+        response = {"summary": _json_records(result["summary"])}
+        if "significance" in result:
+            response["significance"] = _json_records(result["significance"], digits=4)
+        if include_trades:
+            response["trades"] = _json_records(result["trades"])
+        return response
+
+    except Exception as e:
+        print("❌ /backtest 에러:", e)
+        traceback.print_exc()
+        return {"error": str(e)}
+
+
+@app.get("/consensus/today")
+def consensus_today():
+    """
+    오늘(마지막 거래일) 전략별 BUY/HOLD/SELL + 합의 점수 (합의 행렬 마지막 행)
+    """
+    try:
+        return MacroCrawler().get_today_consensus()
+
+    except Exception as e:
+        print("❌ /consensus/today 에러:", e)
+        traceback.print_exc()
+        return {"error": str(e)}
+
+
+@app.get("/consensus")
+def consensus(start: str = None, end: str = None, days: int = 250):
+    """
+    신호 합의 행렬 이력 (BUY=1 / HOLD=0 / SELL=-1, consensus = 합)
+    start/end 가 없으면 최근 days 거래일
+    """
+    try:
+        matrix = MacroCrawler().get_consensus_matrix(start=start, end=end)
+        if start is None and end is None:
+            matrix = matrix.iloc[-days:]
+        return {"signals": _json_records(matrix.reset_index())}
+
+    except Exception as e:
+        print("❌ /consensus 에러:", e)
+        traceback.print_exc()
+        return {"error": str(e)}
+
 
 @app.get("/plot-sell-signals-with-data", response_class=HTMLResponse)
 def plot_sell_signals_with_data():
@@ -383,16 +471,15 @@ def analyze_vix():
 
     try:
         crawler = MacroCrawler()
-        vix_df = crawler.get_vix_index()
+        vix_df = crawler.get_master_series('vix_index')
 
         # 해석 코멘트 생성
         comment = []
 
-        vix_df = vix_df.sort_values('date')
         latest = vix_df.iloc[-1]
 
-        date = latest['date']
-        vix = float(latest['vix'])  # ← 여기서 float 변환
+        date = latest['date'].strftime('%Y-%m-%d')
+        vix = float(latest['vix_index'])  # ← 여기서 float 변환
 
         result = [f"📅 기준일: {date}",
                 f"📊 VIX 지수 (S&P 500 변동성): {vix:.2f}"]
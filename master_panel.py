@@ -0,0 +1,188 @@
+'''
+일별 마스터 매크로 패널 (Parquet, float32)
+- index : S&P500 거래일 + 거래일 구간 밖의 관측일 (datetime64), columns : MASTER_PANEL_SERIES 전체
+- 각 관측값은 관측일 이후 첫 거래일 행에 저장 (관측일 기준, 발표 시차는 pit_panel 참고)
+  거래일 구간 밖(2000년 이전 월별 이력, 마지막 거래일 이후 새 CSV 관측치)은 관측일 행 그대로
+- 갱신 주기(MASTER_PANEL_TTL)마다 한 번 생성 → 분석/API/대시보드는 필요한 컬럼만 읽음
+
+실행: python master_panel.py  (현재 데이터 모드로 패널 재생성)
+'''
+import os
+import time
+from datetime import timedelta
+
+import numpy as np
+import pandas as pd
+
+from series_cache import CACHE_DB_PATH
+
+
+MASTER_PANEL_PATH = os.path.join(os.path.dirname(CACHE_DB_PATH) or ".", "master_panel.parquet")
+MASTER_PANEL_TTL = timedelta(hours=1)
+
+# 패널 컬럼 → (MacroCrawler 조회 경로, 날짜 컬럼, 값 컬럼)
+# - 로컬 CSV 시리즈는 업데이트기의 df 를 그대로 사용 (패널 생성 시 스크래핑 없음)
+MASTER_PANEL_SERIES = {
+    'sp500_close':       {'loader': 'get_sp500',                      'date_column': 'date',       'column': 'sp500_close'},
+    'vix_index':         {'loader': 'get_vix_index',                  'date_column': 'date',       'column': 'vix_index'},
+    '10y':               {'loader': 'get_10years_treasury_yeild',     'date_column': 'date',       'column': 'value'},
+    '2y':                {'loader': 'get_2years_treasury_yeild',      'date_column': 'date',       'column': 'value'},
+    'fed_funds_rate':    {'loader': 'get_fed_funds_rate',             'date_column': 'date',       'column': 'fed_funds_rate'},
+    'cpi':               {'loader': 'get_cpi',                        'date_column': 'date',       'column': 'value'},
+    'cpi_yoy':           {'loader': 'get_cpi_yoy',                    'date_column': 'date',       'column': 'CPI YOY(%)'},
+    'm2':                {'loader': 'get_m2',                         'date_column': 'date',       'column': 'value'},
+    'margin_debt':       {'loader': 'margin_updater.df',              'date_column': 'Month/Year', 'column': "Debit Balances in Customers' Securities Margin Accounts"},
+    'pmi':               {'loader': 'pmi_updater.df',                 'date_column': 'Month/Year', 'column': 'PMI'},
+    'lei':               {'loader': 'lei_updater.df',                 'date_column': 'date',       'column': 'value'},
+    'cli':               {'loader': 'get_CLI',                        'date_column': 'date',       'column': 'CLI_index'},
+    'li_index':          {'loader': 'get_USSLIND',                    'date_column': 'date',       'column': 'LI_index'},
+    'nfci':              {'loader': 'get_nfci',                       'date_column': 'date',       'column': 'NFCI_index'},
+    'hy_spread':         {'loader': 'get_high_yield_spread',          'date_column': 'date',       'column': 'value'},
+    'unemployment_rate': {'loader': 'get_unemployment_rate',          'date_column': 'date',       'column': 'unemployment_rate'},
+    'umcsent':           {'loader': 'get_UMCSENT_index',              'date_column': 'date',       'column': 'umcsent_index'},
+    'equity_pcr':        {'loader': 'put_call_ratio_updater.df',      'date_column': 'date',       'column': 'equity_value'},
+    'index_pcr':         {'loader': 'put_call_ratio_updater.df',      'date_column': 'date',       'column': 'index_value'},
+    'bull_bear_spread':  {'loader': 'bull_bear_spread_updater.df',    'date_column': 'date',       'column': 'spread'},
+    'dollar_index':      {'loader': 'get_dollar_index',               'date_column': 'date',       'column': 'value'},
+    'euro':              {'loader': 'get_euro_index',                 'date_column': 'date',       'column': 'value'},
+    'yen':               {'loader': 'get_yen_index',                  'date_column': 'date',       'column': 'value'},
+    'copper':            {'loader': 'get_copper_price_F',             'date_column': 'Date',       'column': 'Close'},
+    'gold':              {'loader': 'get_gold_price_F',               'date_column': 'Date',       'column': 'Close'},
+    'crude_oil':         {'loader': 'get_oil_price_F',                'date_column': 'Date',       'column': 'Close'},
+}
+
+
+def _resolve(crawler, path):
+    '''
+    'get_m2' → crawler.get_m2(), 'margin_updater.df' → crawler.margin_updater.df
+    '''
+    target = crawler
+    for part in path.split('.'):
+        target = getattr(target, part)
+    return target() if callable(target) else target
+
+
+def _to_numeric(values):
+    # '103,337' 같은 천 단위 구분 문자열도 숫자로
+    if values.dtype == object or pd.api.types.is_string_dtype(values):
+        values = values.astype(str).str.replace(',', '', regex=False)
+    return pd.to_numeric(values, errors='coerce')
+
+
+def to_float64(values):
+    '''
+    float32 패널 값 → float64 (float32 를 구분하는 가장 짧은 10진 표기로 복원, 예: 0.95f → 0.95)
+    - 원자료가 유효숫자 7자리 이하 10진 값이면 원래 float64 값과 같음 → 임계값 비교 결과 유지
+    '''
+    return np.asarray(values, dtype=np.float32).astype(str).astype(np.float64)
+
+
+def place_on_calendar(calendar, dates, values):
+    '''
+    관측값 → 관측일 이후(당일 포함) 첫 거래일 위치 (같은 거래일에 여럿이면 마지막 값)
+    나머지 날은 NaN (희소 저장, 읽을 때 ffill)
+    '''
+    cal = pd.DatetimeIndex(calendar).values
+    obs = pd.DataFrame({'date': pd.to_datetime(dates, format='mixed'), 'value': values}).dropna()
+    obs = obs.sort_values('date', kind='stable')
+
+    pos = np.searchsorted(cal, obs['date'].values.astype(cal.dtype), side='left')
+    inside = pos < len(cal)
+    pos, vals = pos[inside], obs['value'].to_numpy(dtype=float)[inside]
+
+    last_of_day = np.append(pos[1:] != pos[:-1], True) if len(pos) else np.zeros(0, dtype=bool)
+    out = np.full(len(cal), np.nan, dtype=np.float32)
+    out[pos[last_of_day]] = vals[last_of_day]
+    return out
+
+
+def build_master_panel(crawler, series=None):
+    '''
+    MacroCrawler 로 전체 시리즈 조회 → 날짜 × 시리즈 float32 DataFrame
+    (조회 실패한 시리즈는 NaN 컬럼)
+    '''
+    series = series or MASTER_PANEL_SERIES
+    trading_days = pd.DatetimeIndex(
+        pd.to_datetime(crawler.get_sp500()['date']).drop_duplicates().sort_values(), name='date'
+    )
+
+    observations = {}
+    with crawler.memo_scope():
+        for name, spec in series.items():
+            try:
+                df = _resolve(crawler, spec['loader'])
+                observations[name] = (
+                    pd.to_datetime(df[spec['date_column']], format='mixed').dt.normalize(),
+                    _to_numeric(df[spec['column']]),
+                )
+            except Exception as e:
+                print(f"⚠️ 마스터 패널 {name} 조회 실패 → 빈 컬럼 : {e}")
+
+    # 거래일 구간 밖의 관측일은 그 날짜로 행 추가 (이력 / 최신 관측치가 첫·마지막 거래일로 뭉치지 않도록)
+    outside = [dates[(dates < trading_days[0]) | (dates > trading_days[-1])] for dates, _ in observations.values()]
+    calendar = trading_days.union(pd.DatetimeIndex(pd.concat(outside).dropna().unique())) if outside else trading_days
+    calendar = calendar.rename('date')
+
+    columns = {}
+    for name in series:
+        if name in observations:
+            columns[name] = place_on_calendar(calendar, *observations[name])
+        else:
+            columns[name] = np.full(len(calendar), np.nan, dtype=np.float32)
+
+    return pd.DataFrame(columns, index=calendar).astype(np.float32)
+
+
+class MasterPanel:
+    '''
+    마스터 패널 Parquet 파일 (생성 / 신선도 확인 / 컬럼·구간 단위 읽기)
+    '''
+
+    def __init__(self, path=MASTER_PANEL_PATH, ttl=MASTER_PANEL_TTL):
+        self.path = path
+        self.ttl = ttl
+
+    def built_at(self):
+        if not os.path.exists(self.path):
+            return None
+        return pd.Timestamp(os.path.getmtime(self.path), unit='s')
+
+    def is_fresh(self):
+        if not os.path.exists(self.path):
+            return False
+        return time.time() - os.path.getmtime(self.path) < self.ttl.total_seconds()
+
+    def save(self, panel):
+        folder = os.path.dirname(self.path)
+        if folder:
+            os.makedirs(folder, exist_ok=True)
+        tmp_path = f"{self.path}.tmp"
+        panel.to_parquet(tmp_path, engine='pyarrow')
+        os.replace(tmp_path, self.path)    # 읽는 쪽이 반쯤 쓴 파일을 보지 않도록
+
+    def refresh(self, crawler):
+        started = time.perf_counter()
+        panel = build_master_panel(crawler)
+        self.save(panel)
+        print(f"✅ 마스터 패널 생성 완료 {panel.shape} ({time.perf_counter() - started:.1f}s) → {self.path}")
+        return panel
+
+    def load(self, columns=None, start=None, end=None, ffill=True):
+        '''
+        필요한 컬럼만 읽기 (Parquet 컬럼 단위) → 구간 슬라이스
+
+        Parameters:
+            columns (list): 읽을 컬럼 (없으면 전체)
+            start, end: 날짜 구간 (포함)
+            ffill (bool): True 면 직전 관측값으로 채움 (월별 지표를 일별로 사용)
+        '''
+        df = pd.read_parquet(self.path, engine='pyarrow', columns=list(columns) if columns else None)
+        if ffill:
+            df = df.ffill()
+        return df.loc[start:end]
+
+
+if __name__ == "__main__":
+    from macro_crawling import MacroCrawler
+
+    MacroCrawler().refresh_master_panel()
@@ -1,8 +1,9 @@
 import os
 import pandas as pd
-import requests
 from bs4 import BeautifulSoup
 
+from page_fetcher import get_page_fetcher
+
 def smart_parse_month_year(val):
     try:
         parts = val.strip().split('-')
@@ -81,7 +82,7 @@ class MarginDebtUpdater :
     def get_margin_debt_data(self):
         url = "https://www.finra.org/rules-guidance/key-topics/margin-accounts/margin-statistics"
         try:
-            response = requests.get(url, timeout=10)
+            response = get_page_fetcher().http_get(url, name="finra_margin_statistics")
             response.raise_for_status()
             soup = BeautifulSoup(response.text, "html.parser")
         except Exception as e:
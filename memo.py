@@ -0,0 +1,119 @@
+import functools
+import threading
+from contextlib import contextmanager
+
+import pandas as pd
+
+
+def _copy_value(value):
+    '''
+    캐시 값 반환용 복사본 (호출자가 수정해도 캐시는 그대로)
+    - DataFrame / Series 는 copy(), tuple / list / dict 는 안쪽까지 같은 규칙 적용
+    '''
+    if isinstance(value, (pd.DataFrame, pd.Series)):
+        return value.copy()
+    if isinstance(value, tuple):
+        return tuple(_copy_value(v) for v in value)
+    if isinstance(value, list):
+        return [_copy_value(v) for v in value]
+    if isinstance(value, dict):
+        return {k: _copy_value(v) for k, v in value.items()}
+    return value
+
+
+def _make_key(name, args, kwargs):
+    '''
+    (메서드 이름, 인자) → 캐시 키 / DataFrame 처럼 해시 불가한 인자가 있으면 None (캐시 안 함)
+    '''
+    key = (name, args, tuple(sorted(kwargs.items())))
+    try:
+        hash(key)
+    except TypeError:
+        return None
+    return key
+
+
+class MemoStore:
+    '''
+    요청(또는 페이지 렌더링) 단위 메모 저장소
+    - scope() 가 열려 있는 동안만 값을 보관하고, 가장 바깥 scope 가 닫히면 비움
+    - 스레드(fetch_many 워커)끼리 같은 저장소를 공유
+    '''
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._depth = 0
+        self._values = {}
+
+    @contextmanager
+    def scope(self):
+        with self._lock:
+            self._depth += 1
+        try:
+            yield self
+        finally:
+            with self._lock:
+                self._depth -= 1
+                if self._depth == 0:
+                    self._values.clear()
+
+    @property
+    def active(self):
+        return self._depth > 0
+
+    def lookup(self, key):
+        with self._lock:
+            if key in self._values:
+                return True, self._values[key]
+        return False, None
+
+    def save(self, key, value):
+        with self._lock:
+            if self._depth > 0:
+                self._values[key] = value
+
+    def invalidate(self, name=None):
+        '''
+        name 이 있으면 해당 메서드 결과만, 없으면 전체 삭제
+        '''
+        with self._lock:
+            if name is None:
+                self._values.clear()
+            else:
+                for key in [k for k in self._values if k[0] == name]:
+                    del self._values[key]
+
+
+def memoized(func):
+    '''
+    메서드 결과를 현재 scope 안에서 재사용
+    - 열린 scope 가 없으면 이 호출 동안 scope 를 열어 안쪽 중복 호출도 한 번만 계산
+    - 반환값은 항상 복사본
+    '''
+    @functools.wraps(func)
+    def wrapper(self, *args, **kwargs):
+        key = _make_key(func.__name__, args, kwargs)
+        if key is None:
+            with self.memo.scope():
+                return func(self, *args, **kwargs)
+
+        with self.memo.scope():
+            hit, value = self.memo.lookup(key)
+            if not hit:
+                value = func(self, *args, **kwargs)
+                self.memo.save(key, value)
+            return _copy_value(value)
+
+    return wrapper
+
+
+def request_scoped(func):
+    '''
+    결과는 캐시하지 않고 호출 동안 scope 만 열어 줌 (출력/그래프를 만드는 복합 메서드용)
+    '''
+    @functools.wraps(func)
+    def wrapper(self, *args, **kwargs):
+        with self.memo.scope():
+            return func(self, *args, **kwargs)
+
+    return wrapper
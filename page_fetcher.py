@@ -0,0 +1,202 @@
+import csv
+import os
+import threading
+import time
+from datetime import datetime
+
+from bs4 import BeautifulSoup
+
+from fred_client import build_http_session
+from series_cache import CACHE_DB_PATH
+from webdriver_pool import DEFAULT_USER_AGENT, get_pool
+from data_provider import get_provider
+
+
+# 조회 경로 기록 파일 (http / browser 비율과 소요 시간 추적용)
+FETCH_LOG_PATH = os.path.join(os.path.dirname(CACHE_DB_PATH) or ".", "scrape_fetch_log.csv")
+FETCH_LOG_COLUMNS = ["timestamp", "name", "url", "path", "seconds", "ok"]
+
+HTTP_HEADERS = {
+    "User-Agent": DEFAULT_USER_AGENT,
+    "Accept-Language": "en-US,en;q=0.9,ko;q=0.8",
+}
+
+
+class PageFetcher:
+    '''
+    HTTP 우선 스크래핑 + 브라우저(WebDriverPool) 폴백
+    - 1단계: 커넥션 풀 Session 으로 HTML 요청 → extract(soup) 로 값 추출/검증
+    - 2단계: 추출 실패(예외 또는 None) 시에만 Chrome 풀로 렌더링 후 같은 extract 재시도
+    - 매 조회마다 어떤 경로(http / browser)로 성공했는지 FETCH_LOG_PATH 에 기록
+    '''
+
+    def __init__(self, session=None, pool=None, timeout=15, log_path=FETCH_LOG_PATH):
+        self.session = session or build_http_session()
+        self.session.headers.update(HTTP_HEADERS)
+        self._pool = pool
+        self.timeout = timeout
+        self.log_path = log_path
+        self._lock = threading.Lock()
+
+    @property
+    def pool(self):
+        return self._pool or get_pool()
+
+    def http_get(self, url, name=None, **kwargs):
+        '''
+        HTTP 전용 조회 (브라우저 폴백 없음) → response 반환, 경로는 'http' 로 기록
+        '''
+        started = time.perf_counter()
+        ok = False
+        try:
+            response = self.session.get(url, timeout=self.timeout, **kwargs)
+            response.raise_for_status()
+            ok = True
+            return response
+        finally:
+            self._record(name or url, url, "http", time.perf_counter() - started, ok)
+
+    def fetch(self, url, extract, wait_for=None, name=None, browser=True):
+        '''
+        url 에서 extract(soup) 결과를 반환
+
+        Parameters:
+            extract (callable): BeautifulSoup → 값 (찾지 못하면 예외 또는 None)
+            wait_for (tuple): 브라우저 폴백 시 기다릴 요소 (By.CSS_SELECTOR, "...")
+            name (str): 기록용 이름 (없으면 url)
+            browser (bool): False 면 HTTP 실패 시 그대로 예외
+        '''
+        name = name or url
+
+        started = time.perf_counter()
+        try:
+            response = self.session.get(url, timeout=self.timeout)
+            response.raise_for_status()
+            value = extract(BeautifulSoup(response.text, "html.parser"))
+            if value is not None:
+                self._record(name, url, "http", time.perf_counter() - started, True)
+                return value
+            http_error = ValueError("추출 결과 없음")
+        except Exception as e:
+            http_error = e
+
+        if not browser:
+            self._record(name, url, "http", time.perf_counter() - started, False)
+            raise http_error
+
+        print(f"↪️ {name} : HTTP 추출 실패({http_error}) → 브라우저로 재시도")
+        try:
+            html = self.pool.fetch(url, wait_for=wait_for)
+            value = extract(BeautifulSoup(html, "html.parser"))
+            if value is None:
+                raise ValueError(f"❌ {name} : 브라우저 렌더링 후에도 값을 찾을 수 없습니다.")
+        except Exception:
+            self._record(name, url, "browser", time.perf_counter() - started, False)
+            raise
+
+        self._record(name, url, "browser", time.perf_counter() - started, True)
+        return value
+
+    def _record(self, name, url, path, seconds, ok):
+        row = {
+            "timestamp": datetime.now().isoformat(timespec="seconds"),
+            "name": name,
+            "url": url,
+            "path": path,
+            "seconds": round(seconds, 3),
+            "ok": ok,
+        }
+        with self._lock:
+            try:
+                folder = os.path.dirname(self.log_path)
+                if folder:
+                    os.makedirs(folder, exist_ok=True)
+                new_file = not os.path.exists(self.log_path)
+                with open(self.log_path, "a", newline="", encoding="utf-8") as f:
+                    writer = csv.DictWriter(f, fieldnames=FETCH_LOG_COLUMNS)
+                    if new_file:
+                        writer.writeheader()
+                    writer.writerow(row)
+            except OSError as e:
+                print(f"⚠️ 조회 경로 기록 실패 : {e}")
+
+
+def load_fetch_log(log_path=FETCH_LOG_PATH):
+    '''
+    조회 경로 기록 → DataFrame (없으면 빈 DataFrame)
+    '''
+    import pandas as pd
+
+    if not os.path.exists(log_path):
+        return pd.DataFrame(columns=FETCH_LOG_COLUMNS)
+    return pd.read_csv(log_path, parse_dates=["timestamp"])
+
+
+def summarize_fetch_log(log_path=FETCH_LOG_PATH):
+    '''
+    이름/경로별 조회 횟수, 성공률, 평균 소요 시간
+    '''
+    df = load_fetch_log(log_path)
+    if df.empty:
+        return df
+    return (
+        df.groupby(["name", "path"])
+        .agg(count=("ok", "size"), success_rate=("ok", "mean"), avg_seconds=("seconds", "mean"))
+        .reset_index()
+    )
+
+
+def parse_ycharts_stats(soup):
+    '''
+    ycharts 지표 페이지 'Stats' 패널 → {'date': 'Aug 20 2025', 'value': '0.55'}
+    (서버 HTML 에 패널이 포함돼 있으면 HTTP 만으로 추출 가능, 패널이 없으면 None → 브라우저 폴백)
+    '''
+    stats_panel = None
+    for panel in soup.find_all('div', class_='panel-data'):
+        title = panel.find('h3', class_='panel-title')
+        if title and title.get_text(strip=True) == 'Stats':
+            stats_panel = panel
+            break
+    if stats_panel is None:
+        return None
+
+    value = None
+    date = None
+    for row in stats_panel.find_all('tr'):
+        tds = row.find_all('td')
+        if len(tds) < 2:
+            continue
+        label = tds[0].get_text(strip=True)
+        if label == 'Last Value' and value is None:
+            value = tds[1].get_text(strip=True)
+        elif label == 'Latest Period' and date is None:
+            date = tds[1].get_text(strip=True)
+
+    if not (value and date):
+        raise ValueError("❌ 'Last Value' 또는 'Latest Period'를 찾을 수 없습니다.")
+    return {"date": date, "value": value}
+
+
+_fetcher = None
+_fetcher_lock = threading.Lock()
+
+
+def get_page_fetcher():
+    '''
+    프로세스 공용 PageFetcher (현재 데이터 공급자의 HTTP 세션 / 브라우저 사용)
+    '''
+    global _fetcher
+    with _fetcher_lock:
+        if _fetcher is None:
+            provider = get_provider()
+            _fetcher = PageFetcher(session=provider.http_session(), pool=provider.browser())
+        return _fetcher
+
+
+def reset_page_fetcher():
+    '''
+    공급자 변경 시 공용 PageFetcher 폐기 (다음 호출 때 새로 생성)
+    '''
+    global _fetcher
+    with _fetcher_lock:
+        _fetcher = None
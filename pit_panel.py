@@ -0,0 +1,163 @@
+'''
+시점 기준(point-in-time) 매크로 패널
+- 각 시리즈가 발표 규칙(release)을 선언 → "날짜 d 에 알 수 있었던 값" 을 한 번에 계산
+- 신호 함수는 발표 시차를 따로 계산하지 않고 패널을 조회
+
+발표 규칙 (release):
+    {'kind': 'daily'}                        : 관측일 당일 (가격)
+    {'kind': 'monthly', 'months': 1, 'day': 25} : 관측월 1일 + months 개월의 day 일 (그 달에 없는 날이면 말일)
+
+파생 시리즈는 원자료 중 가장 늦게 공개되는 시리즈의 규칙을 따름 (loader 에 args 로 이름 전달)
+'''
+import numpy as np
+import pandas as pd
+
+from alignment import period_start
+from signal_ops import asof_positions
+
+
+# 시리즈 이름 → (MacroCrawler 조회 메서드[, 인자], 날짜/값 컬럼, 발표 규칙)
+# - 월별 원자료는 마스터 패널 월별 슬라이스 (get_master_monthly), LEI / PMI 는 로컬 CSV 읽기 전용
+PIT_SERIES = {
+    'sp500_close':       {'loader': 'get_sp500',                                             'date_column': 'date', 'column': 'sp500_close',        'release': {'kind': 'daily'}},
+    'margin_debt':       {'loader': 'get_master_monthly', 'args': ('margin_debt',),          'date_column': 'date', 'column': 'margin_debt',        'release': {'kind': 'monthly', 'months': 1, 'day': 25}},  # FINRA, 다음 달 25일경
+    'm2':                {'loader': 'get_master_monthly', 'args': ('m2',),                   'date_column': 'date', 'column': 'm2',                 'release': {'kind': 'monthly', 'months': 1, 'day': 25}},  # 마진 부채와 같은 시점에 비율 계산
+    'cpi':               {'loader': 'get_master_monthly', 'args': ('cpi',),                  'date_column': 'date', 'column': 'cpi',                'release': {'kind': 'monthly', 'months': 1, 'day': 15}},  # BLS, 다음 달 중순
+    '10y':               {'loader': 'get_master_monthly', 'args': ('10y',),                  'date_column': 'date', 'column': '10y',                'release': {'kind': 'monthly', 'months': 1, 'day': 1}},   # 월평균 → 월말 확정
+    '2y':                {'loader': 'get_master_monthly', 'args': ('2y',),                   'date_column': 'date', 'column': '2y',                 'release': {'kind': 'monthly', 'months': 1, 'day': 1}},
+    'fed_funds_rate':    {'loader': 'get_master_monthly', 'args': ('fed_funds_rate',),       'date_column': 'date', 'column': 'fed_funds_rate',     'release': {'kind': 'monthly', 'months': 1, 'day': 1}},
+    'unemployment_rate': {'loader': 'get_master_monthly', 'args': ('unemployment_rate',),    'date_column': 'date', 'column': 'unemployment_rate',  'release': {'kind': 'monthly', 'months': 1, 'day': 7}},   # BLS, 다음 달 첫 금요일경
+    'LI_index':          {'loader': 'get_master_monthly', 'args': ('li_index',),             'date_column': 'date', 'column': 'li_index',           'release': {'kind': 'monthly', 'months': 2, 'day': 1}},
+    'CLI_index':         {'loader': 'get_master_monthly', 'args': ('cli',),                  'date_column': 'date', 'column': 'cli',                'release': {'kind': 'monthly', 'months': 2, 'day': 1}},   # OECD, 약 6주 지연
+    'LEI':               {'loader': 'read_lei_csv',                                          'date_column': 'date', 'column': 'LEI',                'release': {'kind': 'monthly', 'months': 1, 'day': 30}},  # Conference Board, 다음 달 하순 → 30일(없으면 말일)부터
+    'PMI':               {'loader': 'read_pmi_csv',                                          'date_column': 'date', 'column': 'PMI',                'release': {'kind': 'monthly', 'months': 1, 'day': 1}},   # ISM, 다음 달 첫 영업일
+
+    # 파생 시리즈 (get_derived)
+    'margin_yoy':        {'loader': 'get_derived', 'args': ('margin_yoy',),        'date_column': 'date', 'column': 'margin_yoy',        'release': {'kind': 'monthly', 'months': 1, 'day': 25}},
+    'margin_m2_ratio':   {'loader': 'get_derived', 'args': ('margin_m2_ratio',),   'date_column': 'date', 'column': 'margin_m2_ratio',   'release': {'kind': 'monthly', 'months': 1, 'day': 25}},
+    'margin_m2_ratio_z': {'loader': 'get_derived', 'args': ('margin_m2_ratio_z',), 'date_column': 'date', 'column': 'margin_m2_ratio_z', 'release': {'kind': 'monthly', 'months': 1, 'day': 25}},
+    'margin_m2_ratio_change_pct': {'loader': 'get_derived', 'args': ('margin_m2_ratio_change_pct',), 'date_column': 'date', 'column': 'margin_m2_ratio_change_pct', 'release': {'kind': 'monthly', 'months': 1, 'day': 25}},
+    'fed_funds_6m_chg':  {'loader': 'get_derived', 'args': ('fed_funds_6m_chg',),  'date_column': 'date', 'column': 'fed_funds_6m_chg',  'release': {'kind': 'monthly', 'months': 1, 'day': 1}},
+}
+
+
+def release_dates(dates, release):
+    '''
+    관측 날짜 → 공개 날짜 (벡터화)
+
+    예) margin_debt 2025-07-01, {'months': 1, 'day': 25} → 2025-08-25
+        LEI 2025-01-01, {'months': 1, 'day': 30} → 2025-02-28
+    '''
+    dates = pd.to_datetime(pd.Series(dates)).reset_index(drop=True)
+    if release.get('kind') == 'daily':
+        return dates.to_numpy()
+    if release.get('kind') != 'monthly':
+        raise ValueError(f"지원하지 않는 발표 규칙입니다: {release}")
+
+    month = period_start(dates, 'M') + pd.DateOffset(months=release.get('months', 1))
+    day = np.minimum(release.get('day', 1), month.dt.days_in_month)
+    return (month + pd.to_timedelta(day - 1, unit='D')).to_numpy()
+
+
+class PointInTimePanel:
+    '''
+    시리즈별 (공개일, 관측일, 값) 을 정렬해 보관하고, 조회/일별 패널 생성을 searchsorted 로 처리
+
+    Parameters:
+        series (dict): 이름 → DataFrame (date_column, column 포함)
+        specs (dict): 이름 → PIT_SERIES 형식 설정 (없으면 PIT_SERIES)
+        calendar (array-like): 일별 패널 날짜 (보통 S&P500 거래일)
+    '''
+
+    def __init__(self, series=None, specs=None, calendar=None):
+        self.specs = specs or PIT_SERIES
+        self.calendar = pd.DatetimeIndex(calendar if calendar is not None else [])
+        self._releases = {}
+        self._observed = {}
+        self._values = {}
+        self._frame = None
+
+        for name, df in (series or {}).items():
+            self.add(name, df)
+
+    def add(self, name, df):
+        '''
+        시리즈 추가 (관측일 → 공개일 변환 후 공개일 순 정렬)
+        '''
+        spec = self.specs[name]
+        src = pd.DataFrame({
+            'observed': pd.to_datetime(df[spec['date_column']], format='mixed').to_numpy(),
+            'value': pd.to_numeric(df[spec['column']], errors='coerce').to_numpy(dtype=float),
+        }).dropna()
+        if src.empty:
+            raise ValueError(f"{name} : 유효한 값이 없습니다.")
+        src['released'] = release_dates(src['observed'], spec['release'])
+        src = src.sort_values(['released', 'observed'], kind='stable')
+
+        self._releases[name] = src['released'].to_numpy()
+        self._observed[name] = src['observed'].to_numpy()
+        self._values[name] = src['value'].to_numpy()
+        self._frame = None
+
+    @property
+    def names(self):
+        return list(self._values)
+
+    @property
+    def frame(self):
+        '''
+        캘린더 전체 일별 패널 (처음 접근할 때 한 번 생성)
+        '''
+        if self._frame is None:
+            self._frame = self.known_at(self.calendar)
+        return self._frame
+
+    def known_at(self, dates, names=None):
+        '''
+        각 날짜에 알 수 있었던 값 (index=dates) - 값 컬럼 + '<이름>_observed'(어느 관측월 값인지)
+        - 월초 / 발표일 등 캘린더가 아닌 날짜 목록에도 그대로 사용
+        '''
+        calendar = pd.DatetimeIndex(dates)
+        columns = {}
+        for name in names or self.names:
+            pos = asof_positions(self._releases[name], calendar)
+            known = pos >= 0
+            values = np.full(len(calendar), np.nan)
+            observed = np.full(len(calendar), np.datetime64('NaT'), dtype=self._observed[name].dtype)
+            values[known] = self._values[name][pos[known]]
+            observed[known] = self._observed[name][pos[known]]
+            columns[name] = values
+            columns[f'{name}_observed'] = observed
+        return pd.DataFrame(columns, index=calendar.rename('date'))
+
+    def as_of(self, date=None):
+        '''
+        date 시점에 알 수 있었던 최신 값 → DataFrame (index=시리즈 이름, value / observed / released)
+        '''
+        date = pd.Timestamp(date or pd.Timestamp.today()).normalize()
+        rows = {}
+        for name in self.names:
+            i = asof_positions(self._releases[name], [date])[0]
+            rows[name] = {
+                'value': self._values[name][i] if i >= 0 else np.nan,
+                'observed': pd.Timestamp(self._observed[name][i]) if i >= 0 else pd.NaT,
+                'released': pd.Timestamp(self._releases[name][i]) if i >= 0 else pd.NaT,
+            }
+        return pd.DataFrame.from_dict(rows, orient='index')
+
+    def releases(self, name):
+        '''
+        시리즈의 발표 이력 → DataFrame (observed, released, value - 공개일 순)
+        '''
+        return pd.DataFrame({
+            'observed': self._observed[name],
+            'released': self._releases[name],
+            'value': self._values[name],
+        })
+
+    def history(self, names=None, start=None, end=None):
+        '''
+        일별 패널 구간 조회 (값 컬럼만)
+        '''
+        names = names or self.names
+        return self.frame.loc[start:end, names]
@@ -0,0 +1,253 @@
+import os
+import sqlite3
+from datetime import datetime, timedelta
+
+import pandas as pd
+
+from series_cache import CACHE_DB_PATH
+from data_provider import get_provider
+
+
+# 티커별 초기 적재용 스냅샷 CSV (저장소에 포함된 과거 데이터)
+PRICE_SEEDS = {
+    '^GSPC': 'sp500.csv',
+    '^VIX': 'vix_data.csv',
+    'GC=F': 'gold_price.csv',
+    'HG=F': 'copper_price.csv',
+    'CL=F': 'crude_oil_price.csv',
+}
+
+PRICE_COLUMNS = ['open', 'high', 'low', 'close', 'volume']
+
+# 마지막 조회 후 이 시간 안이면 yfinance 를 호출하지 않음 (한 페이지 렌더링 안의 중복 호출 방지)
+PRICE_TTL = timedelta(hours=1)
+
+# 증분 조회 시 마지막 저장일에서 이만큼 앞당겨 다시 받음 (장중 미완성 봉 / 수정치 교체)
+PRICE_OVERLAP = timedelta(days=5)
+
+# 다운로드 실패 후 이 시간 동안은 재시도하지 않고 저장된 이력 사용
+PRICE_RETRY_AFTER = timedelta(minutes=5)
+
+
+def read_price_seed(ticker, path):
+    '''
+    스냅샷 CSV → date, open, high, low, close, volume DataFrame
+    - sp500.csv    : ,date,sp500_close
+    - vix_data.csv : Price,date,vix / Ticker,,^VIX (2줄 헤더)
+    - 선물 CSV     : Price,Close,High,... / Ticker,... / Date,,, (3줄 헤더)
+    '''
+    if ticker == '^GSPC':
+        df = pd.read_csv(path, index_col=0).rename(columns={'sp500_close': 'close'})
+    elif ticker == '^VIX':
+        df = pd.read_csv(path, skiprows=[1]).rename(columns={'vix': 'close'})
+    else:
+        df = pd.read_csv(path, skiprows=[1, 2])
+        df = df.rename(columns={'Price': 'date'})
+        df.columns = [str(col).lower() for col in df.columns]
+
+    df['date'] = pd.to_datetime(df['date'])
+    return df.reindex(columns=['date'] + PRICE_COLUMNS)
+
+
+def normalize_download(df, ticker):
+    '''
+    yf.download 결과(단일/멀티 컬럼) → date, open, high, low, close, volume
+    '''
+    if df is None or df.empty:
+        return pd.DataFrame(columns=['date'] + PRICE_COLUMNS)
+
+    if isinstance(df.columns, pd.MultiIndex):
+        # group_by="ticker" → (티커, 가격) / 기본값 → (가격, 티커)
+        level = 0 if ticker in df.columns.get_level_values(0) else 1
+        df = df.xs(ticker, axis=1, level=level)
+
+    df = df.reset_index()
+    df.columns = [str(col).lower() for col in df.columns]
+    df['date'] = pd.to_datetime(df['date']).dt.tz_localize(None)
+    return df.reindex(columns=['date'] + PRICE_COLUMNS).dropna(subset=['close'])
+
+
+class PriceStore:
+    '''
+    티커별 일봉 전체 이력을 SQLite 에 보관하는 가격 저장소
+    - 처음 조회 시 스냅샷 CSV(PRICE_SEEDS)로 적재
+    - 이후에는 마지막 저장일 이후 구간만 yfinance 로 받아 병합
+    '''
+
+    def __init__(self, db_path=CACHE_DB_PATH, seeds=None, ttl=PRICE_TTL, provider=None):
+        self.db_path = db_path
+        self.provider = provider or get_provider()
+        self.seeds = PRICE_SEEDS if seeds is None else seeds
+        self.ttl = ttl
+        self._failed_at = {}
+        folder = os.path.dirname(db_path)
+        if folder:
+            os.makedirs(folder, exist_ok=True)
+        with self._connect() as conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS prices ("
+                " ticker TEXT NOT NULL, date TEXT NOT NULL,"
+                " open REAL, high REAL, low REAL, close REAL, volume REAL,"
+                " PRIMARY KEY (ticker, date))"
+            )
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS price_meta ("
+                " ticker TEXT PRIMARY KEY, last_fetched TEXT NOT NULL)"
+            )
+
+    def _connect(self):
+        return sqlite3.connect(self.db_path, timeout=30)
+
+    def load(self, ticker):
+        '''
+        저장된 일봉 반환 (date 오름차순, 없으면 빈 DataFrame)
+        '''
+        with self._connect() as conn:
+            df = pd.read_sql_query(
+                "SELECT date, open, high, low, close, volume FROM prices"
+                " WHERE ticker = ? ORDER BY date",
+                conn, params=(ticker,),
+            )
+        df['date'] = pd.to_datetime(df['date'])
+        return df
+
+    def last_date(self, ticker):
+        with self._connect() as conn:
+            row = conn.execute("SELECT MAX(date) FROM prices WHERE ticker = ?", (ticker,)).fetchone()
+        return pd.Timestamp(row[0]) if row and row[0] else None
+
+    def last_fetched(self, ticker):
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT last_fetched FROM price_meta WHERE ticker = ?", (ticker,)
+            ).fetchone()
+        return datetime.fromisoformat(row[0]) if row else None
+
+    def is_fresh(self, ticker):
+        failed = self._failed_at.get(ticker)
+        if failed is not None and datetime.now() - failed < PRICE_RETRY_AFTER:
+            return True
+        fetched = self.last_fetched(ticker)
+        return fetched is not None and datetime.now() - fetched < self.ttl
+
+    def upsert(self, ticker, df, touch=True):
+        '''
+        일봉 병합 저장 (같은 날짜는 새 값으로 교체)
+        touch=True 이면 마지막 조회 시각도 갱신
+        '''
+        rows = []
+        if not df.empty:
+            dates = pd.to_datetime(df['date']).dt.strftime('%Y-%m-%d')
+            values = df[PRICE_COLUMNS].astype(float)
+            rows = [
+                (ticker, d, *[None if pd.isna(v) else float(v) for v in vals])
+                for d, vals in zip(dates, values.itertuples(index=False))
+            ]
+
+        with self._connect() as conn:
+            conn.executemany(
+                "INSERT OR REPLACE INTO prices (ticker, date, open, high, low, close, volume)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?)",
+                rows,
+            )
+            if touch:
+                conn.execute(
+                    "INSERT OR REPLACE INTO price_meta (ticker, last_fetched) VALUES (?, ?)",
+                    (ticker, datetime.now().isoformat(timespec='seconds')),
+                )
+
+    def seed(self, ticker):
+        '''
+        저장된 이력이 없으면 스냅샷 CSV 로 초기 적재
+        '''
+        path = self.seeds.get(ticker)
+        if self.last_date(ticker) is not None or not path or not os.path.exists(path):
+            return
+        try:
+            self.upsert(ticker, read_price_seed(ticker, path), touch=False)
+            print(f"✅ {ticker} 스냅샷({path}) 적재 완료")
+        except Exception as e:
+            print(f"⚠️ {ticker} 스냅샷 적재 실패 : {e}")
+
+    def download_start(self, ticker, default_start='2000-01-01'):
+        last = self.last_date(ticker)
+        if last is None:
+            return default_start
+        return (last - PRICE_OVERLAP).strftime('%Y-%m-%d')
+
+    def update(self, tickers, refresh=False):
+        '''
+        TTL 이 만료된 티커들을 한 번의 yf.download(group_by="ticker") 호출로 증분 갱신
+        (실제 다운로드는 데이터 공급자가 수행 → live / record / replay / offline)
+        - 시작일은 갱신 대상 중 가장 이른 download_start (겹치는 구간은 upsert 로 교체)
+        - 다운로드 실패 시 저장된 이력 그대로 유지
+        '''
+        for ticker in tickers:
+            self.seed(ticker)
+
+        stale = [t for t in dict.fromkeys(tickers) if refresh or not self.is_fresh(t)]
+        if not stale:
+            return
+
+        start = min(self.download_start(t) for t in stale)
+        try:
+            downloaded = self.provider.download_prices(stale, start)
+        except Exception as e:
+            print(f"[ERROR] {', '.join(stale)} 가격 다운로드 실패 : {e}")
+            self._failed_at.update({t: datetime.now() for t in stale})
+            return
+
+        for ticker in stale:
+            bars = downloaded.get(ticker, pd.DataFrame())
+            if bars.empty:
+                print(f"⚠️ {ticker} 신규 일봉 없음 → 저장된 이력 사용")
+                self._failed_at[ticker] = datetime.now()
+            else:
+                self._failed_at.pop(ticker, None)
+                self.upsert(ticker, bars)
+
+    def get(self, ticker, refresh=False):
+        '''
+        티커의 전체 일봉 반환 (TTL 만료 시 마지막 저장일 이후만 다운로드)
+        '''
+        self.update([ticker], refresh=refresh)
+        return self.load(ticker)
+
+    def get_many(self, tickers, field='close', layout='long', refresh=False):
+        '''
+        여러 티커 일봉을 한 번에 반환 (다운로드는 update 에서 1회)
+
+        Parameters:
+            tickers (list): 예) ['^GSPC', '^VIX', 'HG=F']
+            field (str): layout='wide' 일 때 펼칠 가격 컬럼
+            layout (str): 'long' → date, ticker, open, high, low, close, volume
+                          'wide' → date + 티커별 field 컬럼 (거래일 합집합, 빈 날은 NaN)
+        '''
+        self.update(tickers, refresh=refresh)
+
+        frames = [self.load(t).assign(ticker=t) for t in dict.fromkeys(tickers)]
+        long_df = pd.concat(frames, ignore_index=True) if frames else pd.DataFrame()
+        long_df = long_df.reindex(columns=['date', 'ticker'] + PRICE_COLUMNS)
+
+        if layout == 'long':
+            return long_df.sort_values(['date', 'ticker']).reset_index(drop=True)
+        if layout == 'wide':
+            wide = long_df.pivot(index='date', columns='ticker', values=field)
+            wide = wide.reindex(columns=list(dict.fromkeys(tickers)))
+            wide.columns.name = None
+            return wide.reset_index()
+        raise ValueError(f"지원하지 않는 layout 입니다: {layout}")
+
+    def invalidate(self, ticker=None):
+        '''
+        TTL 초기화 → 다음 조회 때 증분 다운로드 강제 (이력은 유지)
+        '''
+        if ticker is None:
+            self._failed_at.clear()
+        else:
+            self._failed_at.pop(ticker, None)
+        with self._connect() as conn:
+            if ticker is None:
+                conn.execute("DELETE FROM price_meta")
+            else:
+                conn.execute("DELETE FROM price_meta WHERE ticker = ?", (ticker,))
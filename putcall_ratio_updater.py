@@ -1,18 +1,12 @@
 import requests
-from bs4 import BeautifulSoup
 import pandas as pd
 from datetime import datetime
 import os
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support import expected_conditions as EC
-from webdriver_manager.chrome import ChromeDriverManager
-from bs4 import BeautifulSoup
 import time
 
+from page_fetcher import get_page_fetcher, parse_ycharts_stats
+
 class PutCallRatioUpdater:
 
     def __init__(self, csv_path="put_call_ratio.csv"):
@@ -31,54 +25,17 @@ class PutCallRatioUpdater:
 
     def get_put_call_ratio(self, url):
         """주어진 URL에서 Put-Call Ratio 값을 추출합니다."""
-        options = Options()
-        options.add_argument("--headless")
-        options.add_argument("--disable-gpu")
-        options.add_argument("--no-sandbox")
-        
-        service = Service(ChromeDriverManager().install())
-        driver = webdriver.Chrome(service=service, options=options)
-        driver.get(url)
-        
-        try:
-            WebDriverWait(driver, 30).until(
-                EC.presence_of_element_located((By.XPATH, "//h3[contains(text(), 'Stats')]"))
-            )
-            soup = BeautifulSoup(driver.page_source, 'html.parser')
-            
-            stats_panel = None
-            for panel in soup.find_all('div', class_='panel-data'):
-                title = panel.find('h3', class_='panel-title')
-                if title and title.get_text(strip=True) == 'Stats':
-                    stats_panel = panel
-                    break
-            
-            if not stats_panel:
-                raise ValueError(f"❌ '{url}'에서 'Stats' 패널을 찾을 수 없습니다.")
-
-            last_value_td = stats_panel.find('td', string='Last Value')
-            latest_period_td = stats_panel.find('td', string='Latest Period')
-
-            if last_value_td and last_value_td.find_next_sibling('td'):
-                ratio_value = last_value_td.find_next_sibling('td').get_text(strip=True)
-            else:
-                ratio_value = None
-
-            if latest_period_td and latest_period_td.find_next_sibling('td'):
-                date_value = latest_period_td.find_next_sibling('td').get_text(strip=True)
-            else:
-                date_value = None
-
-            if ratio_value and date_value:
-                return {
-                    "date": date_value,
-                    "value": float(ratio_value)
-                }
-            else:
-                raise ValueError(f"❌ '{url}'에서 'Last Value' 또는 'Latest Period'를 찾을 수 없습니다.")
-                
-        finally:
-            driver.quit()
+        # HTTP 로 Stats 패널을 먼저 시도하고, 실패 시에만 공용 브라우저 풀 사용
+        stats = get_page_fetcher().fetch(
+            url,
+            parse_ycharts_stats,
+            wait_for=(By.XPATH, "//h3[contains(text(), 'Stats')]"),
+            name=url.rstrip('/').split('/')[-1],
+        )
+        return {
+            "date": stats["date"],
+            "value": float(stats["value"])
+        }
 
     def update_csv(self):
         equity_url = 'https://ycharts.com/indicators/cboe_equity_put_call_ratio'
@@ -0,0 +1,139 @@
+'''
+온라인 롤링 통계 (Welford 평균/분산 + 윈도우 밖 값 제거)
+- 새 값 하나 추가 = O(1), pandas rolling(window, min_periods).mean()/.std() 와 같은 규칙
+  (NaN 은 윈도우 자리는 차지하지만 집계에서는 제외, 관측 수 < min_periods 면 NaN)
+- 상태(윈도우 값, 평균, 편차 제곱합, 마지막 날짜)는 JSON 으로 저장/복원
+- pandas 결과와의 일치는 tests/test_rolling_stats.py 에서 점검
+'''
+import json
+import math
+import os
+from collections import deque
+
+import numpy as np
+import pandas as pd
+
+
+class RollingStats:
+    '''
+    고정 윈도우(행 수) 롤링 평균/표준편차
+
+    사용 예:
+        stats = RollingStats(window=36, min_periods=12)
+        for date, value in ratio.items():
+            z = stats.push(value, date).zscore(value)
+    '''
+
+    def __init__(self, window, min_periods=None):
+        self.window = window
+        self.min_periods = window if min_periods is None else min_periods
+        self.values = deque()
+        self.count = 0          # 윈도우 안 NaN 이 아닌 값 수
+        self.mean_ = 0.0
+        self.m2 = 0.0           # 편차 제곱합
+        self.last_date = None
+
+    def _add(self, x):
+        self.count += 1
+        delta = x - self.mean_
+        self.mean_ += delta / self.count
+        self.m2 += delta * (x - self.mean_)
+
+    def _remove(self, x):
+        self.count -= 1
+        if self.count == 0:
+            self.mean_, self.m2 = 0.0, 0.0
+            return
+        delta = x - self.mean_
+        self.mean_ -= delta / self.count
+        self.m2 = max(self.m2 - delta * (x - self.mean_), 0.0)
+
+    def push(self, value, date=None):
+        '''
+        값 추가 → 윈도우를 넘치면 가장 오래된 값 제거
+        '''
+        value = float(value)
+        self.values.append(value)
+        if not math.isnan(value):
+            self._add(value)
+        if len(self.values) > self.window:
+            oldest = self.values.popleft()
+            if not math.isnan(oldest):
+                self._remove(oldest)
+        if date is not None:
+            self.last_date = pd.Timestamp(date)
+        return self
+
+    def mean(self):
+        if self.count == 0 or self.count < self.min_periods:
+            return np.nan
+        return self.mean_
+
+    def std(self):
+        # ddof=1 (pandas 기본값)
+        if self.count < max(self.min_periods, 2):
+            return np.nan
+        return math.sqrt(self.m2 / (self.count - 1))
+
+    def zscore(self, value):
+        return np.float64(value - self.mean()) / np.float64(self.std())
+
+    @classmethod
+    def from_series(cls, series, window, min_periods=None):
+        '''
+        Series 의 마지막 window 행으로 상태 생성 (이후 값은 push 로 이어서)
+        '''
+        stats = cls(window, min_periods)
+        for date, value in series.iloc[-window:].items():
+            stats.push(value, date)
+        return stats
+
+    def to_dict(self):
+        return {
+            'window': self.window,
+            'min_periods': self.min_periods,
+            'values': [None if math.isnan(v) else v for v in self.values],
+            'count': self.count,
+            'mean': self.mean_,
+            'm2': self.m2,
+            'last_date': None if self.last_date is None else self.last_date.isoformat(),
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        stats = cls(data['window'], data['min_periods'])
+        stats.values = deque(np.nan if v is None else float(v) for v in data['values'])
+        stats.count = data['count']
+        stats.mean_ = data['mean']
+        stats.m2 = data['m2']
+        stats.last_date = pd.Timestamp(data['last_date']) if data['last_date'] else None
+        return stats
+
+
+class RollingStatsStore:
+    '''
+    이름 → RollingStats 상태 JSON 파일
+    '''
+
+    def __init__(self, path):
+        self.path = path
+
+    def load(self):
+        if not os.path.exists(self.path):
+            return {}
+        try:
+            with open(self.path, encoding='utf-8') as f:
+                return {name: RollingStats.from_dict(data) for name, data in json.load(f).items()}
+        except Exception as e:
+            print(f"⚠️ 롤링 통계 상태 불러오기 실패 → 새로 계산 : {e}")
+            return {}
+
+    def save(self, states):
+        folder = os.path.dirname(self.path)
+        if folder:
+            os.makedirs(folder, exist_ok=True)
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({name: stats.to_dict() for name, stats in states.items()}, f)
+        os.replace(tmp_path, self.path)
+
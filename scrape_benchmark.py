@@ -0,0 +1,81 @@
+'''
+스크래핑 페이지당 소요 시간 비교 (수동 실행용)
+- before : 페이지마다 Chrome 새로 실행 + 전체 로드 대기 + time.sleep(5) (기존 방식)
+- after  : 공유 브라우저 풀 + lean 프로필(eager, 리소스 차단) + 대상 요소 대기
+
+실행: python scrape_benchmark.py [반복횟수]
+'''
+import sys
+import time
+
+from selenium.webdriver.common.by import By
+
+from webdriver_pool import WebDriverPool
+
+
+# (이름, URL, 기다릴 요소)
+SCRAPE_TARGETS = [
+    ("equity_pcr", "https://ycharts.com/indicators/cboe_equity_put_call_ratio",
+     (By.XPATH, "//td[contains(normalize-space(.), 'Last Value')]")),
+    ("index_pcr", "https://ycharts.com/indicators/cboe_index_put_call_ratio",
+     (By.XPATH, "//td[contains(normalize-space(.), 'Last Value')]")),
+    ("bull_bear", "https://ycharts.com/indicators/us_investor_sentiment_bull_bear_spread",
+     (By.CSS_SELECTOR, "div.panel-data")),
+    ("forward_pe", "https://en.macromicro.me/series/20052/sp500-forward-pe-ratio",
+     (By.CSS_SELECTOR, "div.sidebar-sec.chart-stat-lastrows span.val")),
+    ("ism_pmi", "https://ko.tradingeconomics.com/united-states/manufacturing-pmi",
+     (By.CSS_SELECTOR, "table.table")),
+]
+
+
+def run_before(url, wait_for):
+    # 기존 방식: 페이지마다 브라우저 실행/종료, 고정 5초 대기
+    pool = WebDriverPool(lean=False)
+    try:
+        with pool.page(url) as driver:
+            time.sleep(5)
+            return driver.page_source
+    finally:
+        pool.close()
+
+
+def run_after(pool, url, wait_for):
+    return pool.fetch(url, wait_for=wait_for)
+
+
+def benchmark(repeat=1):
+    results = []
+    lean_pool = WebDriverPool(lean=True)
+
+    try:
+        for name, url, wait_for in SCRAPE_TARGETS:
+            for _ in range(repeat):
+                for mode in ("before", "after"):
+                    started = time.perf_counter()
+                    try:
+                        if mode == "before":
+                            html = run_before(url, wait_for)
+                        else:
+                            html = run_after(lean_pool, url, wait_for)
+                        ok = len(html) > 0
+                    except Exception as e:
+                        print(f"📛 {name} ({mode}) 실패: {e}")
+                        ok = False
+                    elapsed = time.perf_counter() - started
+                    results.append({"target": name, "mode": mode, "seconds": elapsed, "ok": ok})
+                    print(f"⏱️ {name:<12} {mode:<6} {elapsed:6.2f}s {'✅' if ok else '❌'}")
+    finally:
+        lean_pool.close()
+
+    return results
+
+
+if __name__ == "__main__":
+    import pandas as pd
+
+    repeat = int(sys.argv[1]) if len(sys.argv) > 1 else 1
+    df = pd.DataFrame(benchmark(repeat))
+    summary = df.pivot_table(index="target", columns="mode", values="seconds", aggfunc="mean")
+    summary["speedup"] = summary["before"] / summary["after"]
+    print("\n📊 페이지당 평균 소요 시간 (초)")
+    print(summary.round(2))
@@ -0,0 +1,152 @@
+import os
+import sqlite3
+from datetime import datetime, timedelta
+
+import pandas as pd
+
+
+# 캐시 DB 위치 (환경변수로 변경 가능)
+CACHE_DB_PATH = os.environ.get("MACRO_CACHE_DB", os.path.join(".cache", "macro_cache.sqlite"))
+
+# 발표 빈도별 TTL / 재조회(revision) 구간
+# - ttl      : 마지막 조회 후 이 시간 안이면 API 를 호출하지 않음
+#              (월간 시리즈는 발표일이 지났는데 캐시에 그 달 값이 없으면 TTL 과 무관하게 만료 → is_fresh)
+# - revision : 증분 조회 시 마지막 캐시 날짜에서 이만큼 앞당겨 다시 받음 (FRED 수정치 반영)
+FREQUENCY_RULES = {
+    'D': {'ttl': timedelta(days=1),  'revision': pd.DateOffset(days=14)},
+    'W': {'ttl': timedelta(days=7),  'revision': pd.DateOffset(weeks=8)},
+    'M': {'ttl': timedelta(days=30), 'revision': pd.DateOffset(months=6)},
+}
+
+
+class SeriesCache:
+    '''
+    series_id 별 관측치(date, value) + 마지막 조회 시각을 저장하는 SQLite 캐시
+    - 스레드마다 커넥션을 새로 열어 fetch_many 동시 실행에서도 안전
+    '''
+
+    def __init__(self, db_path=CACHE_DB_PATH):
+        self.db_path = db_path
+        folder = os.path.dirname(db_path)
+        if folder:
+            os.makedirs(folder, exist_ok=True)
+        with self._connect() as conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS observations ("
+                " series_id TEXT NOT NULL, date TEXT NOT NULL, value REAL,"
+                " PRIMARY KEY (series_id, date))"
+            )
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS series_meta ("
+                " series_id TEXT PRIMARY KEY, last_fetched TEXT NOT NULL)"
+            )
+
+    def _connect(self):
+        return sqlite3.connect(self.db_path, timeout=30)
+
+    def load(self, series_id):
+        '''
+        캐시된 관측치 반환 (date 오름차순, 없으면 빈 DataFrame)
+        '''
+        with self._connect() as conn:
+            df = pd.read_sql_query(
+                "SELECT date, value FROM observations WHERE series_id = ? ORDER BY date",
+                conn, params=(series_id,),
+            )
+        if df.empty:
+            return pd.DataFrame(columns=['date', 'value'])
+        df['date'] = pd.to_datetime(df['date'])
+        df['value'] = pd.to_numeric(df['value'], errors='coerce')
+        return df
+
+    def last_fetched(self, series_id):
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT last_fetched FROM series_meta WHERE series_id = ?", (series_id,)
+            ).fetchone()
+        return datetime.fromisoformat(row[0]) if row else None
+
+    def last_date(self, series_id):
+        '''
+        캐시된 마지막 관측 날짜 (없으면 None)
+        '''
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT MAX(date) FROM observations WHERE series_id = ?", (series_id,)
+            ).fetchone()
+        return pd.Timestamp(row[0]) if row and row[0] is not None else None
+
+    def is_fresh(self, series_id, frequency, release_day=None, now=None):
+        '''
+        빈도별 TTL 안에 조회한 적이 있으면 True
+
+        월간 시리즈에 release_day(관측월 다음 달 발표일)가 있으면 발표 일정도 확인
+        - 가장 최근 발표분(관측월)이 이미 캐시에 있으면 TTL 까지 유지
+        - 없는데 발표일 이후 아직 조회하지 않았으면 만료
+        - 발표일 이후 조회했는데도 없으면 (발표 지연) 하루 간격으로 재조회
+        '''
+        fetched = self.last_fetched(series_id)
+        if fetched is None:
+            return False
+        now = now or datetime.now()
+        age = now - fetched
+        if age >= FREQUENCY_RULES.get(frequency, FREQUENCY_RULES['D'])['ttl']:
+            return False
+        if frequency != 'M' or release_day is None:
+            return True
+
+        released = pd.Timestamp(now).to_period('M').to_timestamp() + pd.Timedelta(days=release_day - 1)
+        if pd.Timestamp(now) < released:
+            released -= pd.DateOffset(months=1)
+        expected = released.to_period('M').to_timestamp() - pd.DateOffset(months=1)
+
+        last = self.last_date(series_id)
+        if last is not None and last >= expected:
+            return True
+        if pd.Timestamp(fetched) < released:
+            return False
+        return age < FREQUENCY_RULES['D']['ttl']
+
+    def refresh_start(self, series_id, frequency, default_start):
+        '''
+        증분 조회 시작일 = 마지막 캐시 날짜 - revision 구간 (캐시 없으면 default_start)
+        '''
+        last = self.last_date(series_id)
+        if last is None:
+            return default_start
+        revision = FREQUENCY_RULES.get(frequency, FREQUENCY_RULES['D'])['revision']
+        start = last - revision
+        return max(start, pd.Timestamp(default_start)).strftime('%Y-%m-%d')
+
+    def upsert(self, series_id, df):
+        '''
+        관측치 병합 저장 (같은 날짜는 새 값으로 교체) + 조회 시각 갱신
+        '''
+        rows = []
+        if not df.empty:
+            dates = pd.to_datetime(df['date']).dt.strftime('%Y-%m-%d')
+            values = pd.to_numeric(df['value'], errors='coerce')
+            rows = [
+                (series_id, d, None if pd.isna(v) else float(v))
+                for d, v in zip(dates, values)
+            ]
+
+        with self._connect() as conn:
+            conn.executemany(
+                "INSERT OR REPLACE INTO observations (series_id, date, value) VALUES (?, ?, ?)",
+                rows,
+            )
+            conn.execute(
+                "INSERT OR REPLACE INTO series_meta (series_id, last_fetched) VALUES (?, ?)",
+                (series_id, datetime.now().isoformat(timespec='seconds')),
+            )
+
+    def invalidate(self, series_id=None):
+        '''
+        TTL 초기화 → 다음 조회 때 증분 갱신 강제 (관측치는 유지)
+        '''
+        with self._connect() as conn:
+            if series_id is None:
+                conn.execute("DELETE FROM series_meta")
+            else:
+                conn.execute("DELETE FROM series_meta WHERE series_id = ?", (series_id,))
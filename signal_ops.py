@@ -0,0 +1,254 @@
+'''
+신호 계산 공용 벡터 연산 모음
+- 반복문(iterrows / 신호별 필터링) 대신 정렬된 날짜 배열 + searchsorted / 위치 오프셋 사용
+- 월별·일별 데이터, 파라미터 스윕 모두 같은 함수로 처리
+'''
+import numpy as np
+import pandas as pd
+
+
+def resolve_entry_exit(df, signal_mask, delay=pd.DateOffset(months=2), hold=2,
+                       date_col="date", price_col="sp500_close", available_col=None):
+    '''
+    신호 → 진입/청산 위치 계산 (벡터화)
+
+    - 진입 위치 : 신호일 + delay 이상인 첫 행 (searchsorted, side='left')
+                  available_col 이 있으면 그 컬럼 날짜(신호 값의 공개일) 이상인 첫 행
+    - 청산 위치 : 진입 위치 + hold 행
+    - 청산 위치가 데이터 범위를 벗어나는 신호는 제외
+
+    Parameters:
+        df (DataFrame): date_col 기준 오름차순 정렬된 데이터
+        signal_mask (array-like of bool): 신호가 발생한 행
+        delay (DateOffset): 신호일 → 실제 진입일 지연 (발표 시차)
+        hold (int): 보유 기간 (행 개수, 월별 데이터면 개월 수)
+        available_col (str): 행별 공개일 컬럼 (pit_panel.release_dates) - 있으면 delay 대신 사용
+
+    Returns:
+        DataFrame: signal_pos, entry_pos, exit_pos, signal_date, action_date,
+                   entry_price, exit_price, return_pct (신호 발생 순서 유지)
+    '''
+    dates = pd.DatetimeIndex(df[date_col])
+    prices = df[price_col].to_numpy()
+    signal_pos = np.flatnonzero(np.asarray(signal_mask, dtype=bool))
+
+    signal_dates = dates[signal_pos]
+    if available_col is not None:
+        target_dates = pd.DatetimeIndex(df[available_col])[signal_pos]
+    else:
+        target_dates = signal_dates + delay if len(signal_pos) else signal_dates
+    entry_pos = np.searchsorted(dates.values, target_dates.values, side="left")
+    exit_pos = entry_pos + hold
+
+    valid = exit_pos < len(dates)
+    signal_pos, entry_pos, exit_pos = signal_pos[valid], entry_pos[valid], exit_pos[valid]
+
+    entry_price = prices[entry_pos]
+    exit_price = prices[exit_pos]
+
+    return pd.DataFrame({
+        "signal_pos": signal_pos,
+        "entry_pos": entry_pos,
+        "exit_pos": exit_pos,
+        "signal_date": dates[signal_pos],
+        "action_date": dates[entry_pos],
+        "entry_price": entry_price,
+        "exit_price": exit_price,
+        "return_pct": (exit_price - entry_price) / entry_price,
+    })
+
+
+def next_on_calendar(calendar, dates):
+    '''
+    각 날짜 이후(당일 포함) 첫 캘린더 날짜 (벡터화)
+    - 예) 발표일 → 발표 후 첫 거래일
+    - 캘린더 범위를 벗어나거나 NaT 이면 NaT
+
+    Parameters:
+        calendar (array-like): 오름차순 정렬된 거래일 날짜
+        dates (array-like): 변환할 날짜
+
+    Returns:
+        ndarray (datetime64)
+    '''
+    cal = pd.DatetimeIndex(calendar).values
+    targets = pd.DatetimeIndex(dates).values.astype(cal.dtype)
+
+    pos = np.searchsorted(cal, targets, side="left")
+    ok = (pos < len(cal)) & ~np.isnat(targets)
+    out = np.full(len(targets), np.datetime64("NaT"), dtype=cal.dtype)
+    out[ok] = cal[pos[ok]]
+    return out
+
+
+def asof_positions(release_dates, calendar):
+    '''
+    캘린더 각 날짜 시점에 공개돼 있던 마지막 발표의 위치 (없으면 -1)
+    - release_dates 는 오름차순 정렬, 같은 날 여러 건이면 마지막 건
+    '''
+    releases = pd.DatetimeIndex(release_dates).values
+    cal = pd.DatetimeIndex(calendar).values.astype(releases.dtype)
+    return np.searchsorted(releases, cal, side="right") - 1
+
+
+def publish_to_calendar(calendar, release_dates, values):
+    '''
+    발표일 기준 값을 거래일 캘린더에 전방 채움 (as-of join 1회)
+    - 각 거래일 = 그날까지 발표된 마지막 값, 첫 발표 이전은 NaN
+
+    Parameters:
+        calendar (array-like): 오름차순 정렬된 거래일 날짜
+        release_dates (array-like): 값이 공개되는 날짜 (NaT 제외)
+        values (array-like): 발표 값
+
+    Returns:
+        ndarray (float, calendar 와 같은 길이)
+    '''
+    releases = pd.DatetimeIndex(release_dates)
+    values = np.asarray(values, dtype=float)
+    order = np.argsort(releases.values, kind="stable")
+    releases, values = releases[order], values[order]
+
+    pos = asof_positions(releases, calendar)
+    out = np.full(len(pos), np.nan)
+    out[pos >= 0] = values[pos[pos >= 0]]
+    return out
+
+
+# 금리 시그널 입력 컬럼 (월별 패널)
+RATE_PANEL_COLUMNS = ["10y", "2y", "cpi_yoy", "fed_funds_rate"]
+
+
+def score_rate_signals(panel, use_2y_vs_fed=False):
+    '''
+    월별 금리 패널 전체에 금리 기반 시그널 점수 계산 (벡터화)
+
+    규칙 (각 항목 +1 / -1 / 0 합산 → rate_signal):
+        - real_10y  : 실질 10Y < 0 일 때 CPI YoY 하락이면 +1, 아니면 -1
+        - real_2y   : 실질 2Y > 2% 이면 -1
+        - spread    : 10Y-2Y < -0.5 → 확대(+)면 +1 아니면 -1
+                      10Y-2Y > 0    → 축소(-)면 -1 아니면 +1
+        - 2y_vs_fed : 2Y < 기준금리 이면 +1 (use_2y_vs_fed=True 일 때만)
+
+    Parameters:
+        panel (DataFrame): date + RATE_PANEL_COLUMNS, 날짜 오름차순
+        use_2y_vs_fed (bool): 2Y < 기준금리 항목 포함 여부
+
+    Returns:
+        DataFrame: panel + real_10y, real_2y, spread, delta_spread, prev_cpi_yoy,
+                   score_* 항목별 점수, rate_signal (첫 행은 전월 값이 없어 NaN)
+    '''
+    df = panel.copy()
+    # 파생 지표가 패널에 이미 있으면 (get_rate_panel) 그대로 사용
+    if "real_10y" not in df:
+        df["real_10y"] = df["10y"] - df["cpi_yoy"]
+    if "real_2y" not in df:
+        df["real_2y"] = df["2y"] - df["cpi_yoy"]
+    if "spread" not in df:
+        df["spread"] = df["10y"] - df["2y"]
+    df["delta_spread"] = df["spread"].diff()
+    df["prev_cpi_yoy"] = df["cpi_yoy"].shift(1)
+
+    real_10y = df["real_10y"].to_numpy()
+    real_2y = df["real_2y"].to_numpy()
+    spread = df["spread"].to_numpy()
+    delta = df["delta_spread"].to_numpy()
+    cpi_falling = df["cpi_yoy"].to_numpy() < df["prev_cpi_yoy"].to_numpy()
+
+    df["score_real_10y"] = np.where(real_10y < 0, np.where(cpi_falling, 1, -1), 0)
+    df["score_real_2y"] = np.where(real_2y > 2, -1, 0)
+    df["score_spread"] = np.select(
+        [spread < -0.5, spread > 0],
+        [np.where(delta > 0, 1, -1), np.where(delta < 0, -1, 1)],
+        0,
+    )
+    if use_2y_vs_fed:
+        df["score_2y_vs_fed"] = np.where(df["2y"].to_numpy() < df["fed_funds_rate"].to_numpy(), 1, 0)
+    else:
+        df["score_2y_vs_fed"] = 0
+
+    score_cols = ["score_real_10y", "score_real_2y", "score_spread", "score_2y_vs_fed"]
+    df["rate_signal"] = df[score_cols].sum(axis=1).astype(float)
+    if len(df):
+        df.loc[df.index[0], "rate_signal"] = np.nan
+    return df
+
+
+# 조건 비교 연산자 (event_window_signal 의 conditions 용)
+CONDITION_OPS = {
+    "<": np.less,
+    "<=": np.less_equal,
+    ">": np.greater,
+    ">=": np.greater_equal,
+    "==": np.equal,
+}
+
+
+def in_event_window(dates, event_dates, months=6, direction="after"):
+    '''
+    각 날짜가 어떤 이벤트의 N개월 구간 안에 있는지 (벡터화, searchsorted 1회)
+
+    - after  : 이벤트일 < date <= 이벤트일 + N개월
+    - before : 이벤트일 - N개월 <= date < 이벤트일
+    - 구간이 겹쳐도 가장 가까운 이벤트 하나만 확인하면 충분
+      (after 기준 더 늦은 이벤트의 구간 끝이 항상 더 뒤)
+
+    Parameters:
+        dates (array-like): 판정할 날짜 (정렬 불필요)
+        event_dates (array-like): 이벤트 발생일
+        months (int): 구간 길이 (개월)
+        direction (str): 'after' 또는 'before'
+
+    Returns:
+        ndarray (bool, dates 와 같은 길이)
+    '''
+    events = pd.DatetimeIndex(event_dates).dropna().sort_values()
+    values = pd.DatetimeIndex(dates)
+    if len(events) == 0:
+        return np.zeros(len(values), dtype=bool)
+
+    offset = pd.DateOffset(months=months)
+    target = values.values.astype(events.values.dtype)
+
+    if direction == "after":
+        pos = np.searchsorted(events.values, target, side="left") - 1   # date 직전 이벤트
+        has_event = pos >= 0
+        window_end = (events + offset).values
+        inside = np.zeros(len(values), dtype=bool)
+        inside[has_event] = target[has_event] <= window_end[pos[has_event]]
+    elif direction == "before":
+        pos = np.searchsorted(events.values, target, side="right")      # date 직후 이벤트
+        has_event = pos < len(events)
+        window_start = (events - offset).values
+        inside = np.zeros(len(values), dtype=bool)
+        inside[has_event] = target[has_event] >= window_start[pos[has_event]]
+    else:
+        raise ValueError(f"지원하지 않는 direction 입니다: {direction}")
+
+    return inside & ~np.isnat(target)
+
+
+def event_window_signal(df, event_col, conditions=None, months=6, direction="after", date_col="date"):
+    '''
+    이벤트(예: 금리 인하/인상 시작) 전후 N개월 구간 + 지표 조건을 모두 만족하는 행 표시
+
+    Parameters:
+        df (DataFrame): date_col, event_col(bool) 및 조건 컬럼 포함
+        event_col (str): 이벤트 발생 여부 컬럼 (True 인 행의 날짜가 이벤트일)
+        conditions (dict): {컬럼: (연산자, 기준값)} - 모두 AND 결합
+                           예) {"CLI_index": ("<", 130), "PMI": ("<", 50)}
+        months (int): 구간 길이 (개월)
+        direction (str): 'after' (이벤트 이후) / 'before' (이벤트 이전)
+
+    Returns:
+        Series (bool, df 와 같은 index)
+    '''
+    event_dates = df.loc[df[event_col] == True, date_col]
+    signal = in_event_window(df[date_col], event_dates, months=months, direction=direction)
+
+    for col, (op, threshold) in (conditions or {}).items():
+        if op not in CONDITION_OPS:
+            raise ValueError(f"지원하지 않는 조건 연산자입니다: {op}")
+        signal &= CONDITION_OPS[op](df[col].to_numpy(dtype=float), threshold)
+
+    return pd.Series(signal, index=df.index)
@@ -0,0 +1,107 @@
+'''
+신호 수익률 유의성 (부트스트랩, 무작위 진입 대비)
+- 전략 × 신호(BUY/SELL) 이벤트 묶음마다, 같은 건수·같은 간격(거래일 간격 순서만 섞음)의
+  무작위 진입일 집합을 n_draws 개 뽑아 보유기간 성과 분포와 비교
+- 무작위 진입일은 (시작 위치 + 간격 누적합) 2차원 인덱스 행렬 하나로 만들고,
+  성과는 보유기간 수익률 배열을 그 행렬로 한 번에 인덱싱 (반복문 없음)
+- p_value = (1 + 무작위 평균 ≥ 신호 평균 인 횟수) / (1 + n_draws)  (단측, 작을수록 유의)
+
+실행: python significance.py  (전체 전략 백테스트 + 유의성)
+'''
+import numpy as np
+import pandas as pd
+
+from backtest import _horizon_map
+
+
+# 무작위 진입 인덱스 행렬이 n_draws × 이벤트 수 크기라 상한을 둠
+MAX_DRAWS = 20000
+
+
+def forward_return_array(close, days):
+    '''
+    거래일 종가 → 각 날짜에 진입해 days 거래일 보유한 수익률 (%), 데이터가 모자라면 NaN
+    '''
+    out = np.full(len(close), np.nan)
+    if days < len(close):
+        out[:len(close) - days] = (close[days:] / close[:-days] - 1) * 100
+    return out
+
+
+def random_entry_matrix(positions, n_valid, n_draws, rng):
+    '''
+    실제 진입 위치(오름차순) → 같은 건수 / 같은 간격 집합의 무작위 진입 위치 (n_draws × 건수)
+    - 간격 순서를 행마다 섞고, 시작 위치는 [0, n_valid - 전체 간격) 에서 균등 추출
+    - 전체 간격이 n_valid 이상이면 None
+    '''
+    gaps = np.diff(positions)
+    span = int(gaps.sum())
+    if span >= n_valid:
+        return None
+    shuffled = rng.permuted(np.broadcast_to(gaps, (n_draws, len(gaps))), axis=1)
+    offsets = np.concatenate([np.zeros((n_draws, 1), dtype=np.int64), np.cumsum(shuffled, axis=1)], axis=1)
+    starts = rng.integers(0, n_valid - span, size=(n_draws, 1))
+    return starts + offsets
+
+
+def bootstrap_significance(trades, prices, horizons=None, n_draws=5000, seed=None,
+                           date_col='date', price_col='sp500_close'):
+    '''
+    백테스트 trades (entry_date, signal[, strategy]) → 전략 × 신호 × 보유기간 유의성
+
+    Returns:
+        DataFrame: strategy, signal, horizon, count, mean_pnl, hit_rate,
+                   random_mean_pnl, random_p95_pnl, random_hit_rate, p_value, p_value_hit
+    '''
+    if not 0 < n_draws <= MAX_DRAWS:
+        raise ValueError(f"n_draws 는 1 ~ {MAX_DRAWS} 사이여야 합니다: {n_draws}")
+    horizons = _horizon_map(horizons)
+    rng = np.random.default_rng(seed)
+    px = prices[[date_col, price_col]].dropna().drop_duplicates(date_col).sort_values(date_col)
+    calendar = pd.to_datetime(px[date_col]).to_numpy()
+    close = px[price_col].to_numpy(dtype=float)
+    returns = {label: forward_return_array(close, days) for label, days in horizons.items()}
+
+    trades = trades.reset_index(drop=True)
+    keys = [c for c in ('strategy', 'signal') if c in trades.columns]
+    entry = np.searchsorted(calendar, pd.to_datetime(trades['entry_date']).to_numpy(dtype=calendar.dtype))
+
+    rows = []
+    for key, group in trades.groupby(keys, sort=False):
+        key = key if isinstance(key, tuple) else (key,)
+        direction = -1.0 if group['signal'].iloc[0] == 'SELL' else 1.0
+        group_pos = np.sort(entry[group.index.to_numpy()])
+        for label, days in horizons.items():
+            pos = group_pos[group_pos < len(close) - days]     # 보유기간 성과가 있는 이벤트만
+            row = dict(zip(keys, key), horizon=label, count=len(pos))
+            if len(pos) == 0:
+                rows.append(row)
+                continue
+
+            pnl = returns[label][pos] * direction
+            row.update(mean_pnl=pnl.mean(), hit_rate=(pnl > 0).mean() * 100)
+
+            idx = random_entry_matrix(pos, len(close) - days, n_draws, rng)
+            if idx is not None:
+                random_pnl = returns[label][idx] * direction           # n_draws × 건수
+                random_mean = random_pnl.mean(axis=1)
+                random_hit = (random_pnl > 0).mean(axis=1) * 100
+                row.update(
+                    random_mean_pnl=random_mean.mean(),
+                    random_p95_pnl=np.percentile(random_mean, 95),
+                    random_hit_rate=random_hit.mean(),
+                    p_value=(1 + (random_mean >= row['mean_pnl']).sum()) / (1 + n_draws),
+                    p_value_hit=(1 + (random_hit >= row['hit_rate']).sum()) / (1 + n_draws),
+                )
+            rows.append(row)
+
+    columns = keys + ['horizon', 'count', 'mean_pnl', 'hit_rate', 'random_mean_pnl', 'random_p95_pnl',
+                      'random_hit_rate', 'p_value', 'p_value_hit']
+    return pd.DataFrame(rows).reindex(columns=columns)
+
+
+if __name__ == "__main__":
+    from macro_crawling import MacroCrawler
+
+    result = MacroCrawler().backtest_signals(horizons=['1M', '3M', '6M'], n_draws=5000)
+    print(result['significance'].round(3).to_string(index=False))
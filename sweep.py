@@ -0,0 +1,253 @@
+'''
+신호 전략 임계치/파라미터 스윕 (병렬)
+- 전략 + 파라미터 그리드 → 그리드 점마다 신호 이벤트 + 보유기간별 성과 → 순위표
+- 모든 거래일의 BUY/SELL 보유기간 성과(outcome_table)를 부모 프로세스에서 한 번만 계산하고,
+  원자료와 함께 워커 초기화 때 한 번 넘김 (워커는 조회/가격 경로 계산 없이 이벤트 위치만 찾아 집계)
+- 진입 규칙/성과 정의는 backtest.forward_returns 와 같음
+
+SWEEP_STRATEGIES : 전략 이름 → (원자료 조회, 이벤트 함수, 기본 파라미터, 기본 그리드)
+
+실행: python sweep.py m2_margin [workers]
+'''
+import itertools
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from backtest import _horizon_map, flag_events, forward_returns, threshold_events
+
+
+# ── 전략별 이벤트 함수 (원자료, **파라미터) → 이벤트 테이블 ──────────────────────
+def _m2_margin_events(df, window=36, min_periods=12, buy_z=-1.2, sell_z=None,
+                      sell_change_pct=-7, delay_months=None):
+    '''
+    Margin Debt / M2 발표분 테이블 (get_m2_margin_release_signals)
+    - 매수: z-score < buy_z & 전월 대비 상승
+    - 매도: 전월 대비 변화율 < sell_change_pct (sell_z 가 있으면 z-score > sell_z 도)
+    - 진입: delay_months 가 없으면 발표 후 첫 거래일(effective_date), 있으면 관측월 + delay_months
+    '''
+    ratio = df['ratio']
+    rolling = ratio.rolling(window=window, min_periods=min(min_periods, window))
+    z = (ratio - rolling.mean()) / rolling.std()
+    change = ratio.pct_change() * 100
+
+    sell = change < sell_change_pct
+    if sell_z is not None:
+        sell &= z > sell_z
+    if delay_months is None:
+        dates = df['effective_date']
+    else:
+        dates = df['month_start'] + pd.DateOffset(months=delay_months)
+
+    flags = pd.DataFrame({'date': dates.to_numpy(), 'buy': ((z < buy_z) & (change > 0)).to_numpy(), 'sell': sell.to_numpy()})
+    return flag_events(flags.dropna(subset=['date']), 'date', buy='buy', sell='sell')
+
+
+def _lei_pmi_fed_events(df, lei_min=100, pmi_min=50, buy_delta_pp=0.25):
+    '''
+    월초 패널 (get_lei_pmi_fed_known_panel - 각 월초에 공개돼 있던 값)
+    - 매수: LEI > lei_min & PMI > pmi_min & 6개월 금리 변화 ≥ buy_delta_pp
+    '''
+    flags = pd.DataFrame({
+        'date': df['date'],
+        'buy': (df['LEI_used'] > lei_min) & (df['PMI_used'] > pmi_min) & (df['FEDFUNDS_6M_chg_used'] >= buy_delta_pp),
+    })
+    return flag_events(flags, 'date', buy='buy')
+
+
+def _m2_margin_data(crawler):
+    return crawler.get_m2_margin_release_signals()[['month_start', 'ratio', 'effective_date']]
+
+
+def _put_call_ratio_data(crawler):
+    # generate_pcr_signals 와 같은 구간 (S&P500 거래일의 값만)
+    return crawler.generate_pcr_signals()[['date', 'equity_value']]
+
+
+def _grid(start, stop, step):
+    return [round(float(v), 4) for v in np.arange(start, stop + step / 2, step)]
+
+
+# 기본 파라미터 = 현재 모듈에 하드코딩된 값
+# - 이름이 backtest.SIGNAL_EVENTS 에도 있으면 기본 파라미터 이벤트 = 그 전략의 이벤트 (tests/test_sweep_defaults.py)
+# - m2_margin 은 plot_sp500_with_signals_and_graph / 오늘의 시그널 규칙 (generate_zscore_trend_signals 는 backtest 의 zscore_trend)
+SWEEP_STRATEGIES = {
+    'm2_margin': {
+        'data': _m2_margin_data,
+        'events': _m2_margin_events,
+        'defaults': {'window': 36, 'min_periods': 12, 'buy_z': -1.2, 'sell_z': None, 'sell_change_pct': -7, 'delay_months': None},
+        'grid': {'window': [24, 36, 48, 60], 'buy_z': _grid(-2.5, -0.5, 0.1), 'sell_change_pct': _grid(-10, -3, 0.5)},
+    },
+    'put_call_ratio': {
+        'data': _put_call_ratio_data,
+        'events': lambda df, buy_thr=1.5, sell_thr=0.4: threshold_events(
+            df, 'equity_value', buy=('>', buy_thr), sell=('<', sell_thr), entries_only=False),
+        'defaults': {'buy_thr': 1.5, 'sell_thr': 0.4},
+        'grid': {'buy_thr': _grid(0.8, 1.6, 0.05), 'sell_thr': _grid(0.3, 0.7, 0.025)},
+    },
+    'bull_bear_spread': {
+        'data': lambda c: c.bull_bear_spread_updater.df,
+        'events': lambda df, buy_th=-0.2, sell_th=0.4: threshold_events(
+            df, 'spread', buy=('<', buy_th), sell=('>', sell_th)),
+        'defaults': {'buy_th': -0.2, 'sell_th': 0.4},
+        'grid': {'buy_th': _grid(-0.4, 0.0, 0.025), 'sell_th': _grid(0.2, 0.6, 0.025)},
+    },
+    'lei_pmi_fed': {
+        'data': lambda c: c.get_lei_pmi_fed_known_panel(),
+        'events': _lei_pmi_fed_events,
+        'defaults': {'lei_min': 100, 'pmi_min': 50, 'buy_delta_pp': 0.25},
+        'grid': {'lei_min': _grid(95, 105, 1), 'pmi_min': _grid(45, 55, 1),
+                 'buy_delta_pp': _grid(-0.5, 1.0, 0.25)},
+    },
+    'forward_pe': {
+        'data': lambda c: c.snp_forwardpe_updater.df,
+        'events': lambda df, buy_lt=12, sell_gt=22: threshold_events(
+            df, 'forward_pe', buy=('<', buy_lt), sell=('>', sell_gt)),
+        'defaults': {'buy_lt': 12, 'sell_gt': 22},
+        'grid': {'buy_lt': _grid(10, 18, 0.5), 'sell_gt': _grid(18, 26, 0.5)},
+    },
+    'vix_bands': {
+        'data': lambda c: c.get_vix_index(),
+        'events': lambda df, buy_above=30, sell_below=12: threshold_events(
+            df, 'vix_index', buy=('>=', buy_above), sell=('<', sell_below)),
+        'defaults': {'buy_above': 30, 'sell_below': 12},
+        'grid': {'buy_above': _grid(20, 45, 1), 'sell_below': _grid(10, 20, 0.5)},
+    },
+}
+
+
+def expand_grid(grid):
+    '''
+    {'a': [1, 2], 'b': [3]} → [{'a': 1, 'b': 3}, {'a': 2, 'b': 3}]
+    '''
+    keys = list(grid)
+    return [dict(zip(keys, values)) for values in itertools.product(*(grid[k] for k in keys))]
+
+
+def outcome_table(prices, horizons=None, date_col='date', price_col='sp500_close'):
+    '''
+    모든 거래일에 BUY / SELL 로 진입했을 때의 보유기간 성과 (그리드 점마다 가격 경로를 다시 만들지 않도록)
+
+    Returns:
+        dict: calendar (거래일), horizons,
+              pnl / mae : 보유기간 → (2, 거래일 수) 배열 (0행 BUY, 1행 SELL, %)
+    '''
+    horizons = _horizon_map(horizons)
+    px = prices[[date_col, price_col]].dropna().drop_duplicates(date_col).sort_values(date_col)
+    calendar = pd.to_datetime(px[date_col]).to_numpy()
+
+    sides = [forward_returns(pd.DataFrame({'date': calendar, 'signal': signal}), px, horizons,
+                             date_col=date_col, price_col=price_col)
+             for signal in ('BUY', 'SELL')]
+    return {
+        'calendar': calendar,
+        'horizons': horizons,
+        'pnl': {h: np.vstack([s[f'pnl_{h}'].to_numpy() for s in sides]) for h in horizons},
+        'mae': {h: np.vstack([s[f'mae_{h}'].to_numpy() for s in sides]) for h in horizons},
+    }
+
+
+def score_events(events, outcomes):
+    '''
+    이벤트 테이블 → 보유기간별 건수 / 평균 손익 / 적중률 / 평균 MAE (BUY·SELL 합산, 신호 방향 기준)
+    '''
+    calendar = outcomes['calendar']
+    pos = np.searchsorted(calendar, pd.to_datetime(events['date']).to_numpy(dtype=calendar.dtype), side='left')
+    is_sell = events['signal'].to_numpy() == 'SELL'
+    inside = pos < len(calendar)
+    pos, side = pos[inside], is_sell[inside].astype(int)
+
+    row = {'events': int(inside.sum()), 'buy_events': int((side == 0).sum()), 'sell_events': int(side.sum())}
+    for h in outcomes['horizons']:
+        pnl = outcomes['pnl'][h][side, pos]
+        valid = ~np.isnan(pnl)
+        pnl, mae = pnl[valid], outcomes['mae'][h][side, pos][valid]
+        row[f'count_{h}'] = int(valid.sum())
+        row[f'mean_pnl_{h}'] = pnl.mean() if len(pnl) else np.nan
+        row[f'hit_rate_{h}'] = (pnl > 0).mean() * 100 if len(pnl) else np.nan
+        row[f'mean_mae_{h}'] = mae.mean() if len(mae) else np.nan
+    return row
+
+
+# ── 워커 (초기화 때 원자료 / outcome_table 을 한 번 받아 전역에 보관) ──────────────
+_worker = {}
+
+
+def _init_worker(strategy, data, outcomes):
+    _worker.update(strategy=strategy, data=data, outcomes=outcomes)
+
+
+def _evaluate(params):
+    spec = SWEEP_STRATEGIES[_worker['strategy']]
+    events = spec['events'](_worker['data'], **{**spec['defaults'], **params})
+    return {**params, **score_events(events, _worker['outcomes'])}
+
+
+def rank_results(results, rank_by='mean_pnl_3M', min_events=5):
+    '''
+    rank_by 내림차순 순위 (해당 보유기간 이벤트가 min_events 미만인 점은 맨 뒤)
+    '''
+    horizon = rank_by.rsplit('_', 1)[-1]
+    count_col = f'count_{horizon}' if f'count_{horizon}' in results.columns else 'events'
+    eligible = results[count_col] >= min_events
+    ranked = pd.concat([
+        results[eligible].sort_values(rank_by, ascending=False, na_position='last', kind='stable'),
+        results[~eligible],
+    ])
+    ranked.insert(0, 'rank', np.arange(1, len(ranked) + 1))
+    return ranked.reset_index(drop=True)
+
+
+def run_sweep(strategy, data, prices, grid=None, horizons=None, workers=None,
+              rank_by='mean_pnl_3M', min_events=5, chunksize=None):
+    '''
+    파라미터 그리드 전체 평가 → 순위표
+
+    Parameters:
+        strategy (str): SWEEP_STRATEGIES 이름
+        data: 전략 원자료 (SWEEP_STRATEGIES[strategy]['data'] 결과, 워커에는 한 번만 전달)
+        prices (DataFrame): S&P500 일별 종가 (date, sp500_close)
+        grid (dict): 파라미터 → 후보 값 리스트 (없으면 기본 그리드, 빠진 파라미터는 기본값)
+        workers (int): 프로세스 수 (1 이면 현재 프로세스에서 순차 실행, 없으면 CPU 수)
+        rank_by (str): 순위 기준 컬럼 (예: mean_pnl_3M, hit_rate_6M)
+        min_events (int): 순위에 넣을 최소 이벤트 수
+    '''
+    if strategy not in SWEEP_STRATEGIES:
+        raise ValueError(f"알 수 없는 스윕 전략입니다: {strategy} (가능: {list(SWEEP_STRATEGIES)})")
+    spec = SWEEP_STRATEGIES[strategy]
+    grid = grid or spec['grid']
+    unknown = [k for k in grid if k not in spec['defaults']]
+    if unknown:
+        raise ValueError(f"{strategy} 에 없는 파라미터입니다: {unknown} (가능: {list(spec['defaults'])})")
+
+    points = expand_grid(grid)
+    outcomes = outcome_table(prices, horizons)
+    if rank_by not in {f'{m}_{h}' for m in ('mean_pnl', 'hit_rate', 'mean_mae', 'count') for h in outcomes['horizons']}:
+        raise ValueError(f"지원하지 않는 순위 기준입니다: {rank_by}")
+
+    started = time.perf_counter()
+    workers = workers or os.cpu_count() or 1
+    if workers == 1:
+        _init_worker(strategy, data, outcomes)
+        rows = [_evaluate(p) for p in points]
+    else:
+        chunksize = chunksize or max(1, len(points) // (workers * 8))
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                 initargs=(strategy, data, outcomes)) as executor:
+            rows = list(executor.map(_evaluate, points, chunksize=chunksize))
+    print(f"✅ {strategy} 스윕 완료 {len(points)}개 점 ({time.perf_counter() - started:.1f}s, workers={workers})")
+
+    return rank_results(pd.DataFrame(rows), rank_by=rank_by, min_events=min_events)
+
+
+if __name__ == "__main__":
+    from macro_crawling import MacroCrawler
+
+    name = sys.argv[1] if len(sys.argv) > 1 else 'm2_margin'
+    n_workers = int(sys.argv[2]) if len(sys.argv) > 2 else None
+    table = MacroCrawler().sweep_strategy(name, workers=n_workers)
+    print(table.head(20).to_string(index=False))
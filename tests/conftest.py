@@ -0,0 +1,5 @@
+import os
+import sys
+
+# 저장소 최상위 모듈(rolling_stats, derived ...) 을 그대로 import
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
@@ -0,0 +1,78 @@
+'''
+LEI + PMI + 기준금리 신호 읽기 경로 점검
+- 로컬 CSV 는 읽기만 (live 모드에서도 스크래핑 / CSV 갱신 없음)
+- lag_months 는 경고 후 무시
+'''
+import os
+
+import matplotlib
+import pytest
+
+pytest.importorskip("selenium")
+pytest.importorskip("streamlit")
+
+from data_provider import create_provider
+
+
+matplotlib.use("Agg")
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+
+
+@pytest.fixture
+def crawler(monkeypatch):
+    from macro_crawling import MacroCrawler
+
+    monkeypatch.chdir(REPO_ROOT)      # 스냅샷 CSV 는 저장소 최상위 상대 경로
+    crawler = MacroCrawler(provider=create_provider("offline"))
+
+    def no_update():
+        raise AssertionError("읽기 경로에서 CSV 갱신 호출")
+
+    # live 모드처럼 갱신 허용 상태에서도 updater 를 부르지 않아야 함
+    monkeypatch.setattr(crawler.provider, "updates_local_files", True, raising=False)
+    monkeypatch.setattr(crawler.lei_updater, "update_csv", no_update)
+    monkeypatch.setattr(crawler.pmi_updater, "update_csv", no_update)
+    with crawler.memo_scope():
+        yield crawler
+
+
+def test_signal_inputs_follow_csv_paths(crawler, tmp_path):
+    lei = crawler.read_lei_csv()
+    lei_path = tmp_path / "lei.csv"
+    lei.assign(LEI=lei["LEI"] + 50).to_csv(lei_path, index=False)
+
+    base = crawler.get_lei_pmi_fed_known_panel()
+    shifted = crawler.get_lei_pmi_fed_known_panel(lei_csv_path=str(lei_path))
+    known = base["LEI_used"].notna()
+    assert known.any()
+    assert (shifted.loc[known, "LEI_used"] == base.loc[known, "LEI_used"] + 50).all()
+    assert shifted["PMI_used"].equals(base["PMI_used"])
+
+
+def test_plot_and_today_signal_do_not_update_csv(crawler):
+    fig, signals = crawler.plot_sp500_with_lei_signals()
+    assert {"LEI_used", "PMI_used", "FEDFUNDS_6M_chg_used"} <= set(signals.columns)
+    assert "시그널" in crawler.decide_today_lei_signal_min()
+
+
+def test_lag_months_is_deprecated_noop(crawler):
+    _, expected = crawler.plot_sp500_with_lei_signals()
+    with pytest.warns(DeprecationWarning, match="lag_months"):
+        _, signals = crawler.plot_sp500_with_lei_signals(lag_months=2)
+    assert signals.equals(expected)
+    with pytest.warns(DeprecationWarning, match="lag_months"):
+        crawler.decide_today_lei_signal_min(lag_months=1)
+
+
+def test_backtest_events_do_not_plot(crawler, monkeypatch):
+    from backtest import SIGNAL_EVENTS
+
+    _, signals = crawler.plot_sp500_with_lei_signals()
+
+    def no_plot(*args, **kwargs):
+        raise AssertionError("백테스트 이벤트 계산에서 플롯 호출")
+
+    monkeypatch.setattr(crawler, "plot_sp500_with_lei_signals", no_plot)
+    events = SIGNAL_EVENTS["lei_pmi_fed"](crawler)
+    assert events["date"].tolist() == signals["주문일"].tolist()
+    assert (events["signal"] == "BUY").all()
@@ -0,0 +1,57 @@
+'''
+마진 부채 전략 (z-score 추세, YoY) = 파생 시리즈 DAG 이전 병합표 기준 계산
+- 저장소에 포함된 스냅샷(offline 모드)으로 계산
+'''
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+pytest.importorskip("selenium")
+pytest.importorskip("streamlit")
+
+from data_provider import create_provider
+
+
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+
+
+@pytest.fixture(scope="module")
+def crawler():
+    from macro_crawling import MacroCrawler
+
+    cwd = os.getcwd()
+    os.chdir(REPO_ROOT)      # 스냅샷 CSV 는 저장소 최상위 상대 경로
+    try:
+        crawler = MacroCrawler(provider=create_provider("offline"))
+        with crawler.memo_scope():
+            yield crawler
+    finally:
+        os.chdir(cwd)
+
+
+@pytest.fixture(scope="module")
+def merged(crawler):
+    return crawler.merge_m2_margin_sp500_abs().sort_values("date").reset_index(drop=True)
+
+
+def test_zscore_trend_matches_merged_window(crawler, merged):
+    ratio = merged["ratio"]
+    ratio_z = (ratio - ratio.rolling(window=36, min_periods=12).mean()) / \
+              ratio.rolling(window=36, min_periods=12).std()
+    change_pct = ratio.pct_change(fill_method=None) * 100
+    buy = (ratio_z < -1.2) & (change_pct > 0)
+    sell = (ratio_z > 1.5) & (change_pct < -5)
+
+    signals = crawler.generate_zscore_trend_signals()
+    expected = merged.loc[buy | sell, "date"]
+    assert signals["original_signal_date"].tolist() == expected.tolist()
+    assert (signals["signal"] == np.where(buy[buy | sell], "BUY", "SELL")).all()
+
+
+def test_mdyoy_matches_merged_pct_change(crawler, merged):
+    signals = crawler.generate_mdyoy_signals().sort_values("date").reset_index(drop=True)
+    expected = merged["margin_debt"].pct_change(periods=12, fill_method=None) * 100
+    pd.testing.assert_series_equal(signals["margin_yoy"], expected, check_names=False)
+    assert signals["margin_yoy"].iloc[:12].isna().all()
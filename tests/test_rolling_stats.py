@@ -0,0 +1,86 @@
+'''
+RollingStats / 저장된 상태 ↔ pandas rolling(window, min_periods) 결과 점검
+'''
+import numpy as np
+import pandas as pd
+import pytest
+
+from derived import DerivedGraph, _rolling_z
+from rolling_stats import RollingStats, RollingStatsStore
+
+
+WINDOW, MIN_PERIODS = 36, 12
+
+
+def _ratio(n=120, seed=0):
+    rng = np.random.default_rng(seed)
+    values = 0.02 + np.cumsum(rng.normal(0, 0.001, n))
+    values[[5, 40, 41, 90]] = np.nan          # 결측도 윈도우 자리는 차지
+    return pd.Series(values, index=pd.date_range("2010-01-01", periods=n, freq="MS", name="date"))
+
+
+def _expected(series):
+    rolling = series.rolling(window=WINDOW, min_periods=MIN_PERIODS)
+    return rolling.mean(), rolling.std()
+
+
+@pytest.mark.parametrize("min_periods", [1, MIN_PERIODS, WINDOW])
+def test_push_matches_pandas(min_periods):
+    series = _ratio()
+    rolling = series.rolling(window=WINDOW, min_periods=min_periods)
+
+    stats = RollingStats(WINDOW, min_periods)
+    online = [(stats.push(v, d).mean(), stats.std()) for d, v in series.items()]
+
+    np.testing.assert_allclose([m for m, _ in online], rolling.mean(), equal_nan=True)
+    np.testing.assert_allclose([s for _, s in online], rolling.std(), equal_nan=True)
+
+
+def test_saved_state_continues_like_pandas(tmp_path):
+    series = _ratio()
+    ma, sd = _expected(series)
+    store = RollingStatsStore(str(tmp_path / "rolling_stats.json"))
+
+    store.save({"z": RollingStats.from_series(series.iloc[:100], WINDOW, MIN_PERIODS)})
+    stats = store.load()["z"]
+    assert stats.last_date == series.index[99]
+    assert np.isclose(stats.mean(), ma.iloc[99]) and np.isclose(stats.std(), sd.iloc[99])
+
+    for date, value in series.iloc[100:].items():
+        stats.push(value, date)
+        assert np.isclose(stats.mean(), ma.loc[date]) and np.isclose(stats.std(), sd.loc[date])
+
+
+def test_graph_reuses_saved_state_in_new_process(tmp_path):
+    series = _ratio()
+    specs = {"z": {"inputs": ["ratio"], "transform": _rolling_z, "lookback": WINDOW - 1,
+                   "online": {"window": WINDOW, "min_periods": MIN_PERIODS}}}
+    state_path = str(tmp_path / "rolling_stats.json")
+
+    DerivedGraph(specs, state_path=state_path).set_input("ratio", series.iloc[:-3])
+
+    # 새 그래프(= 새 프로세스) : 저장된 마지막 날짜 이후 3행만 online 으로 추가
+    graph = DerivedGraph(specs, state_path=state_path)
+    graph.set_input("ratio", series)
+    assert graph.last_run["z"] == "online"
+    np.testing.assert_allclose(graph.get("z"), _rolling_z(series), equal_nan=True)
+
+    saved = RollingStatsStore(state_path).load()["z"]
+    ma, sd = _expected(series)
+    assert saved.last_date == series.index[-1]
+    assert np.isclose(saved.mean(), ma.iloc[-1]) and np.isclose(saved.std(), sd.iloc[-1])
+
+
+def test_graph_refits_when_history_was_revised(tmp_path):
+    series = _ratio()
+    specs = {"z": {"inputs": ["ratio"], "transform": _rolling_z, "lookback": WINDOW - 1,
+                   "online": {"window": WINDOW, "min_periods": MIN_PERIODS}}}
+    state_path = str(tmp_path / "rolling_stats.json")
+    DerivedGraph(specs, state_path=state_path).set_input("ratio", series.iloc[:-3])
+
+    revised = series.copy()
+    revised.iloc[-10] *= 1.01
+    graph = DerivedGraph(specs, state_path=state_path)
+    graph.set_input("ratio", revised)
+    assert graph.last_run["z"] == "full"
+    np.testing.assert_allclose(graph.get("z"), _rolling_z(revised), equal_nan=True)
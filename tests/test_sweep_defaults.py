@@ -0,0 +1,50 @@
+'''
+스윕 기본 파라미터 이벤트 = 백테스트 이벤트 (backtest.SIGNAL_EVENTS 와 이름이 같은 전략)
+- 저장소에 포함된 스냅샷(offline 모드)으로 계산
+'''
+import os
+
+import pandas as pd
+import pytest
+
+pytest.importorskip("selenium")
+pytest.importorskip("streamlit")
+
+from backtest import SIGNAL_EVENTS
+from data_provider import create_provider
+from sweep import SWEEP_STRATEGIES
+
+
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+SHARED = sorted(set(SWEEP_STRATEGIES) & set(SIGNAL_EVENTS))
+
+
+@pytest.fixture(scope="module")
+def crawler():
+    from macro_crawling import MacroCrawler
+
+    cwd = os.getcwd()
+    os.chdir(REPO_ROOT)      # 스냅샷 CSV 는 저장소 최상위 상대 경로
+    try:
+        crawler = MacroCrawler(provider=create_provider("offline"))
+        with crawler.memo_scope():
+            yield crawler
+    finally:
+        os.chdir(cwd)
+
+
+def _normalized(events):
+    events = events[["date", "signal"]].assign(date=pd.to_datetime(events["date"]))
+    return events.sort_values(["date", "signal"], kind="stable").reset_index(drop=True)
+
+
+def test_shared_strategies_exist():
+    assert {"m2_margin", "lei_pmi_fed", "put_call_ratio", "vix_bands"} <= set(SHARED)
+
+
+@pytest.mark.parametrize("name", SHARED)
+def test_sweep_defaults_match_backtest_events(crawler, name):
+    spec = SWEEP_STRATEGIES[name]
+    swept = spec["events"](spec["data"](crawler), **spec["defaults"])
+    expected = SIGNAL_EVENTS[name](crawler)
+    pd.testing.assert_frame_equal(_normalized(swept), _normalized(expected), check_dtype=False)
@@ -0,0 +1,58 @@
+'''
+일일 데이터 업데이트 일괄 실행 스크립트 (GitHub Actions update-data.yml 에서 호출)
+- 모든 업데이트기를 한 프로세스에서 실행 → Selenium 업데이트기들이 브라우저 1개를 공유
+'''
+import sys
+import time
+
+from md_updater import MarginDebtUpdater
+from ism_pmi_updater import ISMPMIUpdater
+from SNP_forward_pe_updater import forwardpe_updater
+from putcall_ratio_updater import PutCallRatioUpdater
+from bullbear_spread_updater import BullBearSpreadUpdater
+from lei_updater import LEIUpdater
+from webdriver_pool import get_pool
+from page_fetcher import summarize_fetch_log
+
+
+# (이름, 실행 함수) - 하나가 실패해도 나머지는 계속 진행
+UPDATE_JOBS = [
+    ("Margin Debt", lambda: MarginDebtUpdater().update_csv()),
+    ("ISM PMI", lambda: ISMPMIUpdater().update_csv()),
+    ("Forward PE", lambda: forwardpe_updater().update_forward_pe_csv()),
+    ("Put/Call Ratio", lambda: PutCallRatioUpdater().update_csv()),
+    ("Bull-Bear Spread", lambda: BullBearSpreadUpdater().update_csv()),
+    ("LEI", lambda: LEIUpdater().update_csv()),
+]
+
+
+def run_all():
+    failed = []
+    started = time.perf_counter()
+
+    for name, job in UPDATE_JOBS:
+        print(f"\n▶ {name} 업데이트 시작")
+        job_started = time.perf_counter()
+        try:
+            job()
+            print(f"✅ {name} 완료 ({time.perf_counter() - job_started:.1f}s)")
+        except Exception as e:
+            failed.append(name)
+            print(f"📛 {name} 업데이트 실패: {e}")
+
+    pool = get_pool()
+    pool.close()
+    print(f"\n⏱️ 전체 {time.perf_counter() - started:.1f}s / 브라우저 실행 {pool.launches}회")
+    if failed:
+        print(f"⚠️ 실패한 업데이트: {', '.join(failed)}")
+
+    # 페이지별 조회 경로(http / browser) 누적 통계
+    summary = summarize_fetch_log()
+    if not summary.empty:
+        print("\n📊 스크래핑 조회 경로 통계")
+        print(summary.round(2).to_string(index=False))
+    return failed
+
+
+if __name__ == "__main__":
+    sys.exit(1 if run_all() else 0)
@@ -0,0 +1,186 @@
+'''
+신호 전략 워크포워드 평가
+- 학습 구간(train_months)에서 파라미터 그리드 중 최고 점을 고르고, 바로 다음 검증 구간(test_months)에는
+  그 파라미터의 신호만 사용 → 구간을 step_months 씩 밀면서 반복 → 검증 구간 신호를 이어 붙여 백테스트
+- 학습 구간 성과는 보유기간이 학습 구간 안에서 끝난 이벤트만 사용 (검증 구간 가격을 보지 않음)
+- 그리드 점마다 이벤트(롤링 z-score 등 인과적 지표)는 전체 이력에서 한 번만 계산하고,
+  모든 폴드의 학습 성과는 누적합 + searchsorted 로 한 번에 집계 (워커 = 그리드 점 묶음 × 전체 폴드)
+- 거래일 달력 / 보유기간 성과는 sweep.outcome_table 과 같음
+
+실행: python walkforward.py m2_margin [train_months] [test_months]
+'''
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from backtest import run_backtest
+from sweep import SWEEP_STRATEGIES, expand_grid, outcome_table
+
+
+def make_folds(calendar, train_months=60, test_months=1, step_months=None, anchored=False):
+    '''
+    거래일 달력 → 폴드 (월 경계 기준)
+
+    Parameters:
+        anchored (bool): True 면 학습 구간 시작을 달력 처음으로 고정 (확장 윈도우)
+
+    Returns:
+        DataFrame: fold, train_start, test_start, test_end (날짜, test_end 미포함)
+                   + 각 날짜의 달력 위치 (*_pos)
+    '''
+    calendar = pd.DatetimeIndex(calendar)
+    step_months = step_months or test_months
+    first = calendar[0].to_period('M').to_timestamp()
+    last = calendar[-1]
+
+    rows = []
+    test_start = first + pd.DateOffset(months=train_months)
+    while test_start <= last:
+        train_start = first if anchored else test_start - pd.DateOffset(months=train_months)
+        rows.append((train_start, test_start, test_start + pd.DateOffset(months=test_months)))
+        test_start += pd.DateOffset(months=step_months)
+
+    folds = pd.DataFrame(rows, columns=['train_start', 'test_start', 'test_end'])
+    folds.insert(0, 'fold', np.arange(len(folds)))
+    for col in ('train_start', 'test_start', 'test_end'):
+        folds[f'{col}_pos'] = calendar.searchsorted(folds[col].to_numpy(dtype=calendar.values.dtype))
+    return folds
+
+
+def score_folds(pos, pnl, folds, horizon_days, metric='mean_pnl'):
+    '''
+    이벤트 (달력 위치 오름차순, 보유기간 손익) → 폴드별 학습 구간 (점수, 건수)
+    - 학습 이벤트: train_start ≤ 진입 < test_start - horizon_days (청산까지 학습 구간 안)
+    '''
+    valid = ~np.isnan(pnl)
+    value = np.where(valid, pnl > 0, False) * 100.0 if metric == 'hit_rate' else np.where(valid, pnl, 0.0)
+    total = np.concatenate([[0.0], np.cumsum(value)])
+    count = np.concatenate([[0], np.cumsum(valid)])
+
+    lo = np.searchsorted(pos, folds['train_start_pos'].to_numpy(), side='left')
+    hi = np.searchsorted(pos, folds['test_start_pos'].to_numpy() - horizon_days, side='left')
+    hi = np.maximum(hi, lo)
+    n = count[hi] - count[lo]
+    with np.errstate(invalid='ignore', divide='ignore'):
+        score = (total[hi] - total[lo]) / n
+    return score, n
+
+
+# ── 워커 (초기화 때 원자료 / outcome_table / 폴드를 한 번 받아 전역에 보관) ────────
+_worker = {}
+
+
+def _init_worker(strategy, data, outcomes, folds, horizon, metric):
+    _worker.update(strategy=strategy, data=data, outcomes=outcomes, folds=folds, horizon=horizon, metric=metric)
+
+
+def _evaluate(params):
+    spec = SWEEP_STRATEGIES[_worker['strategy']]
+    outcomes = _worker['outcomes']
+    calendar = outcomes['calendar']
+
+    events = spec['events'](_worker['data'], **{**spec['defaults'], **params})
+    pos = np.searchsorted(calendar, pd.to_datetime(events['date']).to_numpy(dtype=calendar.dtype), side='left')
+    side = (events['signal'].to_numpy() == 'SELL').astype(int)
+    inside = pos < len(calendar)
+    pos, side = pos[inside], side[inside]
+    order = np.argsort(pos, kind='stable')
+    pos, side = pos[order], side[order]
+
+    horizon = _worker['horizon']
+    pnl = outcomes['pnl'][horizon][side, pos]
+    score, count = score_folds(pos, pnl, _worker['folds'], outcomes['horizons'][horizon], _worker['metric'])
+    return score, count, pos, side
+
+
+def walk_forward(strategy, data, prices, grid=None, train_months=60, test_months=1, step_months=None,
+                 anchored=False, rank_by='mean_pnl_3M', min_events=5, horizons=None, workers=None, chunksize=None):
+    '''
+    전략 하나 워크포워드 → {'folds': 폴드별 선택 파라미터, 'trades': 검증 구간 이벤트 성과, 'summary': 요약}
+
+    Parameters:
+        strategy (str): SWEEP_STRATEGIES 이름
+        data: 전략 원자료 (워커에는 한 번만 전달)
+        prices (DataFrame): S&P500 일별 종가 (date, sp500_close)
+        grid (dict): 파라미터 → 후보 값 리스트 (없으면 기본 그리드)
+        train_months, test_months, step_months (int): 학습 / 검증 / 이동 간격 (개월)
+        rank_by (str): 학습 구간 선택 기준 (mean_pnl_<h> 또는 hit_rate_<h>)
+        min_events (int): 학습 구간 최소 이벤트 수 (만족하는 점이 없으면 그 폴드는 신호 없음)
+        workers (int): 프로세스 수 (1 이면 현재 프로세스에서 순차 실행, 없으면 CPU 수)
+    '''
+    if strategy not in SWEEP_STRATEGIES:
+        raise ValueError(f"알 수 없는 스윕 전략입니다: {strategy} (가능: {list(SWEEP_STRATEGIES)})")
+    spec = SWEEP_STRATEGIES[strategy]
+    grid = grid or spec['grid']
+    unknown = [k for k in grid if k not in spec['defaults']]
+    if unknown:
+        raise ValueError(f"{strategy} 에 없는 파라미터입니다: {unknown} (가능: {list(spec['defaults'])})")
+
+    metric, _, horizon = rank_by.rpartition('_')
+    outcomes = outcome_table(prices, horizons)
+    if metric not in ('mean_pnl', 'hit_rate') or horizon not in outcomes['horizons']:
+        raise ValueError(f"지원하지 않는 선택 기준입니다: {rank_by} (mean_pnl_<h> / hit_rate_<h>)")
+
+    points = expand_grid(grid)
+    folds = make_folds(outcomes['calendar'], train_months, test_months, step_months, anchored)
+
+    started = time.perf_counter()
+    workers = workers or os.cpu_count() or 1
+    initargs = (strategy, data, outcomes, folds, horizon, metric)
+    if workers == 1:
+        _init_worker(*initargs)
+        results = [_evaluate(p) for p in points]
+    else:
+        chunksize = chunksize or max(1, len(points) // (workers * 8))
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=initargs) as executor:
+            results = list(executor.map(_evaluate, points, chunksize=chunksize))
+
+    # 폴드별 최고 점 (건수 미달은 제외, 동점이면 그리드 앞쪽)
+    scores = np.vstack([r[0] for r in results])           # 그리드 점 × 폴드
+    counts = np.vstack([r[1] for r in results])
+    scores = np.where((counts >= min_events) & ~np.isnan(scores), scores, -np.inf)
+    best = scores.argmax(axis=0)
+    has_best = np.isfinite(scores[best, np.arange(len(folds))])
+
+    # 검증 구간 신호 이어 붙이기
+    calendar = outcomes['calendar']
+    frames = []
+    for fold in folds.itertuples():
+        if not has_best[fold.fold]:
+            continue
+        _, _, pos, side = results[best[fold.fold]]
+        keep = (pos >= fold.test_start_pos) & (pos < fold.test_end_pos)
+        frames.append(pd.DataFrame({
+            'date': calendar[pos[keep]],
+            'signal': np.where(side[keep] == 1, 'SELL', 'BUY'),
+            'fold': fold.fold,
+        }))
+    events = pd.concat(frames, ignore_index=True) if frames else pd.DataFrame(columns=['date', 'signal', 'fold'])
+
+    chosen = pd.DataFrame([points[i] if ok else {} for i, ok in zip(best, has_best)], index=folds.index)
+    folds = folds.drop(columns=[c for c in folds.columns if c.endswith('_pos')])
+    folds = pd.concat([folds, chosen], axis=1)
+    folds[f'train_{rank_by}'] = np.where(has_best, scores[best, np.arange(len(best))], np.nan)
+    folds['train_events'] = np.where(has_best, counts[best, np.arange(len(best))], 0)
+    folds['oos_events'] = events.groupby('fold').size().reindex(folds['fold'], fill_value=0).to_numpy()
+    print(f"✅ {strategy} 워크포워드 완료 {len(points)}개 점 × {len(folds)}개 폴드 "
+          f"({time.perf_counter() - started:.1f}s, workers={workers})")
+
+    result = run_backtest(events, prices, horizons=horizons)
+    result['folds'] = folds
+    return result
+
+
+if __name__ == "__main__":
+    from macro_crawling import MacroCrawler
+
+    name = sys.argv[1] if len(sys.argv) > 1 else 'm2_margin'
+    train = int(sys.argv[2]) if len(sys.argv) > 2 else 60
+    test = int(sys.argv[3]) if len(sys.argv) > 3 else 1
+    out = MacroCrawler().walk_forward_signals([name], train_months=train, test_months=test)
+    print(out['folds'].dropna(subset=['train_mean_pnl_3M']).tail(12).to_string(index=False))
+    print(out['summary'].to_string(index=False))
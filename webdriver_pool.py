@@ -0,0 +1,180 @@
+import atexit
+import os
+import threading
+from contextlib import contextmanager
+
+from selenium import webdriver
+from selenium.common.exceptions import TimeoutException, WebDriverException
+from selenium.webdriver.chrome.options import Options
+from selenium.webdriver.chrome.service import Service
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support import expected_conditions as EC
+from webdriver_manager.chrome import ChromeDriverManager
+
+
+DEFAULT_USER_AGENT = (
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+    "(KHTML, like Gecko) Chrome/124.0.0.0 Safari/537.36"
+)
+
+# 브라우저 하나로 처리할 최대 페이지 수 (넘으면 새 브라우저로 교체 → 메모리 누수 방지)
+MAX_PAGES_PER_BROWSER = 20
+
+# lean 프로필에서 차단할 리소스 (CDP Network.setBlockedURLs 패턴)
+# - 이미지 / 폰트 / 스타일시트 / 외부 분석·광고 스크립트는 값 추출에 필요 없음
+BLOCKED_URL_PATTERNS = [
+    "*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.svg", "*.ico",
+    "*.woff", "*.woff2", "*.ttf", "*.otf", "*.eot",
+    "*.css",
+    "*google-analytics.com*", "*googletagmanager.com*", "*doubleclick.net*",
+    "*googlesyndication.com*", "*facebook.net*", "*hotjar.com*", "*segment.io*",
+    "*scorecardresearch.com*", "*quantserve.com*",
+]
+
+# lean 프로필 Chrome prefs (2 = 차단)
+LEAN_CONTENT_PREFS = {
+    "profile.managed_default_content_settings.images": 2,
+    "profile.managed_default_content_settings.stylesheets": 2,
+    "profile.managed_default_content_settings.fonts": 2,
+    "profile.managed_default_content_settings.notifications": 2,
+}
+
+
+class WebDriverPool:
+    '''
+    headless Chrome 공유 풀 (브라우저 1개를 여러 페이지/업데이트기에서 재사용)
+    - 드라이버 설치(ChromeDriverManager)는 프로세스당 1회
+    - max_pages 페이지마다, 또는 WebDriverException(크래시) 발생 시 브라우저 재시작 (TimeoutException 제외)
+    - 페이지 단위로 잠금 → 여러 스레드에서 호출해도 한 번에 한 페이지씩 처리
+    - lean=True (기본) : pageLoadStrategy=eager + 이미지/폰트/CSS/분석 스크립트 차단
+    '''
+
+    def __init__(self, max_pages=MAX_PAGES_PER_BROWSER, headless=True, user_agent=DEFAULT_USER_AGENT, lean=True):
+        self.max_pages = max_pages
+        self.headless = headless
+        self.user_agent = user_agent
+        self.lean = lean
+        self._driver = None
+        self._pages = 0
+        self._driver_path = None
+        self._lock = threading.RLock()
+        self.launches = 0
+
+    def _service(self):
+        '''
+        chromedriver 경로 결정 (1회만 수행)
+        - CHROMEDRIVER_BIN 환경변수(Docker) → webdriver-manager 설치 → Selenium Manager 순
+        '''
+        if self._driver_path is None:
+            path = os.environ.get("CHROMEDRIVER_BIN")
+            if not path:
+                try:
+                    path = ChromeDriverManager().install()
+                except Exception as e:
+                    print(f"⚠️ ChromeDriverManager 설치 실패 → Selenium Manager 사용 : {e}")
+                    path = ""
+            self._driver_path = path
+        return Service(self._driver_path) if self._driver_path else Service()
+
+    def _options(self):
+        options = Options()
+        if self.headless:
+            options.add_argument("--headless=new")
+        options.add_argument("--disable-gpu")
+        options.add_argument("--no-sandbox")
+        options.add_argument("--disable-dev-shm-usage")
+        options.add_argument(f"user-agent={self.user_agent}")
+        if os.environ.get("CHROME_BIN"):
+            options.binary_location = os.environ["CHROME_BIN"]
+        if self.lean:
+            # DOMContentLoaded 시점에 get() 반환 (이미지/광고 로딩 완료까지 기다리지 않음)
+            options.page_load_strategy = "eager"
+            options.add_experimental_option("prefs", LEAN_CONTENT_PREFS)
+            options.add_argument("--blink-settings=imagesEnabled=false")
+        return options
+
+    def _launch(self):
+        self._driver = webdriver.Chrome(service=self._service(), options=self._options())
+        self._pages = 0
+        self.launches += 1
+        if self.lean:
+            try:
+                self._driver.execute_cdp_cmd("Network.enable", {})
+                self._driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": BLOCKED_URL_PATTERNS})
+            except Exception as e:
+                print(f"⚠️ CDP 리소스 차단 설정 실패 (prefs 차단만 적용) : {e}")
+
+    def recycle(self):
+        '''
+        현재 브라우저 종료 (다음 페이지 요청 때 새로 실행)
+        '''
+        with self._lock:
+            if self._driver is not None:
+                try:
+                    self._driver.quit()
+                except Exception:
+                    pass
+            self._driver = None
+            self._pages = 0
+
+    @contextmanager
+    def page(self, url):
+        '''
+        url 을 연 드라이버를 빌려줌 (with 블록 동안 다른 호출은 대기)
+
+        사용 예:
+            with get_pool().page(url) as driver:
+                soup = BeautifulSoup(driver.page_source, 'html.parser')
+        '''
+        with self._lock:
+            if self._driver is None or self._pages >= self.max_pages:
+                self.recycle()
+                self._launch()
+
+            try:
+                self._driver.get(url)
+            except WebDriverException:
+                # 브라우저가 죽었으면 한 번만 새로 띄워 재시도
+                print("⚠️ 브라우저 오류 → 재시작 후 재시도")
+                self.recycle()
+                self._launch()
+                self._driver.get(url)
+
+            self._pages += 1
+            try:
+                yield self._driver
+            except TimeoutException:
+                # 요소 대기 시간 초과는 페이지 문제 → 브라우저는 그대로 재사용
+                raise
+            except WebDriverException:
+                self.recycle()
+                raise
+
+    def fetch(self, url, wait_for=None, timeout=30):
+        '''
+        url 의 렌더링된 HTML 반환
+        wait_for : (By.CSS_SELECTOR, "...") 처럼 나타날 때까지 기다릴 요소 (없으면 바로 반환)
+        '''
+        with self.page(url) as driver:
+            if wait_for is not None:
+                WebDriverWait(driver, timeout).until(EC.presence_of_element_located(wait_for))
+            return driver.page_source
+
+    def close(self):
+        self.recycle()
+
+
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def get_pool():
+    '''
+    프로세스 공용 WebDriverPool (종료 시 자동으로 브라우저 정리)
+    '''
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = WebDriverPool()
+            atexit.register(_pool.close)
+        return _pool